@@ -0,0 +1,15 @@
+import django
+from django.conf import settings
+
+
+def setup():
+    if not settings.configured:
+        settings.configure(
+            INSTALLED_APPS=["django_actionable_messages"],
+            LANGUAGE_CODE="en",
+            TEMPLATES=[{
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "APP_DIRS": True
+            }]
+        )
+        django.setup()
@@ -0,0 +1,32 @@
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import (
+    Column, ColumnSet, Container, Fact, FactSet, Table, TableCell, TableRow
+)
+from django_actionable_messages.adaptive_card.elements import Image, TextBlock
+from django_actionable_messages.adaptive_card.utils import SCHEMA, FontWeight, SpacingStyle, Width
+
+
+def large_adaptive_card(rows=500):
+    card = AdaptiveCard(version="1.5", schema=SCHEMA)
+    card.add_elements([
+        TextBlock("Daily digest", weight=FontWeight.BOLDER, wrap=True),
+        FactSet([Fact(f"Fact {i}", f"Value {i}") for i in range(rows)]),
+        Table(
+            columns=[{"width": 1}, {"width": 2}, {"width": 1}],
+            rows=[
+                TableRow([
+                    TableCell([TextBlock(f"Row {i}")]),
+                    TableCell([TextBlock(f"Description of row {i}", wrap=True)]),
+                    TableCell([TextBlock(str(i * 3.5))])
+                ]) for i in range(rows)
+            ],
+            first_row_as_header=True
+        ),
+        Container([
+            ColumnSet([
+                Column([Image(f"https://www.example.com/{i}.png")], width=Width.AUTO),
+                Column([TextBlock(f"Item {i}", spacing=SpacingStyle.NONE)], width=Width.STRETCH)
+            ]) for i in range(rows)
+        ])
+    ])
+    return card
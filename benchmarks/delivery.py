@@ -0,0 +1,44 @@
+"""
+Posting cards to local fake webhook: new connection per card, pooled keep-alive connections and pipelining
+
+    python -m benchmarks.delivery
+"""
+import asyncio
+import time
+
+from benchmarks import setup
+
+
+def main(count=2000):
+    setup()
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.elements import TextBlock
+    from django_actionable_messages.delivery import WebhookClient
+    from django_actionable_messages.testing import FakeWebhookServer
+
+    cards = []
+    for i in range(count):
+        card = AdaptiveCard(version="1.0")
+        card.add_elements(TextBlock(f"Hello user {i}"))
+        cards.append(card)
+
+    async def run(label, server, **kwargs):
+        async with WebhookClient(**kwargs) as client:
+            start = time.perf_counter()
+            await client.send_many((server.url, card) for card in cards)
+            elapsed = time.perf_counter() - start
+        print(f"{label}: {count / elapsed:8.0f} cards/s, {server.connections:5} connections")
+        server.connections = 0
+
+    async def bench():
+        async with FakeWebhookServer(keep_alive=False) as server:
+            await run("  connection per card", server, max_connections=10)
+        async with FakeWebhookServer() as server:
+            await run("     pooled (10 conn)", server, max_connections=10)
+            await run("pipelined (2 conn x 8)", server, max_connections=2, pipeline=8)
+
+    asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    main()
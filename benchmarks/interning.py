@@ -0,0 +1,54 @@
+"""
+Batch of digest cards with repeated leaf elements (facts, text runs, choices), with and without interning
+
+    python -m benchmarks.interning
+"""
+import contextlib
+import gc
+import timeit
+import tracemalloc
+
+from benchmarks import setup
+
+
+def build_cards(count, rows):
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.containers import Fact, FactSet
+    from django_actionable_messages.adaptive_card.elements import RichTextBlock, TextRun
+    from django_actionable_messages.adaptive_card.inputs import ChoiceSetInput, InputChoice
+    from django_actionable_messages.adaptive_card.utils import FontWeight
+
+    statuses = ("Open", "In progress", "Blocked", "Done")
+    cards = []
+    for _ in range(count):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([
+            FactSet([Fact("Status", statuses[i % 4]) for i in range(rows)]),
+            RichTextBlock([TextRun(statuses[i % 4], weight=FontWeight.BOLDER) for i in range(rows)]),
+            ChoiceSetInput([InputChoice(status, str(i)) for i, status in enumerate(statuses)], item_id="status")
+        ])
+        cards.append(card)
+    return cards
+
+
+def main(count=50, rows=200):
+    setup()
+    from django_actionable_messages.adaptive_card.mixins import interning
+
+    build_cards(1, 1)
+    for interned in (False, True):
+        gc.collect()
+        tracemalloc.start()
+        with interning() if interned else contextlib.nullcontext():
+            cards = build_cards(count, rows)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        first, second = cards[0].frozen_payload, cards[1].frozen_payload
+        elapsed = timeit.timeit(lambda: first == second, number=100) / 100
+        label = "interned" if interned else "  copies"
+        print(f"{label}: {memory / 1024:8.1f} KiB, payload equality {elapsed * 1e6:7.1f} us")
+        del cards, first, second
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Memory used by a card with 10k elements (5k Facts and 5k TextRuns)
+
+    python -m benchmarks.memory
+"""
+import gc
+import tracemalloc
+
+from benchmarks import setup
+
+
+def build_card(count):
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.containers import Fact, FactSet
+    from django_actionable_messages.adaptive_card.elements import RichTextBlock, TextRun
+
+    facts = [Fact(f"Title {i}", f"Value {i}") for i in range(count // 2)]
+    text_runs = [TextRun(f"Text {i}") for i in range(count // 2)]
+    card = AdaptiveCard(version="1.5")
+    card.add_elements([FactSet(facts), RichTextBlock(text_runs)])
+    # keep elements alive, like builders holding references to them
+    return card, facts, text_runs
+
+
+def main(count=10000):
+    setup()
+    build_card(10)
+    gc.collect()
+    tracemalloc.start()
+    result = build_card(count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{count} elements: {current / 1024:.0f} KiB (peak {peak / 1024:.0f} KiB), "
+          f"{current / count:.0f} bytes per element")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Rendering cards to json with render_many (single process) and render_parallel (cards or specs, chunk sizes)
+
+    python -m benchmarks.parallel [processes]
+"""
+import os
+import sys
+import time
+
+from benchmarks import setup
+
+
+def make_card(i):
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.containers import Fact, FactSet
+    from django_actionable_messages.adaptive_card.elements import TextBlock
+
+    card = AdaptiveCard(version="1.5")
+    card.add_elements([TextBlock(f"Digest {i}"), FactSet([Fact(f"Fact {j}", "value" * 10) for j in range(20)])])
+    return card
+
+
+def main(count=20000, processes=None):
+    setup()
+    from django_actionable_messages.mixins import render_many
+    from django_actionable_messages.parallel import render_parallel
+
+    processes = processes or os.cpu_count()
+
+    def run(label, function):
+        # rendered payloads are cached in cards, so each run gets new ones
+        cards = [make_card(i) for i in range(count)]
+        start = time.perf_counter()
+        for _ in function(cards):
+            pass
+        print(f"{label}: {count / (time.perf_counter() - start):8.0f} cards/s")
+
+    print(f"{processes} processes")
+    run("                          render_many", lambda cards: render_many(cards, fmt="json"))
+    for chunk_size in (10, 100, 500):
+        run(f"    render_parallel cards (chunk {chunk_size:3})",
+            lambda cards: render_parallel(cards, fmt="json", processes=processes, chunk_size=chunk_size))
+    run("    render_parallel specs (chunk 100)",
+        lambda cards: render_parallel(range(count), fmt="json", processes=processes, factory=make_card))
+    run("render_parallel unordered (chunk 100)",
+        lambda cards: render_parallel(cards, fmt="json", processes=processes, ordered=False))
+
+
+if __name__ == "__main__":
+    main(processes=int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,33 @@
+"""
+Rebuilding a large AdaptiveCard for each recipient vs rendering CardTemplate
+
+    python -m benchmarks.placeholders
+"""
+import timeit
+
+from benchmarks import setup
+
+
+def main(number=20):
+    setup()
+    from benchmarks.cards import large_adaptive_card
+    from django_actionable_messages.adaptive_card.actions import Execute
+    from django_actionable_messages.adaptive_card.elements import TextBlock
+    from django_actionable_messages.placeholders import CardTemplate, Placeholder
+
+    def build(name, amount, data):
+        card = large_adaptive_card()
+        card.add_elements(TextBlock(f"Hello {name}, your balance is {amount}"))
+        card.add_actions(Execute(data=data))
+        return card
+
+    values = {"name": "Jane", "amount": 12.5, "data": {"user_id": 1}}
+    template = CardTemplate(build(Placeholder("name"), Placeholder("amount"), Placeholder("data")))
+    rebuild = timeit.timeit(lambda: build(**values).json_payload, number=number) / number
+    render = timeit.timeit(lambda: template.render(values), number=number) / number
+    print(f" rebuild: {rebuild * 1000:8.2f} ms per card")
+    print(f"template: {render * 1000:8.2f} ms per card")
+
+
+if __name__ == "__main__":
+    main()
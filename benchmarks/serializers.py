@@ -0,0 +1,28 @@
+"""
+Compare JSON backends on a large AdaptiveCard
+
+    python -m benchmarks.serializers
+"""
+import timeit
+
+from benchmarks import setup
+
+
+def main(number=20):
+    setup()
+    from benchmarks.cards import large_adaptive_card
+    from django_actionable_messages.serializers import BACKENDS, STDLIB_BACKEND, get_backend
+
+    card = large_adaptive_card()
+    for name in (STDLIB_BACKEND, *BACKENDS):
+        if name != STDLIB_BACKEND and get_backend(name) is None:
+            print(f"{name:>8}: not installed")
+            continue
+        card.json_backend = name
+        size = len(card._get_json_payload(card._payload))
+        seconds = timeit.timeit(lambda: card._get_json_payload(card._payload), number=number) / number
+        print(f"{name:>8}: {seconds * 1000:8.2f} ms per card ({size} characters)")
+
+
+if __name__ == "__main__":
+    main()
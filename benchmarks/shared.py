@@ -0,0 +1,57 @@
+"""
+Card with a repeated fragment (logo/footer/action row): building it for each occurrence vs shared element
+
+    python -m benchmarks.shared
+"""
+import gc
+import timeit
+import tracemalloc
+
+from benchmarks import setup
+
+
+def main(count=500, number=20):
+    setup()
+    from django_actionable_messages.adaptive_card.actions import OpenUrl, Submit
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.containers import ActionSet, Column, ColumnSet, Container
+    from django_actionable_messages.adaptive_card.elements import Image, TextBlock
+    from django_actionable_messages.adaptive_card.utils import Width
+
+    def footer():
+        return Container([
+            ColumnSet([
+                Column([Image("https://www.example.com/logo.png")], width=Width.AUTO),
+                Column([TextBlock("Example Inc., 1 Example Street", wrap=True, is_subtle=True)])
+            ]),
+            ActionSet([OpenUrl("https://www.example.com/", title="Open"), Submit(title="Dismiss")])
+        ])
+
+    def build(shared):
+        card = AdaptiveCard(version="1.5")
+        fragment = footer().share() if shared else None
+        card.add_elements([
+            element
+            for i in range(count)
+            for element in (TextBlock(f"Item {i}"), fragment or footer())
+        ])
+        return card
+
+    for shared in (False, True):
+        gc.collect()
+        tracemalloc.start()
+        card = build(shared)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        card.json_payload
+
+        def render():
+            card.mark_changed()
+            return card.json_payload
+        elapsed = timeit.timeit(render, number=number) / number
+        label = "shared" if shared else "copies"
+        print(f"{label}: {elapsed * 1000:7.2f} ms json, {memory / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Signing cards one by one (key parsed for each card vs loaded once) and with sign_many in a process pool
+
+    python -m benchmarks.signing
+"""
+import os
+import time
+
+from benchmarks import setup
+
+
+def main(count=1000):
+    setup()
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.elements import TextBlock
+    from django_actionable_messages.signing import load_private_key, sign_many
+
+    pem = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    cards = []
+    for i in range(count):
+        card = AdaptiveCard(version="1.0")
+        card.add_elements(TextBlock(f"Hello user {i}"))
+        card.signing_key, card.signing_sender, card.signing_originator = pem, "bot@example.com", "originator"
+        card.signing_recipients = [f"user{i}@example.com"]
+        cards.append(card)
+
+    def run(label, function, number=count):
+        start = time.perf_counter()
+        function()
+        print(f"{label}: {(time.perf_counter() - start) * 1000 / number:8.3f} ms per card")
+
+    def parse_each_time():
+        for card in cards[:20]:
+            load_private_key.cache_clear()
+            card.get_signed_payload()
+
+    run("     key parsed per card", parse_each_time, 20)
+    run("        key loaded once", lambda: [card.get_signed_payload() for card in cards])
+    run(f"sign_many ({os.cpu_count()} processes)", lambda: list(sign_many(cards)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Appending Table rows until the card reaches size limit, checking json_payload vs estimated_size after each row
+
+    python -m benchmarks.sizes
+"""
+import timeit
+
+from benchmarks import setup
+
+
+def main(max_size=28 * 1024):
+    setup()
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.containers import Table, TableCell, TableRow
+    from django_actionable_messages.adaptive_card.elements import TextBlock
+
+    def fill(get_size):
+        table = Table(columns=[{"width": 1}, {"width": 2}])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([TextBlock("Report"), table])
+        rows = 0
+        while get_size(card) < max_size:
+            table.add_rows(TableRow([TableCell([TextBlock(f"Row {rows}")]), TableCell([TextBlock("Description")])]))
+            rows += 1
+        return rows
+
+    payload = timeit.timeit(lambda: fill(lambda card: len(card.json_payload)), number=3) / 3
+    estimated = timeit.timeit(lambda: fill(lambda card: card.estimated_size), number=3) / 3
+    print(f"rows: {fill(lambda card: card.estimated_size)}")
+    print(f"   json_payload: {payload * 1000:8.2f} ms per card")
+    print(f" estimated_size: {estimated * 1000:8.2f} ms per card")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Agenda card with repeated rows: building elements in Python vs expanding Adaptive Cards template
+
+    python -m benchmarks.templating
+"""
+import timeit
+
+from benchmarks import setup
+
+
+def main(rows=5000, number=5):
+    setup()
+    from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+    from django_actionable_messages.adaptive_card.containers import Column, ColumnSet
+    from django_actionable_messages.adaptive_card.elements import Image, TextBlock
+    from django_actionable_messages.adaptive_card.templating import bind, clear_templates, expand
+    from django_actionable_messages.adaptive_card.utils import SpacingStyle, Width
+
+    data = {
+        "title": "Agenda",
+        "meetings": [
+            {"location": f"Room {i}", "start": "8a", "end": "12:30p", "icon": f"https://www.example.com/{i}.png"}
+            for i in range(rows)
+        ]
+    }
+
+    def row(icon, location, start, end):
+        return ColumnSet([
+            Column([Image(icon)], width=Width.AUTO),
+            Column([
+                TextBlock(f"**{location}**"),
+                TextBlock(f"{start} - {end}", spacing=SpacingStyle.NONE)
+            ], width=Width.AUTO)
+        ])
+
+    def build():
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(TextBlock(data["title"]))
+        card.add_elements([
+            row(meeting["icon"], meeting["location"], meeting["start"], meeting["end"])
+            for meeting in data["meetings"]
+        ])
+        return card.payload
+
+    template = AdaptiveCard(version="1.5")
+    template.add_elements([
+        TextBlock("${title}"),
+        bind(row("${icon}", "${location}", "${start}", "${end}"), data="${meetings}")
+    ])
+    assert expand(template, data) == build()
+
+    elements = timeit.timeit(build, number=number) / number
+    clear_templates()
+    first = timeit.timeit(lambda: expand(template, data), number=1)
+    cached = timeit.timeit(lambda: expand(template, data), number=number) / number
+    print(f"        elements: {elements * 1000:8.2f} ms")
+    print(f"template (first): {first * 1000:8.2f} ms")
+    print(f"template        : {cached * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
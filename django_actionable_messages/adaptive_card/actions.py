@@ -7,6 +7,7 @@ from django_actionable_messages.mixins import CardElement
 
 
 class OpenUrl(ActionMixin):
+    __slots__ = ()
     action_type = "Action.OpenUrl"
 
     def __init__(self, url: str, **kwargs) -> None:
@@ -15,6 +16,7 @@ class OpenUrl(ActionMixin):
 
 
 class Submit(ActionMixin):
+    __slots__ = ()
     action_type = "Action.Submit"
 
     def __init__(self, data: Union[str, dict] = None, **kwargs) -> None:
@@ -27,6 +29,7 @@ class Submit(ActionMixin):
 
 
 class ShowCard(ActionMixin):
+    __slots__ = ()
     action_type = "Action.ShowCard"
 
     def __init__(self, card=None, **kwargs) -> None:
@@ -39,6 +42,8 @@ class ShowCard(ActionMixin):
 
 
 class TargetElement(CardElement):
+    __slots__ = ()
+
     def __init__(self, element_id: str, is_visible: bool = None, **kwargs) -> None:
         self._data = {
             "elementId": element_id
@@ -52,6 +57,7 @@ class TargetElement(CardElement):
 
 
 class ToggleVisibility(ActionMixin):
+    __slots__ = ()
     action_type = "Action.ToggleVisibility"
 
     def __init__(self, target_elements: List[Union[TargetElement, str]] = None, **kwargs) -> None:
@@ -63,7 +69,7 @@ class ToggleVisibility(ActionMixin):
         self._data["targetElements"] = []
         for element in elements:
             if isinstance(element, TargetElement):
-                self._data["targetElements"].append(element.as_data())
+                self._data["targetElements"].append(self._get_item(element))
             elif isinstance(element, str):
                 self._data["targetElements"].append(element)
             else:
@@ -71,6 +77,7 @@ class ToggleVisibility(ActionMixin):
 
 
 class Execute(CardElement):
+    __slots__ = ()
     action_type = "Action.Execute"
 
     def __init__(self, verb: str = None, data: Union[str, object] = None, associated_inputs: AssociatedInputs = None,
@@ -126,7 +133,7 @@ class Execute(CardElement):
         if isinstance(fallback, FallbackOption):
             self._data["fallback"] = fallback
         elif isinstance(fallback, BaseElementMixin):
-            self._data["fallback"] = fallback.as_data()
+            self._data["fallback"] = self._get_item(fallback)
         else:
             raise CardException("Invalid fallback type")
 
@@ -2,13 +2,16 @@ from typing import Union
 
 from django_actionable_messages.adaptive_card.elements import Image
 from django_actionable_messages.adaptive_card.types import Metadata
-from django_actionable_messages.adaptive_card.utils import VERSIONS, Style, VerticalAlignment
+from django_actionable_messages.adaptive_card.utils import COMPACT_DEFAULTS, VERSIONS, Style, VerticalAlignment
 from django_actionable_messages.exceptions import CardException
-from django_actionable_messages.mixins import ADAPTIVE_CARD, Card
+from django_actionable_messages.splitting import pack
+from django_actionable_messages.mixins import ADAPTIVE_CARD, Card, get_item_data
 
 
 class AdaptiveCard(Card):
     card_type = ADAPTIVE_CARD
+    compact_defaults = COMPACT_DEFAULTS
+    split_key = "body"
 
     def __init__(self, version: str = None, schema: str = None, refresh=None, authentication=None,
                  inputs: list = None, actions: list = None, select_action=None, style: Style = None,
@@ -63,13 +66,13 @@ class AdaptiveCard(Card):
         self._payload["$schema"] = schema
 
     def set_refresh(self, refresh) -> None:
-        self._payload["refresh"] = refresh.as_data()
+        self._payload["refresh"] = self._get_item(refresh)
 
     def set_authentication(self, authentication) -> None:
-        self._payload["authentication"] = authentication.as_data()
+        self._payload["authentication"] = self._get_item(authentication)
 
     def set_select_action(self, action) -> None:
-        self._payload["selectAction"] = action.as_data()
+        self._payload["selectAction"] = self._get_item(action)
 
     def set_style(self, style: Style) -> None:
         self._payload["style"] = style
@@ -82,14 +85,14 @@ class AdaptiveCard(Card):
 
     def set_background_image(self, image: Union[str, Image]) -> None:
         if isinstance(image, Image):
-            self._payload["backgroundImage"] = image.as_data()
+            self._payload["backgroundImage"] = self._get_item(image)
         elif isinstance(image, str):
             self._payload["backgroundImage"] = image
         else:
             raise CardException("Invalid image type")
 
     def set_metadata(self, metadata: Metadata) -> None:
-        self._payload["metadata"] = metadata.as_data()
+        self._payload["metadata"] = self._get_item(metadata)
 
     def set_min_height(self, height: str) -> None:
         self._payload["minHeight"] = height
@@ -111,11 +114,24 @@ class AdaptiveCard(Card):
         if isinstance(elements, (list, set, tuple)):
             self._payload["body"].extend(self._get_items_list(elements))
         else:
-            self._payload["body"].append(elements.as_data())
+            self._payload["body"].append(self._get_item(elements))
 
     def add_actions(self, actions):
         self._payload.setdefault("actions", [])
         if isinstance(actions, (list, set, tuple)):
             self._payload["actions"].extend(self._get_items_list(actions))
         else:
-            self._payload["actions"].append(actions.as_data())
+            self._payload["actions"].append(self._get_item(actions))
+
+    def get_fallback_text(self):
+        return self._payload.get("fallbackText", "")
+
+    def split_item(self, sizer, item, max_size):
+        # tables are split along rows, header row is repeated in each part
+        data = get_item_data(item)
+        rows = data.get("rows", []) if data.get("type") == "Table" else []
+        header = rows[:1] if data.get("firstRowAsHeader", True) else []
+        if len(rows) - len(header) < 2:
+            return None
+        base_size = sizer.measure_container(data, "rows")
+        return [dict(data, rows=rows) for rows in pack(sizer, base_size, rows[len(header):], max_size, header)]
@@ -1,7 +1,7 @@
 from typing import Union, List
 
 from django_actionable_messages.adaptive_card.actions import OpenUrl, Submit, ToggleVisibility, Execute
-from django_actionable_messages.adaptive_card.mixins import ElementMixin
+from django_actionable_messages.adaptive_card.mixins import ElementMixin, LeafElementMixin
 from django_actionable_messages.adaptive_card.types import BackgroundImage
 from django_actionable_messages.adaptive_card.utils import (
     FallbackOption, Style, HorizontalAlignment, VerticalAlignment, SpacingStyle, ImageSize, Width
@@ -11,6 +11,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class ActionSet(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, actions: list, **kwargs) -> None:
         self._data = {
             "type": "ActionSet",
@@ -22,10 +24,12 @@ class ActionSet(ElementMixin):
         if isinstance(actions, (list, set, tuple)):
             self._data["actions"].extend(self._get_items_list(actions))
         else:
-            self._data["actions"].append(actions.as_data())
+            self._data["actions"].append(self._get_item(actions))
 
 
 class Container(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, items: list, select_action=None, style: Style = None,
                  vertical_content_alignment: VerticalAlignment = None, bleed: bool = None,
                  background_image: Union[str, BackgroundImage] = None, min_height: str = None,
@@ -54,10 +58,10 @@ class Container(ElementMixin):
         if isinstance(items, (list, set, tuple)):
             self._data["items"].extend(self._get_items_list(items))
         else:
-            self._data["items"].append(items.as_data())
+            self._data["items"].append(self._get_item(items))
 
     def set_select_action(self, action) -> None:
-        self._data["selectAction"] = action.as_data()
+        self._data["selectAction"] = self._get_item(action)
 
     def set_style(self, style: Style) -> None:
         self._data["style"] = style
@@ -72,7 +76,7 @@ class Container(ElementMixin):
         if isinstance(image, str):
             self._data["backgroundImage"] = image
         elif isinstance(image, BackgroundImage):
-            self._data["backgroundImage"] = image.as_data()
+            self._data["backgroundImage"] = self._get_item(image)
         else:
             raise CardException("Invalid image type")
 
@@ -84,6 +88,8 @@ class Container(ElementMixin):
 
 
 class Column(CardElement):
+    __slots__ = ()
+
     def __init__(self, items: list = None, background_image: Union[str, BackgroundImage] = None, bleed: bool = None,
                  fallback=None, min_height: str = None, rtl: bool = None, separator: bool = None,
                  spacing: SpacingStyle = None, select_action=None, style: Style = None,
@@ -129,13 +135,13 @@ class Column(CardElement):
         if isinstance(items, (list, set, tuple)):
             self._data["items"].extend(self._get_items_list(items))
         else:
-            self._data["items"].append(items.as_data())
+            self._data["items"].append(self._get_item(items))
 
     def set_background_image(self, image: Union[str, BackgroundImage]) -> None:
         if isinstance(image, str):
             self._data["backgroundImage"] = image
         elif isinstance(image, BackgroundImage):
-            self._data["backgroundImage"] = image.as_data()
+            self._data["backgroundImage"] = self._get_item(image)
         else:
             raise CardException("Invalid image type")
 
@@ -146,7 +152,7 @@ class Column(CardElement):
         if isinstance(fallback, FallbackOption):
             self._data["fallback"] = fallback
         elif isinstance(fallback, Column):
-            self._data["fallback"] = fallback.as_data()
+            self._data["fallback"] = self._get_item(fallback)
         else:
             raise CardException("Invalid fallback type")
 
@@ -163,7 +169,7 @@ class Column(CardElement):
         self._data["spacing"] = spacing
 
     def set_select_action(self, action) -> None:
-        self._data["selectAction"] = action.as_data()
+        self._data["selectAction"] = self._get_item(action)
 
     def set_style(self, style: Style) -> None:
         self._data["style"] = style
@@ -190,6 +196,8 @@ class Column(CardElement):
 
 
 class ColumnSet(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, columns: list = None, select_action=None, style: Style = None, bleed: bool = None,
                  min_height: str = None, **kwargs) -> None:
         self._data = {
@@ -212,10 +220,10 @@ class ColumnSet(ElementMixin):
         if isinstance(columns, (list, set, tuple)):
             self._data["columns"].extend(self._get_items_list(columns))
         else:
-            self._data["columns"].append(columns.as_data())
+            self._data["columns"].append(self._get_item(columns))
 
     def set_select_action(self, action) -> None:
-        self._data["selectAction"] = action.as_data()
+        self._data["selectAction"] = self._get_item(action)
 
     def set_style(self, style: Style) -> None:
         self._data["style"] = style
@@ -227,7 +235,9 @@ class ColumnSet(ElementMixin):
         self._data["minHeight"] = value
 
 
-class Fact(CardElement):
+class Fact(LeafElementMixin):
+    __slots__ = ()
+
     def __init__(self, title, value, **kwargs) -> None:
         self._data = {}
         super().__init__(**kwargs)
@@ -238,6 +248,8 @@ class Fact(CardElement):
 
 
 class FactSet(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, facts: List[Fact], **kwargs) -> None:
         self._data = {
             "type": "FactSet",
@@ -249,10 +261,12 @@ class FactSet(ElementMixin):
         if isinstance(facts, (list, set, tuple)):
             self._data["facts"].extend(self._get_items_list(facts))
         else:
-            self._data["facts"].append(facts.as_data())
+            self._data["facts"].append(self._get_item(facts))
 
 
 class ImageSet(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, images: list, image_size: ImageSize = None, **kwargs) -> None:
         self._data = {
             "type": "ImageSet",
@@ -266,13 +280,15 @@ class ImageSet(ElementMixin):
         if isinstance(images, (list, set, tuple)):
             self._data["images"].extend(self._get_items_list(images))
         else:
-            self._data["images"].append(images.as_data())
+            self._data["images"].append(self._get_item(images))
 
     def set_image_size(self, size: ImageSize) -> None:
         self._data["imageSize"] = size
 
 
 class TableCell(CardElement):
+    __slots__ = ()
+
     def __init__(self, items, select_action: Union[Execute, OpenUrl, Submit, ToggleVisibility] = None,
                  style: Style = None, vertical_content_alignment: VerticalAlignment = None, bleed: bool = None,
                  background_image: Union[BackgroundImage, str] = None, min_height: str = None, rtl: bool = None,
@@ -302,10 +318,10 @@ class TableCell(CardElement):
         if isinstance(items, (list, set, tuple)):
             self._data["items"].extend(self._get_items_list(items))
         else:
-            self._data["items"].append(items.as_data())
+            self._data["items"].append(self._get_item(items))
 
     def set_select_action(self, action: Union[Execute, OpenUrl, Submit, ToggleVisibility]) -> None:
-        self._data["selectAction"] = action.as_data()
+        self._data["selectAction"] = self._get_item(action)
 
     def set_style(self, style: Style) -> None:
         self._data["style"] = style
@@ -320,7 +336,7 @@ class TableCell(CardElement):
         if isinstance(image, str):
             self._data["backgroundImage"] = image
         elif isinstance(image, BackgroundImage):
-            self._data["backgroundImage"] = image.as_data()
+            self._data["backgroundImage"] = self._get_item(image)
         else:
             raise CardException("Invalid image type")
 
@@ -332,6 +348,8 @@ class TableCell(CardElement):
 
 
 class TableRow(CardElement):
+    __slots__ = ()
+
     def __init__(self, cells: Union[TableCell, List[TableCell]], **kwargs) -> None:
         self._data = {
             "type": "TableRow"
@@ -344,10 +362,12 @@ class TableRow(CardElement):
         if isinstance(cells, (list, set, tuple)):
             self._data["cells"].extend(self._get_items_list(cells))
         else:
-            self._data["cells"].append(cells.as_data())
+            self._data["cells"].append(self._get_item(cells))
 
 
 class Table(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, columns: Union[dict, List[dict]] = None, rows: Union[TableRow, List[TableRow]] = None,
                  horizontal_cell_content_alignment: HorizontalAlignment = None,
                  vertical_cell_content_alignment: VerticalAlignment = None,
@@ -384,7 +404,7 @@ class Table(ElementMixin):
         if isinstance(rows, (list, set, tuple)):
             self._data["rows"].extend(self._get_items_list(rows))
         else:
-            self._data["rows"].append(rows.as_data())
+            self._data["rows"].append(self._get_item(rows))
 
     def set_horizontal_cell_content_alignment(self, alignment: HorizontalAlignment) -> None:
         self._data["horizontalCellContentAlignment"] = alignment
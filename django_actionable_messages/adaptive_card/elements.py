@@ -1,6 +1,6 @@
 from typing import Union, List
 
-from django_actionable_messages.adaptive_card.mixins import BaseElementMixin, ElementMixin
+from django_actionable_messages.adaptive_card.mixins import BaseElementMixin, ElementMixin, LeafElementMixin
 from django_actionable_messages.adaptive_card.utils import (
     HorizontalAlignment, Color, FontType, FontSize, FontWeight, BlockElementHeight, ImageSize, ImageStyle
 )
@@ -9,6 +9,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class TextBlock(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, text: str, color: Color = None, font_type: FontType = None,
                  horizontal_alignment: HorizontalAlignment = None, is_subtle: bool = None, max_lines: int = None,
                  size: FontSize = None, weight: FontWeight = None, wrap: bool = None, **kwargs) -> None:
@@ -60,6 +62,8 @@ class TextBlock(ElementMixin):
 
 
 class Image(BaseElementMixin):
+    __slots__ = ()
+
     def __init__(self, url: str, alternate_text: str = None, background_color: str = None,
                  height: Union[str, BlockElementHeight] = None, horizontal_alignment: HorizontalAlignment = None,
                  select_action=None, size: ImageSize = None, style: ImageStyle = None, width: str = None,
@@ -107,7 +111,7 @@ class Image(BaseElementMixin):
         self._data["horizontalAlignment"] = alignment
 
     def set_select_action(self, action) -> None:
-        self._data["selectAction"] = action.as_data()
+        self._data["selectAction"] = self._get_item(action)
 
     def set_size(self, size: ImageSize) -> None:
         self._data["size"] = size
@@ -120,6 +124,8 @@ class Image(BaseElementMixin):
 
 
 class MediaSource(CardElement):
+    __slots__ = ()
+
     def __init__(self, mime_type: str, url: str, **kwargs) -> None:
         self._data = {
             "mimeType": mime_type,
@@ -129,6 +135,8 @@ class MediaSource(CardElement):
 
 
 class CaptionSource(CardElement):
+    __slots__ = ()
+
     def __init__(self, mime_type: str, url: str, label: str, **kwargs) -> None:
         self._data = {
             "mimeType": mime_type,
@@ -139,6 +147,8 @@ class CaptionSource(CardElement):
 
 
 class Media(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, sources: List[MediaSource], poster: str = None, alternate_text: str = None,
                  caption_sources: List[CaptionSource] = None, **kwargs) -> None:
         self._data = {
@@ -157,7 +167,7 @@ class Media(ElementMixin):
         self._data["sources"].extend(self._get_items_list(sources))
 
     def add_source(self, source: MediaSource) -> None:
-        self._data["sources"].append(source.as_data())
+        self._data["sources"].append(self._get_item(source))
 
     def set_poster(self, poster: str) -> None:
         self._data["poster"] = poster
@@ -174,10 +184,12 @@ class Media(ElementMixin):
 
     def add_caption_source(self, caption_source: CaptionSource) -> None:
         self._data.setdefault("captionSources", [])
-        self._data["captionSources"].append(caption_source.as_data())
+        self._data["captionSources"].append(self._get_item(caption_source))
+
 
+class TextRun(LeafElementMixin):
+    __slots__ = ()
 
-class TextRun(CardElement):
     def __init__(self, text: str, color: Color = None, font_type: FontType = None, highlight: bool = None,
                  is_subtle: bool = None, italic: bool = None, select_action=None, size: FontSize = None,
                  strike_through: bool = None, weight: FontWeight = None, **kwargs) -> None:
@@ -221,7 +233,7 @@ class TextRun(CardElement):
         self._data["italic"] = value
 
     def set_select_action(self, action) -> None:
-        self._data["selectAction"] = action.as_data()
+        self._data["selectAction"] = self._get_item(action)
 
     def set_size(self, size: FontSize) -> None:
         self._data["size"] = size
@@ -234,6 +246,8 @@ class TextRun(CardElement):
 
 
 class RichTextBlock(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, inlines: List[Union[TextRun, str]], horizontal_alignment: HorizontalAlignment = None,
                  **kwargs) -> None:
         self._data = {
@@ -242,7 +256,7 @@ class RichTextBlock(ElementMixin):
         }
         for item in inlines:
             if isinstance(item, TextRun):
-                self._data["inlines"].append(item.as_data())
+                self._data["inlines"].append(self._get_item(item))
             elif isinstance(item, str):
                 self._data["inlines"].append(item)
             else:
@@ -1,11 +1,13 @@
 from typing import List, Union
 
-from django_actionable_messages.adaptive_card.mixins import InputMixin, DateTimeMixin
+from django_actionable_messages.adaptive_card.mixins import InputMixin, DateTimeMixin, LeafElementMixin
 from django_actionable_messages.adaptive_card.utils import ChoiceInputStyle, TextInputStyle
 from django_actionable_messages.mixins import CardElement
 
 
 class TextInput(InputMixin):
+    __slots__ = ()
+
     def __init__(self, is_multiline: bool = None, max_length: int = None, placeholder: str = None,
                  style: TextInputStyle = None, inline_action=None, value: str = None, **kwargs) -> None:
         self._data = {
@@ -38,13 +40,15 @@ class TextInput(InputMixin):
         self._data["style"] = style
 
     def set_inline_action(self, action) -> None:
-        self._data["inlineAction"] = action.as_data()
+        self._data["inlineAction"] = self._get_item(action)
 
     def set_value(self, value: str) -> None:
         self._data["value"] = value
 
 
 class NumberInput(InputMixin):
+    __slots__ = ()
+
     def __init__(self, max_value: int = None, min_value: int = None, placeholder: str = None, value: int = None,
                  **kwargs) -> None:
         self._data = {
@@ -74,14 +78,18 @@ class NumberInput(InputMixin):
 
 
 class DateInput(DateTimeMixin):
+    __slots__ = ()
     base_type = "Input.Date"
 
 
 class TimeInput(DateTimeMixin):
+    __slots__ = ()
     base_type = "Input.Time"
 
 
 class ToggleInput(InputMixin):
+    __slots__ = ()
+
     def __init__(self, title: str, value: str = None, value_off: str = None, value_on: str = None, wrap: bool = None,
                  **kwargs) -> None:
         self._data = {
@@ -111,7 +119,9 @@ class ToggleInput(InputMixin):
         self._data["wrap"] = value
 
 
-class InputChoice(CardElement):
+class InputChoice(LeafElementMixin):
+    __slots__ = ()
+
     def __init__(self, title: str, value: Union[str, int], **kwargs) -> None:
         self._data = {
             "title": title,
@@ -121,6 +131,8 @@ class InputChoice(CardElement):
 
 
 class ChoiceSetInput(InputMixin):
+    __slots__ = ()
+
     def __init__(self, choices: List[InputChoice], is_multi_select: bool = None, style: ChoiceInputStyle = None,
                  value: str = None, wrap: bool = None, **kwargs) -> None:
         self._data = {
@@ -151,6 +163,8 @@ class ChoiceSetInput(InputMixin):
 
 
 class DataQuery(CardElement):
+    __slots__ = ()
+
     def __init__(self, dataset: str, count: int = None, skip: int = None, **kwargs) -> None:
         self._data = {
             "dataset": dataset
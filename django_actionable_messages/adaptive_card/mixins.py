@@ -1,11 +1,83 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.utils.functional import Promise
+
 from django_actionable_messages.adaptive_card.utils import (
     FallbackOption, BlockElementHeight, SpacingStyle, ActionStyle, ActionMode
 )
 from django_actionable_messages.exceptions import CardException
 from django_actionable_messages.mixins import CardElement
+from django_actionable_messages.shared import share_data
+
+_interning_pool = ContextVar("interning_pool", default=None)
+
+
+def get_intern_key(value):
+    """
+    Hashable key of element data, scalars are compared by type and value, other objects by identity
+    """
+    if isinstance(value, dict):
+        return dict, tuple((key, get_intern_key(item)) for key, item in value.items())
+    elif isinstance(value, list):
+        return list, tuple(get_intern_key(item) for item in value)
+    elif hasattr(value, "as_data"):
+        return get_intern_key(value.as_data())
+    elif value is None or isinstance(value, (str, int, float)) and not isinstance(value, Promise):
+        return value.__class__, value
+    return value.__class__, id(value)
+
+
+class InterningPool:
+    def __init__(self) -> None:
+        self._items = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def intern(self, data):
+        key = get_intern_key(data)
+        try:
+            return self._items[key]
+        except KeyError:
+            # read-only copy keeps objects compared by identity alive
+            interned = self._items[key] = share_data(data)
+            return interned
+
+
+@contextmanager
+def interning():
+    """
+    Identical leaf elements (TextRun, Fact, InputChoice) added to other elements inside of this block
+    share one read-only dict. Nested blocks use the outermost pool.
+    """
+    pool = _interning_pool.get()
+    if pool is not None:
+        yield pool
+        return
+    pool = InterningPool()
+    token = _interning_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _interning_pool.reset(token)
+
+
+class LeafElementMixin(CardElement):
+    __slots__ = ()
+
+    def as_item(self):
+        pool = _interning_pool.get()
+        if pool is None or self.is_shared:
+            return super().as_item()
+        # element keeps the interned snapshot, so later changes raise CardException instead of being lost
+        self._data = pool.intern(self._data)
+        return self._data
 
 
 class BaseElementMixin(CardElement):
+    __slots__ = ()
+
     def __init__(self, fallback=None, separator: bool = None, spacing: SpacingStyle = None, item_id: str = None,
                  is_visible: bool = None, requires: dict = None, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -26,7 +98,7 @@ class BaseElementMixin(CardElement):
         if isinstance(fallback, FallbackOption):
             self._data["fallback"] = fallback
         elif isinstance(fallback, BaseElementMixin):
-            self._data["fallback"] = fallback.as_data()
+            self._data["fallback"] = self._get_item(fallback)
         else:
             raise CardException("Invalid fallback type")
 
@@ -47,6 +119,8 @@ class BaseElementMixin(CardElement):
 
 
 class ElementMixin(BaseElementMixin):
+    __slots__ = ()
+
     def __init__(self, height: BlockElementHeight = None, **kwargs) -> None:
         super().__init__(**kwargs)
         if height is not None:
@@ -57,6 +131,8 @@ class ElementMixin(BaseElementMixin):
 
 
 class InputMixin(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, label: str = None, **kwargs) -> None:
         super().__init__(**kwargs)
         if label is not None:
@@ -70,6 +146,7 @@ class InputMixin(ElementMixin):
 
 
 class DateTimeMixin(InputMixin):
+    __slots__ = ()
     base_type = None
 
     def __init__(self, max_value: str = None, min_value: str = None, placeholder: str = None, value: str = None,
@@ -101,6 +178,7 @@ class DateTimeMixin(InputMixin):
 
 
 class ActionMixin(CardElement):
+    __slots__ = ()
     action_type = ""
 
     def __init__(self, title: str = None, icon_url: str = None, style: ActionStyle = None, fallback=None,
@@ -140,7 +218,7 @@ class ActionMixin(CardElement):
         if isinstance(fallback, FallbackOption):
             self._data["fallback"] = fallback
         elif isinstance(fallback, ActionMixin):
-            self._data["fallback"] = fallback.as_data()
+            self._data["fallback"] = self._get_item(fallback)
         else:
             raise CardException("Invalid fallback type")
 
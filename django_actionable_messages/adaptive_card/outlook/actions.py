@@ -5,6 +5,8 @@ METHODS = ("GET", "POST")
 
 
 class ActionHttp(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, method: str, url: str, title: str = None, headers: list = None, body=None, **kwargs) -> None:
         if method not in METHODS:
             raise CardException(f"Invalid method. Available methods are: {METHODS}")
@@ -31,13 +33,15 @@ class ActionHttp(ElementMixin):
         if isinstance(headers, (list, set, tuple)):
             self._data["headers"].extend(self._get_items_list(headers))
         else:
-            self._data["headers"].append(headers.as_data())
+            self._data["headers"].append(self._get_item(headers))
 
     def set_body(self, body) -> None:
         self._data["body"] = body
 
 
 class InvokeAddInCommand(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, add_in_id: str, desktop_command_id: str, initialization_context, title: str = None,
                  **kwargs) -> None:
         self._data = {
@@ -55,14 +59,18 @@ class InvokeAddInCommand(ElementMixin):
 
 
 class DisplayMessageForm(DisplayFormMixin):
+    __slots__ = ()
     base_type = "Action.DisplayMessageForm"
 
 
 class DisplayAppointmentForm(DisplayFormMixin):
+    __slots__ = ()
     base_type = "Action.DisplayAppointmentForm"
 
 
 class ToggleVisibility(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, target_elements, title: str = None, **kwargs) -> None:
         self._data = {
             "type": "Action.ToggleVisibility"
@@ -80,4 +88,4 @@ class ToggleVisibility(ElementMixin):
         if isinstance(elements, (list, set, tuple)):
             self._data["targetElements"].extend(self._get_items_list(elements))
         else:
-            self._data["targetElements"].append(elements.as_data())
+            self._data["targetElements"].append(self._get_item(elements))
@@ -3,6 +3,8 @@ from django_actionable_messages.adaptive_card.utils import HorizontalAlignment,
 
 
 class ActionSet(ElementMixin):
+    __slots__ = ()
+
     def __init__(self, item_id: str = None, spacing: SpacingStyle = None, separator: bool = None,
                  horizontal_alignment: HorizontalAlignment = None, actions=None, **kwargs) -> None:
         self._data = {
@@ -37,4 +39,4 @@ class ActionSet(ElementMixin):
         if isinstance(actions, (list, set, tuple)):
             self._data["actions"].extend(self._get_items_list(actions))
         else:
-            self._data["actions"].append(actions.as_data())
+            self._data["actions"].append(self._get_item(actions))
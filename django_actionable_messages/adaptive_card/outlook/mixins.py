@@ -2,6 +2,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class ElementMixin(CardElement):
+    __slots__ = ()
+
     def __init__(self, is_visible: bool = None, **kwargs) -> None:
         super().__init__(**kwargs)
         if is_visible is not None:
@@ -12,6 +14,7 @@ class ElementMixin(CardElement):
 
 
 class DisplayFormMixin(ElementMixin):
+    __slots__ = ()
     base_type = ""
 
     def __init__(self, title: str = None, item_id=None, **kwargs) -> None:
@@ -0,0 +1,600 @@
+"""
+Server-side expansion of Adaptive Cards templates ($data, $when and ${expression} bindings)
+https://learn.microsoft.com/en-us/adaptive-cards/templating/language
+"""
+import functools
+import hashlib
+import json
+import operator
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_actionable_messages.encoders import BaseEncoder
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.mixins import Card
+from django_actionable_messages.sizes import update_size
+
+DATA_KEY = "$data"
+WHEN_KEY = "$when"
+CACHE_SIZE = 128
+EXPRESSIONS_CACHE_SIZE = 1024
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+(?:\.\d+)?)
+        |(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+        |(?P<name>\$?[A-Za-z_][A-Za-z0-9_]*)
+        |(?P<op>&&|\|\||==|!=|<=|>=|[-+*/%<>!&.,()\[\]])
+    )
+""", re.VERBOSE)
+ESCAPE_RE = re.compile(r"\\(.)")
+
+
+class Undefined:
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "UNDEFINED"
+
+
+# missing property, unresolved bindings are left as they are in the template
+UNDEFINED = Undefined()
+# object removed by $when (or $data without data)
+DROP = object()
+
+
+class Scope:
+    __slots__ = ("data", "root", "host", "index")
+
+    def __init__(self, data, root, host=None, index=None) -> None:
+        self.data = data
+        self.root = root
+        self.host = host
+        self.index = index
+
+
+def to_string(value) -> str:
+    if value is None or value is UNDEFINED:
+        return ""
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    elif isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder, separators=(",", ":"), ensure_ascii=False)
+    return str(value)
+
+
+def is_true(value) -> bool:
+    return value is not UNDEFINED and bool(value)
+
+
+def get_member(obj, key):
+    if isinstance(obj, Mapping):
+        return obj.get(key, UNDEFINED)
+    elif isinstance(obj, (list, tuple)):
+        if isinstance(key, int) and not isinstance(key, bool) and -len(obj) <= key < len(obj):
+            return obj[key]
+        return UNDEFINED
+    elif obj is None or obj is UNDEFINED or isinstance(obj, (str, int, float)):
+        return UNDEFINED
+    elif isinstance(key, str) and not key.startswith("_"):
+        return getattr(obj, key, UNDEFINED)
+    return UNDEFINED
+
+
+def _defined(value):
+    return None if value is UNDEFINED else value
+
+
+def _number(value):
+    if isinstance(value, str):
+        return float(value) if "." in value else int(value)
+    return value
+
+
+def _add(left, right):
+    if isinstance(left, str) or isinstance(right, str):
+        return to_string(left) + to_string(right)
+    return left + right
+
+
+def _divide(left, right):
+    if isinstance(left, int) and isinstance(right, int):
+        return int(left / right)
+    return left / right
+
+
+def _length(value):
+    return len(value) if isinstance(value, (str, list, tuple, Mapping)) else 0
+
+
+def _format_number(value, precision=None):
+    if precision is None:
+        return f"{_number(value):,}"
+    return f"{_number(value):,.{int(precision)}f}"
+
+
+def _substring(value, start, length=None):
+    value = to_string(value)
+    return value[start:] if length is None else value[start:start + length]
+
+
+BINARY_OPERATORS = {
+    "*": operator.mul,
+    "/": _divide,
+    "%": operator.mod,
+    "+": _add,
+    "-": operator.sub,
+    "&": lambda left, right: to_string(left) + to_string(right),
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne
+}
+
+BINDING_POWERS = {
+    "||": 1,
+    "&&": 2,
+    "==": 3, "!=": 3,
+    "<": 4, "<=": 4, ">": 4, ">=": 4,
+    "+": 5, "-": 5, "&": 5,
+    "*": 6, "/": 6, "%": 6,
+    ".": 8, "[": 8
+}
+UNARY_POWER = 7
+
+FUNCTIONS = {
+    "not": lambda value: not is_true(value),
+    "equals": lambda left, right: left == right,
+    "empty": lambda value: value is None or _length(value) == 0 and not isinstance(value, (int, float)),
+    "exists": lambda value: value is not None,
+    "length": _length,
+    "count": _length,
+    "concat": lambda *values: "".join(to_string(value) for value in values),
+    "toUpper": lambda value: to_string(value).upper(),
+    "toLower": lambda value: to_string(value).lower(),
+    "trim": lambda value: to_string(value).strip(),
+    "substring": _substring,
+    "replace": lambda value, old, new: to_string(value).replace(old, new),
+    "contains": lambda container, value: value in container if container is not None else False,
+    "startsWith": lambda value, prefix: to_string(value).startswith(prefix),
+    "endsWith": lambda value, suffix: to_string(value).endswith(suffix),
+    "indexOf": lambda value, search: to_string(value).find(search),
+    "split": lambda value, separator: to_string(value).split(separator),
+    "join": lambda values, separator: separator.join(to_string(value) for value in values),
+    "first": lambda values: values[0] if values else None,
+    "last": lambda values: values[-1] if values else None,
+    "string": to_string,
+    "int": lambda value: int(_number(value)),
+    "float": lambda value: float(value),
+    "bool": is_true,
+    "json": lambda value: json.loads(value),
+    "add": _add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "div": _divide,
+    "mod": operator.mod,
+    "max": lambda *values: max(values[0] if len(values) == 1 else values),
+    "min": lambda *values: min(values[0] if len(values) == 1 else values),
+    "round": lambda value, digits=0: round(_number(value), digits),
+    "formatNumber": _format_number
+}
+# arguments are evaluated on demand
+LAZY_FUNCTIONS = ("if", "and", "or", "coalesce")
+
+
+class ExpressionParser:
+    """
+    Pratt parser for (a subset of) Adaptive Expressions, expressions are compiled to closures taking Scope
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.tokens = self.tokenize(source)
+        self.position = 0
+
+    def error(self, message):
+        return CardException(f"Invalid template expression '{self.source}': {message}")
+
+    def tokenize(self, source):
+        tokens, position = [], 0
+        while source[position:].strip():
+            match = TOKEN_RE.match(source, position)
+            if match is None:
+                raise self.error(f"unexpected character at position {position}")
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        tokens.append(("end", None))
+        return tokens
+
+    def peek(self):
+        return self.tokens[self.position]
+
+    def next(self):
+        token = self.tokens[self.position]
+        if token[0] != "end":
+            self.position += 1
+        return token
+
+    def expect(self, op):
+        kind, value = self.next()
+        if kind != "op" or value != op:
+            raise self.error(f"expected '{op}'")
+
+    def parse(self):
+        node = self.expression(0)
+        if self.peek()[0] != "end":
+            raise self.error(f"unexpected '{self.peek()[1]}'")
+        return node
+
+    def expression(self, right_power):
+        node = self.prefix(self.next())
+        while True:
+            kind, value = self.peek()
+            power = BINDING_POWERS.get(value) if kind == "op" else None
+            if power is None or power <= right_power:
+                return node
+            self.next()
+            node = self.infix(value, node, power)
+
+    def arguments(self):
+        args = []
+        if self.peek() == ("op", ")"):
+            self.next()
+            return args
+        while True:
+            args.append(self.expression(0))
+            kind, value = self.next()
+            if (kind, value) == ("op", ")"):
+                return args
+            elif (kind, value) != ("op", ","):
+                raise self.error("expected ',' or ')'")
+
+    def prefix(self, token):
+        kind, value = token
+        if kind == "number":
+            number = float(value) if "." in value else int(value)
+            return lambda scope: number
+        elif kind == "string":
+            text = ESCAPE_RE.sub(r"\1", value[1:-1])
+            return lambda scope: text
+        elif kind == "name":
+            return self.name(value)
+        elif token == ("op", "("):
+            node = self.expression(0)
+            self.expect(")")
+            return node
+        elif token == ("op", "!"):
+            operand = self.expression(UNARY_POWER)
+            return lambda scope: not is_true(operand(scope))
+        elif token == ("op", "-"):
+            operand = self.expression(UNARY_POWER)
+            return lambda scope: -_defined(operand(scope))
+        elif kind == "end":
+            raise self.error("unexpected end of expression")
+        raise self.error(f"unexpected '{value}'")
+
+    def name(self, name):
+        if name == "true":
+            return lambda scope: True
+        elif name == "false":
+            return lambda scope: False
+        elif name == "null":
+            return lambda scope: None
+        elif name == "$data":
+            return lambda scope: scope.data
+        elif name == "$root":
+            return lambda scope: scope.root
+        elif name == "$host":
+            return lambda scope: scope.host
+        elif name == "$index":
+            return lambda scope: scope.index
+        elif self.peek() == ("op", "("):
+            self.next()
+            return self.function(name, self.arguments())
+        return lambda scope: get_member(scope.data, name)
+
+    def function(self, name, args):
+        if name == "if":
+            if len(args) != 3:
+                raise self.error("if() takes 3 arguments")
+            condition, then, otherwise = args
+            return lambda scope: then(scope) if is_true(condition(scope)) else otherwise(scope)
+        elif name == "and":
+            return lambda scope: all(is_true(arg(scope)) for arg in args)
+        elif name == "or":
+            return lambda scope: any(is_true(arg(scope)) for arg in args)
+        elif name == "coalesce":
+            def coalesce(scope):
+                for arg in args:
+                    value = arg(scope)
+                    if value is not None and value is not UNDEFINED:
+                        return value
+                return None
+            return coalesce
+        try:
+            function = FUNCTIONS[name]
+        except KeyError:
+            raise self.error(f"unknown function '{name}'")
+        return lambda scope: function(*[_defined(arg(scope)) for arg in args])
+
+    def infix(self, op, left, power):
+        if op == ".":
+            kind, name = self.next()
+            if kind != "name":
+                raise self.error("expected property name after '.'")
+            return lambda scope: get_member(left(scope), name)
+        elif op == "[":
+            key = self.expression(0)
+            self.expect("]")
+            return lambda scope: get_member(left(scope), key(scope))
+        right = self.expression(power)
+        if op == "&&":
+            return lambda scope: is_true(left(scope)) and is_true(right(scope))
+        elif op == "||":
+            return lambda scope: is_true(left(scope)) or is_true(right(scope))
+        function = BINARY_OPERATORS[op]
+        return lambda scope: function(_defined(left(scope)), _defined(right(scope)))
+
+
+@functools.lru_cache(maxsize=EXPRESSIONS_CACHE_SIZE)
+def compile_expression(source: str):
+    """
+    Returns callable(scope), errors during evaluation (e.g. type mismatch) give UNDEFINED
+    """
+    node = ExpressionParser(source).parse()
+
+    def evaluate(scope):
+        try:
+            return node(scope)
+        except (TypeError, ValueError, ArithmeticError, AttributeError, KeyError, IndexError):
+            return UNDEFINED
+    return evaluate
+
+
+def split_bindings(text: str):
+    """
+    Splits string to literal parts and ${expression} sources, \\${ is an escaped (literal) ${
+    """
+    parts, literal, position = [], [], 0
+    while True:
+        start = text.find("${", position)
+        if start == -1:
+            break
+        if start and text[start - 1] == "\\":
+            literal.append(text[position:start - 1] + "${")
+            position = start + 2
+            continue
+        end, depth, quote = start + 2, 1, None
+        while end < len(text):
+            char = text[end]
+            if quote:
+                if char == "\\":
+                    end += 1
+                elif char == quote:
+                    quote = None
+            elif char in "'\"":
+                quote = char
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if not depth:
+                    break
+            end += 1
+        if depth:
+            # not terminated, rest of the string is literal
+            break
+        literal.append(text[position:start])
+        parts.append("".join(literal))
+        parts.append((text[start + 2:end], text[start:end + 1]))
+        literal, position = [], end + 1
+    literal.append(text[position:])
+    parts.append("".join(literal))
+    return parts
+
+
+def compile_string(text: str):
+    parts = split_bindings(text)
+    if len(parts) == 1:
+        value = parts[0]
+        return lambda scope: value
+    if len(parts) == 3 and parts[0] == parts[2] == "":
+        # single binding keeps type of the value
+        source, original = parts[1]
+        expression = compile_expression(source)
+
+        def evaluate(scope):
+            value = expression(scope)
+            return original if value is UNDEFINED else value
+        return evaluate
+    nodes = []
+    for part in parts:
+        if isinstance(part, tuple):
+            nodes.append((compile_expression(part[0]), part[1]))
+        elif part:
+            nodes.append((None, part))
+
+    def interpolate(scope):
+        chunks = []
+        for expression, text in nodes:
+            if expression is None:
+                chunks.append(text)
+            else:
+                value = expression(scope)
+                chunks.append(text if value is UNDEFINED else to_string(value))
+        return "".join(chunks)
+    return interpolate
+
+
+def compile_binding(value):
+    """
+    Value of $data/$when, unresolved binding gives UNDEFINED (instead of original text)
+    """
+    if isinstance(value, str):
+        parts = split_bindings(value)
+        if len(parts) == 3 and parts[0] == parts[2] == "":
+            return compile_expression(parts[1][0])
+    return compile_value(value)
+
+
+def compile_when(value):
+    condition = compile_binding(value)
+    return lambda scope: is_true(condition(scope))
+
+
+def compile_object(obj: dict):
+    """
+    Returns (evaluate, expand) callables, expand(scope, append) is used for array items (object can be repeated)
+    """
+    data = compile_binding(obj[DATA_KEY]) if DATA_KEY in obj else None
+    when = compile_when(obj[WHEN_KEY]) if WHEN_KEY in obj else None
+    fields = [(key, compile_value(value)) for key, value in obj.items() if key not in (DATA_KEY, WHEN_KEY)]
+
+    def build(scope):
+        result = {}
+        for key, node in fields:
+            value = node(scope)
+            if value is not DROP:
+                result[key] = value
+        return result
+
+    if data is None and when is None:
+        return build, lambda scope, append: append(build(scope))
+
+    def expand(scope, append):
+        """
+        Returns True when object was repeated for array in $data
+        """
+        if data is None:
+            if when(scope):
+                append(build(scope))
+            return False
+        context = data(scope)
+        if context is None or context is UNDEFINED:
+            return False
+        if isinstance(context, (list, tuple)):
+            for index, item in enumerate(context):
+                child = Scope(item, scope.root, scope.host, index)
+                if when is None or when(child):
+                    append(build(child))
+            return True
+        child = Scope(context, scope.root, scope.host, scope.index)
+        if when is None or when(child):
+            append(build(child))
+        return False
+
+    def evaluate(scope):
+        result = []
+        if expand(scope, result.append):
+            return result
+        return result[0] if result else DROP
+    return evaluate, expand
+
+
+def compile_value(value):
+    if isinstance(value, str):
+        return compile_string(value)
+    elif isinstance(value, dict):
+        return compile_object(value)[0]
+    elif isinstance(value, list):
+        items = [compile_item(item) for item in value]
+
+        def evaluate(scope):
+            result = []
+            append = result.append
+            for item in items:
+                item(scope, append)
+            return result
+        return evaluate
+    return lambda scope: value
+
+
+def compile_item(value):
+    if isinstance(value, dict):
+        return compile_object(value)[1]
+    node = compile_value(value)
+    return lambda scope, append: append(node(scope))
+
+
+class Template:
+    """
+    Compiled template, every binding is parsed once and expand() only evaluates compiled expressions
+    """
+
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+        self._evaluate = compile_value(payload)
+
+    def expand(self, data=None, host=None):
+        """
+        Returns card payload (dict) with bindings resolved against data ($root)
+        """
+        result = self._evaluate(Scope(data, data, host))
+        return None if result is DROP else result
+
+
+_templates = OrderedDict()
+_templates_lock = threading.Lock()
+
+
+def get_template_source(template) -> str:
+    if isinstance(template, Card):
+        return template.json_payload
+    elif isinstance(template, str):
+        return template
+    return json.dumps(template, cls=BaseEncoder, ensure_ascii=False)
+
+
+def compile_template(template) -> Template:
+    """
+    Accepts AdaptiveCard, payload dict or json string, compiled templates are cached by content hash
+    """
+    source = get_template_source(template)
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    with _templates_lock:
+        compiled = _templates.get(digest)
+        if compiled is not None:
+            _templates.move_to_end(digest)
+            return compiled
+    compiled = Template(json.loads(source))
+    with _templates_lock:
+        _templates[digest] = compiled
+        while len(_templates) > CACHE_SIZE:
+            _templates.popitem(last=False)
+    return compiled
+
+
+def clear_templates() -> None:
+    with _templates_lock:
+        _templates.clear()
+    compile_expression.cache_clear()
+
+
+def expand(template, data=None, host=None):
+    return compile_template(template).expand(data, host)
+
+
+def bind(element, data=None, when: str = None):
+    """
+    Sets $data/$when on card element, e.g. bind(TableRow(...), data="${$root.rows}")
+    """
+    payload = element.as_data()
+    if data is not None:
+        payload[DATA_KEY] = data
+    if when is not None:
+        payload[WHEN_KEY] = when
+    # same as set_* methods, estimated sizes of element and cards containing it have to be measured again
+    update_size(element, None)
+    element.mark_changed()
+    return element
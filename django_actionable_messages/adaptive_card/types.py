@@ -5,6 +5,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class BackgroundImage(CardElement):
+    __slots__ = ()
+
     def __init__(self, url: str, fill_mode: FillMode = None, horizontal_alignment: HorizontalAlignment = None,
                  vertical_alignment: VerticalAlignment = None, **kwargs) -> None:
         self._data = {
@@ -32,6 +34,8 @@ class BackgroundImage(CardElement):
 
 
 class Refresh(CardElement):
+    __slots__ = ()
+
     def __init__(self, action=None, expires: str = None, user_ids: List[str] = None, **kwargs) -> None:
         self._data = {}
         super().__init__(**kwargs)
@@ -43,7 +47,7 @@ class Refresh(CardElement):
             self.set_user_ids(user_ids)
 
     def set_action(self, action) -> None:
-        self._data["action"] = action.as_data()
+        self._data["action"] = self._get_item(action)
 
     def set_expires(self, date: str) -> None:
         self._data["expires"] = date
@@ -53,6 +57,8 @@ class Refresh(CardElement):
 
 
 class TokenExchangeResource(CardElement):
+    __slots__ = ()
+
     def __init__(self, token_id: str, uri: str, provider_id: str, **kwargs) -> None:
         self._data = {
             "id": token_id,
@@ -63,6 +69,8 @@ class TokenExchangeResource(CardElement):
 
 
 class AuthCardButton(CardElement):
+    __slots__ = ()
+
     def __init__(self, btn_type: str, value: str, title: str = None, image: str = None, **kwargs) -> None:
         self._data = {
             "type": btn_type,
@@ -82,6 +90,8 @@ class AuthCardButton(CardElement):
 
 
 class Authentication(CardElement):
+    __slots__ = ()
+
     def __init__(self, text: str = None, connection_name: str = None,
                  token_exchange_resource: TokenExchangeResource = None,
                  buttons: List[AuthCardButton] = None, **kwargs) -> None:
@@ -103,13 +113,15 @@ class Authentication(CardElement):
         self._data["connectionName"] = connection_name
 
     def set_token_exchange_resource(self, token_exchange_resource: TokenExchangeResource) -> None:
-        self._data["tokenExchangeResource"] = token_exchange_resource.as_data()
+        self._data["tokenExchangeResource"] = self._get_item(token_exchange_resource)
 
     def set_buttons(self, buttons: List[AuthCardButton]) -> None:
         self._data["buttons"] = self._get_items_list(buttons)
 
 
 class Metadata(CardElement):
+    __slots__ = ()
+
     def __init__(self, url: str = None, **kwargs) -> None:
         self._data = {}
         super().__init__(**kwargs)
@@ -126,3 +126,107 @@ class FillMode(str, Enum):
 class AssociatedInputs(str, Enum):
     AUTO = "Auto"
     NONE = "None"
+
+# properties equal to schema defaults are left out of compact payload ([] - empty list),
+# None - properties of any element
+COMPACT_DEFAULTS = {
+    None: {
+        "spacing": SpacingStyle.DEFAULT,
+        "separator": False,
+        "isVisible": True,
+        "height": BlockElementHeight.AUTO,
+        "isRequired": False
+    },
+    "AdaptiveCard": {
+        "body": [],
+        "actions": [],
+        "hideOriginalBody": False
+    },
+    "TextBlock": {
+        "color": Color.DEFAULT,
+        "fontType": FontType.DEFAULT,
+        "isSubtle": False,
+        "size": FontSize.DEFAULT,
+        "weight": FontWeight.DEFAULT,
+        "wrap": False
+    },
+    "TextRun": {
+        "color": Color.DEFAULT,
+        "fontType": FontType.DEFAULT,
+        "highlight": False,
+        "isSubtle": False,
+        "italic": False,
+        "size": FontSize.DEFAULT,
+        "strikethrough": False,
+        "weight": FontWeight.DEFAULT
+    },
+    "Image": {
+        "size": ImageSize.AUTO,
+        "style": ImageStyle.DEFAULT
+    },
+    "ImageSet": {
+        "imageSize": ImageSize.MEDIUM
+    },
+    "Container": {
+        "bleed": False
+    },
+    "Column": {
+        "items": [],
+        "bleed": False
+    },
+    "ColumnSet": {
+        "columns": [],
+        "bleed": False
+    },
+    "Table": {
+        "columns": [],
+        "rows": [],
+        "firstRowAsHeader": True,
+        "showGridLines": True
+    },
+    "TableRow": {
+        "cells": []
+    },
+    "TableCell": {
+        "bleed": False
+    },
+    "Input.Text": {
+        "isMultiline": False,
+        "style": TextInputStyle.TEXT
+    },
+    "Input.Toggle": {
+        "valueOn": "true",
+        "valueOff": "false",
+        "wrap": False
+    },
+    "Input.ChoiceSet": {
+        "isMultiSelect": False,
+        "style": ChoiceInputStyle.COMPACT,
+        "wrap": False
+    },
+    "Action.OpenUrl": {
+        "style": ActionStyle.DEFAULT,
+        "mode": ActionMode.PRIMARY,
+        "isEnabled": True
+    },
+    "Action.Submit": {
+        "style": ActionStyle.DEFAULT,
+        "mode": ActionMode.PRIMARY,
+        "isEnabled": True
+    },
+    "Action.ShowCard": {
+        "style": ActionStyle.DEFAULT,
+        "mode": ActionMode.PRIMARY,
+        "isEnabled": True
+    },
+    "Action.ToggleVisibility": {
+        "style": ActionStyle.DEFAULT,
+        "mode": ActionMode.PRIMARY,
+        "isEnabled": True
+    },
+    "Action.Execute": {
+        "style": ActionStyle.DEFAULT,
+        "mode": ActionMode.PRIMARY,
+        "isEnabled": True
+    }
+}
@@ -0,0 +1,337 @@
+import asyncio
+import collections
+import ssl as ssl_module
+from urllib.parse import urlsplit
+
+from django_actionable_messages.exceptions import DeliveryException
+from django_actionable_messages.settings import card_settings
+
+DEFAULT_PORTS = {
+    "http": 80,
+    "https": 443
+}
+# webhooks answer with a short text, larger responses are not read
+MAX_BODY_SIZE = 1024 * 1024
+
+
+class Response:
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: dict, body: bytes) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self):
+        return f"<Response {self.status}>"
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    @property
+    def text(self):
+        return self.body.decode(errors="replace")
+
+
+async def read_headers(reader) -> dict:
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def check_body_size(size: int, max_body_size: int) -> None:
+    if size > max_body_size:
+        raise ValueError(f"Response body is larger than {max_body_size} bytes")
+
+
+async def read_chunked(reader, max_body_size: int = MAX_BODY_SIZE) -> bytes:
+    chunks, total = [], 0
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip(), 16)
+        if not size:
+            await read_headers(reader)
+            return b"".join(chunks)
+        total += size
+        check_body_size(total, max_body_size)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+async def read_until_eof(reader, max_body_size: int = MAX_BODY_SIZE) -> bytes:
+    chunks, total = [], 0
+    while True:
+        chunk = await reader.read(64 * 1024)
+        if not chunk:
+            return b"".join(chunks)
+        total += len(chunk)
+        check_body_size(total, max_body_size)
+        chunks.append(chunk)
+
+
+async def read_response(reader, max_body_size: int = MAX_BODY_SIZE):
+    """
+    Returns response and whether the connection can be used again, ValueError is raised for body larger
+    than max_body_size
+    """
+    while True:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        version, status = status_line.split(None, 2)[:2]
+        status = int(status)
+        headers = await read_headers(reader)
+        # informational responses (100 Continue) are followed by the final one
+        if not 100 <= status < 200:
+            break
+    keep_alive = version == b"HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = await read_chunked(reader, max_body_size)
+    elif "content-length" in headers:
+        size = int(headers["content-length"])
+        check_body_size(size, max_body_size)
+        body = await reader.readexactly(size)
+    elif status in (204, 304):
+        body = b""
+    else:
+        body, keep_alive = await read_until_eof(reader, max_body_size), False
+    return Response(status, headers, body), keep_alive
+
+
+class Connection:
+    """
+    Keep-alive HTTP/1.1 connection, requests can be pipelined (responses are matched in order)
+    """
+
+    def __init__(self, reader, writer, max_body_size: int = MAX_BODY_SIZE) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.max_body_size = max_body_size
+        self.in_use = 0
+        self.closed = False
+        self._pending = collections.deque()
+        self._reader_task = None
+
+    async def request(self, data: bytes) -> Response:
+        if self.closed:
+            raise DeliveryException("Connection is closed")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        self.writer.write(data)
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.ensure_future(self._read_responses())
+        try:
+            await self.writer.drain()
+        except OSError as e:
+            self.close(e)
+        return await future
+
+    async def _read_responses(self):
+        try:
+            while self._pending:
+                response, keep_alive = await read_response(self.reader, self.max_body_size)
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(response)
+                if not keep_alive:
+                    self.close()
+        except (OSError, EOFError, ValueError) as e:
+            self.close(e)
+
+    def close(self, exc=None):
+        if self.closed:
+            return
+        self.closed = True
+        self.writer.close()
+        if self._reader_task is not None and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+        # requests without response can't be retried, they may have been processed
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(DeliveryException(f"Connection closed before response was received: {exc}"))
+
+
+class WebhookClient:
+    """
+    Posts cards (json) to webhooks (Teams connectors/workflows) using pool of keep-alive connections.
+    At most max_connections are open at once, with pipeline > 1 up to pipeline requests are sent over
+    a connection before their responses are received (HTTP/1.1 pipelining, server must support it).
+    Responses with body larger than max_body_size bytes raise DeliveryException.
+    """
+
+    def __init__(self, max_connections: int = 10, pipeline: int = 1, timeout: float = 30, headers: dict = None,
+                 ssl=None, max_body_size: int = MAX_BODY_SIZE) -> None:
+        self.max_connections = max_connections
+        self.pipeline = pipeline
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.ssl = ssl
+        self.max_body_size = max_body_size
+        self._connections = {}
+        self._count = 0
+        self._condition = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        for connections in self._connections.values():
+            for connection in connections:
+                connection.close()
+        self._connections.clear()
+        self._count = 0
+
+    @property
+    def condition(self):
+        # created on first use, so it belongs to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _discard(self, key, connection):
+        connections = self._connections.get(key, [])
+        if connection in connections:
+            connections.remove(connection)
+            self._count -= 1
+
+    def _get_connection(self, key):
+        for connection in list(self._connections.get(key, [])):
+            if connection.closed or not connection.in_use and connection.reader.at_eof():
+                # closed by server while idle
+                connection.close()
+                self._discard(key, connection)
+        connections = [connection for connection in self._connections.get(key, []) if connection.in_use < self.pipeline]
+        return min(connections, key=lambda connection: connection.in_use, default=None)
+
+    def _close_idle(self):
+        for key, connections in self._connections.items():
+            for connection in connections:
+                if not connection.in_use:
+                    connection.close()
+                    self._discard(key, connection)
+                    return True
+        return False
+
+    async def _connect(self, key):
+        scheme, host, port = key
+        ssl = None
+        if scheme == "https":
+            ssl = self.ssl if self.ssl is not None else ssl_module.create_default_context()
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl)
+        return Connection(reader, writer, self.max_body_size)
+
+    async def _acquire(self, key):
+        async with self.condition:
+            while True:
+                connection = self._get_connection(key)
+                if connection is not None:
+                    connection.in_use += 1
+                    return connection
+                elif self._count < self.max_connections or self._close_idle():
+                    self._count += 1
+                    break
+                await self.condition.wait()
+        try:
+            connection = await asyncio.wait_for(self._connect(key), self.timeout)
+        except BaseException:
+            async with self.condition:
+                self._count -= 1
+                self.condition.notify()
+            raise
+        connection.in_use = 1
+        self._connections.setdefault(key, []).append(connection)
+        return connection
+
+    async def _release(self, key, connection):
+        async with self.condition:
+            connection.in_use -= 1
+            if connection.closed:
+                self._discard(key, connection)
+            self.condition.notify()
+
+    def _get_request(self, url, body: bytes, headers: dict = None) -> tuple:
+        parts = urlsplit(url)
+        if parts.scheme not in DEFAULT_PORTS:
+            raise DeliveryException(f"Unsupported url: '{url}'")
+        port = parts.port or DEFAULT_PORTS[parts.scheme]
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request_headers = {
+            "Host": host,
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(body)),
+            **self.headers,
+            **(headers or {})
+        }
+        head = "".join(f"{name}: {value}\r\n" for name, value in request_headers.items())
+        data = f"POST {path} HTTP/1.1\r\n{head}\r\n".encode("latin-1") + body
+        return (parts.scheme, parts.hostname, port), data
+
+    async def post(self, url: str, body, headers: dict = None) -> Response:
+        """
+        Posts json (str/bytes) to url
+        """
+        if isinstance(body, str):
+            body = body.encode()
+        key, data = self._get_request(url, body, headers)
+        try:
+            connection = await self._acquire(key)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise DeliveryException(f"Can't connect to '{url}': {e!r}")
+        try:
+            return await asyncio.wait_for(connection.request(data), self.timeout)
+        except asyncio.TimeoutError:
+            connection.close()
+            raise DeliveryException(f"No response from '{url}' in {self.timeout} s")
+        finally:
+            await self._release(key, connection)
+
+    async def send(self, url: str, card, headers: dict = None, executor=None) -> Response:
+        """
+        Posts card (or payload dict/json) serialized by card json encoder
+        """
+        return await self.post(url, await get_json_payload(card, executor), headers)
+
+    async def send_many(self, deliveries, concurrency: int = None, executor=None) -> list:
+        """
+        Sends (url, card) pairs with at most concurrency (max_connections * pipeline by default) requests
+        at once. Returns responses (or exceptions, e.g. DeliveryException) in input order.
+        """
+        deliveries = iter(enumerate(deliveries))
+        results = {}
+
+        async def worker():
+            for index, (url, card) in deliveries:
+                try:
+                    results[index] = await self.send(url, card, executor=executor)
+                except Exception as e:
+                    # one failed delivery (e.g. card which can't be serialized) doesn't stop the others
+                    results[index] = e
+        concurrency = concurrency or self.max_connections * self.pipeline
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # error of deliveries iterable (or cancellation), remaining deliveries are not sent
+            for task in workers:
+                task.cancel()
+            raise
+        return [results[index] for index in range(len(results))]
+
+
+async def get_json_payload(card, executor=None):
+    if isinstance(card, (str, bytes)):
+        return card
+    elif hasattr(card, "aget_payload"):
+        return await card.aget_payload(fmt="json", executor=executor)
+    return card_settings.JSON_ENCODER().encode(card)
@@ -4,6 +4,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class Header(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, value: Union[str, int], **kwargs):
         self._data = {
             "name": name,
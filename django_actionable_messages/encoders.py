@@ -1,18 +1,77 @@
+from contextlib import contextmanager
+
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import translation
+from django.utils.functional import Promise
 
 
 class EncoderMixin:
+    # references of shared elements found during encoding (set by shared dumps)
+    fragments = None
+
     def __init__(self, *args, **kwargs):
         self.lang_code = kwargs.pop("lang_code", None)
+        self._previous_language = None
+        self._language_active = False
+        self._language_depth = 0
         super().__init__(*args, **kwargs)
 
+    def activate_language(self):
+        if self._language_active:
+            return
+        self._previous_language = translation.get_language()
+        if self.lang_code is None:
+            translation.deactivate_all()
+        else:
+            translation.activate(self.lang_code)
+        self._language_active = True
+
+    def deactivate_language(self):
+        if not self._language_active:
+            return
+        if self._previous_language is None:
+            translation.deactivate_all()
+        else:
+            translation.activate(self._previous_language)
+        self._language_active = False
+
+    @contextmanager
+    def language(self):
+        """
+        Language is activated on demand (by activate_language) and restored on exit from outermost block
+        """
+        self._language_depth += 1
+        try:
+            yield
+        finally:
+            self._language_depth -= 1
+            if not self._language_depth:
+                self.deactivate_language()
+
 
 class BaseEncoder(EncoderMixin, DjangoJSONEncoder):
     """
     Everything that DjangoJSONEncoder can handle and translations with selected language
     """
 
+    def iterencode(self, o, _one_shot=False):
+        with self.language():
+            yield from super().iterencode(o, _one_shot)
+
     def default(self, o):
-        with translation.override(self.lang_code):
-            return super().default(o)
+        if isinstance(o, Promise):
+            # language stays active until the whole object is encoded
+            self.activate_language()
+            return str(o)
+        elif hasattr(o, "as_data"):
+            # card elements kept in lazy mode, shared elements and raw json
+            if self.fragments is not None:
+                if getattr(o, "is_raw", False):
+                    self.fragments[o.reference] = o.raw
+                    return o.reference
+                elif getattr(o, "is_shared", False):
+                    data = o.as_data()
+                    self.fragments[data.reference] = data
+                    return data.reference
+            return o.as_data()
+        return super().default(o)
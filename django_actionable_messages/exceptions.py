@@ -1,2 +1,6 @@
 class CardException(Exception):
     pass
+
+
+class DeliveryException(Exception):
+    pass
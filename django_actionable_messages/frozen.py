@@ -0,0 +1,86 @@
+import copy
+from collections.abc import Mapping, Sequence
+
+
+def freeze(value):
+    if hasattr(value, "as_data"):
+        value = value.as_data()
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    elif isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+class FrozenMixin:
+    """
+    Read-only view of payload data, nested dicts/lists are wrapped on access (nothing is copied)
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        other_data = other._data if isinstance(other, FrozenMixin) else other
+        # data may hold (lazy) elements, compare item by item when raw data differs
+        return self._data == other_data or self._items_equal(other)
+
+    def _items_equal(self, other):
+        raise NotImplementedError
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def thaw(self):
+        return copy.deepcopy(self._data)
+
+
+class FrozenDict(FrozenMixin, Mapping):
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return freeze(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def _items_equal(self, other):
+        if not isinstance(other, Mapping) or len(self) != len(other):
+            return False
+        return all(key in other and self[key] == other[key] for key in self._data)
+
+
+class FrozenList(FrozenMixin, Sequence):
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return freeze(self._data[index])
+
+    def __iter__(self):
+        for value in self._data:
+            yield freeze(value)
+
+    def _items_equal(self, other):
+        if not isinstance(other, (list, tuple, FrozenList)) or len(self) != len(other):
+            return False
+        return all(value == other_value for value, other_value in zip(self, other))
@@ -0,0 +1,139 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.utils import translation
+
+from django_actionable_messages.mixins import render_many
+from django_actionable_messages.signing import sign_many
+
+
+class BatchResult:
+    """
+    Result of sending a batch of messages, failed batches keep their messages (so they can be sent again).
+    Backends send messages one by one, so some messages of failed batch may have been delivered.
+    """
+    __slots__ = ("index", "size", "sent", "error", "messages")
+
+    def __init__(self, index: int, size: int, sent: int = 0, error: Exception = None, messages: list = None) -> None:
+        self.index = index
+        self.size = size
+        self.sent = sent
+        self.error = error
+        self.messages = messages
+
+    def __repr__(self):
+        return f"<BatchResult {self.index}: {self.sent}/{self.size}{' failed' if self.error else ''}>"
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def build_message(card, to, subject: str = "", body: str = None, from_email: str = None, html_payload: str = None,
+                  **kwargs) -> EmailMultiAlternatives:
+    """
+    Multipart email with plain text body (card fallback text by default) and card html as alternative.
+    Other kwargs are passed to EmailMultiAlternatives.
+    """
+    if isinstance(to, str):
+        to = [to]
+    if html_payload is None:
+        html_payload = card.html_payload
+    with translation.override(card.get_language_code() or settings.LANGUAGE_CODE):
+        message = EmailMultiAlternatives(
+            subject=str(subject), body=str(card.get_fallback_text() if body is None else body),
+            from_email=from_email, to=to, **kwargs
+        )
+    message.attach_alternative(html_payload, "text/html")
+    return message
+
+
+def get_signing_recipients(card, to, cc=None) -> list:
+    """
+    Card signing_recipients or recipients (to and cc) of email
+    """
+    if card.signing_recipients is not None:
+        return card.signing_recipients
+    return ([to] if isinstance(to, str) else list(to)) + list(cc or [])
+
+
+def build_messages(items, subject: str = "", body: str = None, from_email: str = None, signed: bool = False,
+                   chunk_size: int = 100, processes: int = None, **kwargs):
+    """
+    Builds messages lazily from (card, to) or (card, to, {build_message() kwargs}) items, chunk by chunk.
+    Html of chunk is rendered with render_many() (signed ones with sign_many() in a pool of processes shared
+    by all chunks, recipients are card signing_recipients or to and cc of each message).
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    items = iter(items)
+    executor = None
+    try:
+        while True:
+            chunk = []
+            for card, to, *options in itertools.islice(items, chunk_size):
+                message_kwargs = dict(kwargs, subject=subject, body=body, from_email=from_email)
+                if options:
+                    message_kwargs.update(options[0])
+                chunk.append((card, to, message_kwargs))
+            if not chunk:
+                return
+            cards = [card for card, _to, _message_kwargs in chunk]
+            if signed:
+                if executor is None and processes > 1:
+                    # workers load each key once for all chunks
+                    executor = ProcessPoolExecutor(max_workers=processes)
+                recipients = [
+                    get_signing_recipients(card, to, message_kwargs.get("cc")) for card, to, message_kwargs in chunk
+                ]
+                payloads = sign_many(cards, html=True, processes=processes, recipients=recipients, executor=executor)
+            else:
+                payloads = render_many(cards, fmt="html", chunk_size=chunk_size)
+            for (card, to, message_kwargs), html_payload in zip(chunk, payloads):
+                yield build_message(card, to, html_payload=html_payload, **message_kwargs)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def send_messages(messages, batch_size: int = 100, connection=None, fail_silently: bool = False) -> list:
+    """
+    Sends messages (any iterable) in batches over one connection (EMAIL_BACKEND by default), which is opened once.
+    Batch errors (connection errors too) don't stop sending, connection is reopened after them.
+    Returns BatchResult of each batch.
+    """
+    connection = connection or get_connection(fail_silently=fail_silently)
+    messages = iter(messages)
+    results = []
+    # opened with the first batch
+    new_connection, reopen = False, True
+    try:
+        for index in itertools.count():
+            batch = list(itertools.islice(messages, batch_size))
+            if not batch:
+                break
+            try:
+                if reopen:
+                    new_connection, reopen = connection.open() or new_connection, False
+                sent = connection.send_messages(batch)
+            except Exception as e:
+                results.append(BatchResult(index, len(batch), error=e, messages=batch))
+                # connection may be broken, next batch opens a new one
+                connection.close()
+                reopen = True
+            else:
+                results.append(BatchResult(index, len(batch), sent=sent or 0))
+    finally:
+        if new_connection:
+            connection.close()
+    return results
+
+
+def send_mass_card_mail(items, batch_size: int = 100, connection=None, fail_silently: bool = False, **kwargs) -> list:
+    """
+    build_messages() and send_messages() in one step
+    """
+    return send_messages(build_messages(items, **kwargs), batch_size, connection, fail_silently)
@@ -1,8 +1,10 @@
 from django_actionable_messages.exceptions import CardException
-from django_actionable_messages.mixins import CardElement
+from django_actionable_messages.mixins import CardElement, get_item_data
 
 
 class OpenUri(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, targets: list = None, **kwargs) -> None:
         self._data = {
             "@type": "OpenUri",
@@ -19,16 +21,18 @@ class OpenUri(CardElement):
     def add_target(self, target) -> None:
         targets = self._data.setdefault("targets", [])
         self._check_target(target, targets)
-        self._data["targets"].append(target.as_data())
+        self._data["targets"].append(self._get_item(target))
 
     def _check_target(self, target: list, targets: list) -> None:
         os_type = target._get_os()
-        os_list = (x["os"] for x in targets)
+        os_list = (get_item_data(x)["os"] for x in targets)
         if os_type in os_list:
             raise CardException(f"Target already set for '{os_type}'")
 
 
 class HttpPOST(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, target: str, headers: list = None, body: str = None, body_content_type: str = None,
                  **kwargs) -> None:
         self._data = {
@@ -49,7 +53,7 @@ class HttpPOST(CardElement):
         if isinstance(headers, (list, set, tuple)):
             self._data["headers"].extend(self._get_items_list(headers))
         else:
-            self._data["headers"].append(headers.as_data())
+            self._data["headers"].append(self._get_item(headers))
 
     def set_body(self, body: str) -> None:
         self._data["body"] = body
@@ -59,6 +63,8 @@ class HttpPOST(CardElement):
 
 
 class InvokeAddInCommand(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, add_in_id: str, desktop_command_id: str, initialization_context: dict = None,
                  **kwargs) -> None:
         self._data = {
@@ -82,6 +88,8 @@ class InvokeAddInCommand(CardElement):
 
 
 class ActionCard(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, inputs: list = None, actions: list = None, **kwargs) -> None:
         self._data = {
             "@type": "ActionCard",
@@ -98,11 +106,11 @@ class ActionCard(CardElement):
         if isinstance(inputs, (list, set, tuple)):
             self._data["inputs"].extend(self._get_items_list(inputs))
         else:
-            self._data["inputs"].append(inputs.as_data())
+            self._data["inputs"].append(self._get_item(inputs))
 
     def add_actions(self, actions) -> None:
         self._data.setdefault("actions", [])
         if isinstance(actions, (list, set, tuple)):
             self._data["actions"].extend(self._get_items_list(actions))
         else:
-            self._data["actions"].append(actions.as_data())
+            self._data["actions"].append(self._get_item(actions))
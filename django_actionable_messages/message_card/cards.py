@@ -2,11 +2,17 @@ import uuid
 from typing import List, Union
 
 from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.message_card.utils import COMPACT_DEFAULTS
 from django_actionable_messages.mixins import MESSAGE_CARD, Card
 
 
 class MessageCard(Card):
     card_type = MESSAGE_CARD
+    volatile_fields = ("correlationId",)
+    compact_defaults = COMPACT_DEFAULTS
+    # MessageCard objects have no "type", defaults apply to every object
+    compact_type_key = None
+    split_key = "sections"
 
     def __init__(self, title: str = None, text: str = None, originator: str = None, summary: str = None,
                  theme_color: str = None, correlation_id: str = None, auto_correlation_id=True,
@@ -76,11 +82,24 @@ class MessageCard(Card):
         if isinstance(sections, (list, set, tuple)):
             self._payload["sections"].extend(self._get_items_list(sections))
         else:
-            self._payload["sections"].append(sections.as_data())
+            self._payload["sections"].append(self._get_item(sections))
 
     def add_actions(self, actions) -> None:
         self._payload.setdefault("potentialAction", [])
         if isinstance(actions, (list, set, tuple)):
             self._payload["potentialAction"].extend(self._get_items_list(actions))
         else:
-            self._payload["potentialAction"].append(actions.as_data())
+            self._payload["potentialAction"].append(self._get_item(actions))
+
+    def get_signing_originator(self):
+        return super().get_signing_originator() or self._payload.get("originator")
+
+    def get_fallback_text(self):
+        return self._payload.get("summary") or self._payload.get("text") or ""
+
+    def _copy_with(self, **payload):
+        card = super()._copy_with(**payload)
+        if "correlationId" in card._payload:
+            # every card is a separate message
+            card._payload["correlationId"] = str(uuid.uuid4())
+        return card
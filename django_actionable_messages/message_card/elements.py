@@ -5,6 +5,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class Fact(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, value: Union[str, int], **kwargs) -> None:
         self._data = {
             "name": name,
@@ -14,6 +16,8 @@ class Fact(CardElement):
 
 
 class HeroImage(CardElement):
+    __slots__ = ()
+
     def __init__(self, url: str, title: str = None, **kwargs) -> None:
         self._data = {
             "image": url
@@ -27,6 +31,8 @@ class HeroImage(CardElement):
 
 
 class InputChoice(CardElement):
+    __slots__ = ()
+
     def __init__(self, name: str, value: Union[str, int], **kwargs) -> None:
         self._data = {
             "value": value,
@@ -39,6 +45,8 @@ class InputChoice(CardElement):
 
 
 class ActionTarget(CardElement):
+    __slots__ = ()
+
     def __init__(self, os_type: OSType, url: str, **kwargs) -> None:
         self._data = {
             "os": os_type,
@@ -1,9 +1,11 @@
 from django_actionable_messages.exceptions import CardException
 from django_actionable_messages.message_card.mixins import InputMixin
 from django_actionable_messages.message_card.utils import ChoiceStyle
+from django_actionable_messages.mixins import get_item_data
 
 
 class TextInput(InputMixin):
+    __slots__ = ()
     input_type = "TextInput"
 
     def __init__(self, max_length: int = None, is_multiline: bool = False, **kwargs) -> None:
@@ -20,6 +22,7 @@ class TextInput(InputMixin):
 
 
 class DateInput(InputMixin):
+    __slots__ = ()
     input_type = "DateInput"
 
     def __init__(self, include_time: bool = None, **kwargs) -> None:
@@ -32,6 +35,7 @@ class DateInput(InputMixin):
 
 
 class MultiChoiceInput(InputMixin):
+    __slots__ = ()
     input_type = "MultichoiceInput"
 
     def __init__(self, choices: list = None, is_multi_select: bool = None, style: ChoiceStyle = None, **kwargs) -> None:
@@ -50,7 +54,7 @@ class MultiChoiceInput(InputMixin):
     def add_choice(self, choice) -> None:
         choices = self._data.setdefault("choices", [])
         self._check_choice(choice, choices)
-        self._data["choices"].append(choice.as_data())
+        self._data["choices"].append(self._get_item(choice))
 
     def set_is_multi_select(self, is_multi_select=True) -> None:
         self._data["isMultiSelect"] = is_multi_select
@@ -60,6 +64,6 @@ class MultiChoiceInput(InputMixin):
 
     def _check_choice(self, choice, choices) -> None:
         choice_value = choice._get_value()
-        values_list = (c["value"] for c in choices)
+        values_list = (get_item_data(c)["value"] for c in choices)
         if choice_value in values_list:
             raise CardException(f"Choice with this 'value' [{choice_value}] already added")
@@ -2,6 +2,7 @@ from django_actionable_messages.mixins import CardElement
 
 
 class InputMixin(CardElement):
+    __slots__ = ()
     input_type = None
 
     def __init__(self, input_id: str = None, title: str = None, value: str = None, is_required: bool = None,
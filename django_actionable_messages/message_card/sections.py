@@ -2,6 +2,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class Section(CardElement):
+    __slots__ = ()
+
     def __init__(self, start_group: bool = False, title: str = None, text: str = None, activity_image: str = None,
                  activity_title: str = None, activity_subtitle: str = None, activity_text: str = None, hero_image=None,
                  facts=None, actions=None, **kwargs) -> None:
@@ -60,18 +62,18 @@ class Section(CardElement):
         self._data["activityText"] = text
 
     def set_hero_image(self, hero_image) -> None:
-        self._data["heroImage"] = hero_image.as_data()
+        self._data["heroImage"] = self._get_item(hero_image)
 
     def add_facts(self, facts) -> None:
         self._data.setdefault("facts", [])
         if isinstance(facts, (list, set, tuple)):
             self._data["facts"].extend(self._get_items_list(facts))
         else:
-            self._data["facts"].append(facts.as_data())
+            self._data["facts"].append(self._get_item(facts))
 
     def add_potential_actions(self, actions) -> None:
         self._data.setdefault("potentialAction", [])
         if isinstance(actions, (list, set, tuple)):
             self._data["potentialAction"].extend(self._get_items_list(actions))
         else:
-            self._data["potentialAction"].append(actions.as_data())
+            self._data["potentialAction"].append(self._get_item(actions))
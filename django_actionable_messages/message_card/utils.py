@@ -11,3 +11,22 @@ class OSType(str, Enum):
 class ChoiceStyle(str, Enum):
     NORMAL = "normal"
     EXPANDED = "expanded"
+
+
+# properties equal to defaults are left out of compact payload ([] - empty list), applies to every object
+COMPACT_DEFAULTS = {
+    None: {
+        "sections": [],
+        "potentialAction": [],
+        "facts": [],
+        "inputs": [],
+        "actions": [],
+        "headers": [],
+        "startGroup": False,
+        "hideOriginalBody": False,
+        "isRequired": False,
+        "isMultiline": False,
+        "isMultiSelect": False,
+        "includeTime": False
+    }
+}
@@ -1,40 +1,213 @@
+import asyncio
+import contextvars
 import copy
+import functools
+import hashlib
+import itertools
 import json
+import time
 
-from django.template.loader import render_to_string
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.utils import translation
 
-from django_actionable_messages.settings import card_settings
+from django_actionable_messages import renderers
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.frozen import FrozenDict
+from django_actionable_messages.serializers import CANONICAL_DUMP_KWARGS, compact, get_backend, normalize
+from django_actionable_messages.settings import SETTINGS_NAMESPACE, card_settings, import_setting
+from django_actionable_messages.shared import SharedData, get_shared_dumps, share_data
+from django_actionable_messages.signing import sign
+from django_actionable_messages import sizes
+from django_actionable_messages.sizes import (
+    MANY, add_parent, get_estimated_size, get_known_size, get_parent, invalidates_size, set_parent, tracks_size
+)
+from django_actionable_messages.splitting import Sizer, pack
 
 MESSAGE_CARD = 1
 ADAPTIVE_CARD = 2
 HERO_CARD = 3
 THUMBNAIL_CARD = 4
 
+MUTATOR_PREFIXES = ("set_", "add_")
+
+_revisions = itertools.count(1)
+_revision = 0
+
+
+def get_revision():
+    return _revision
+
+
+def mark_changed():
+    """
+    Invalidates rendered payloads of all cards (settings changes, elements which cards aren't known)
+    """
+    global _revision
+    _revision = next(_revisions)
+
+
+def tracks_changes(method):
+    # size of values added by add_* is added to estimated sizes, any other change invalidates them
+    sized = tracks_size(method) if method.__name__.startswith("add_") else invalidates_size(method)
+
+    @functools.wraps(method)
+    def wrapper(obj, *args, **kwargs):
+        result = (sized if sizes.is_active() else method)(obj, *args, **kwargs)
+        obj._mark_changed()
+        return result
+    wrapper.tracks_changes = True
+    return wrapper
+
+
+def get_item_data(item):
+    if isinstance(item, CardElement):
+        return item.as_data()
+    return item
+
+
+def materialize(value):
+    """
+    Copy of payload data (dicts and lists) with all elements turned into data
+    """
+    if isinstance(value, dict):
+        return {key: materialize(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [materialize(item) for item in value]
+    elif isinstance(value, CardElement):
+        return materialize(value.as_data())
+    return value
+
+
+def reload_settings(*args, **kwargs):
+    if kwargs["setting"] in (SETTINGS_NAMESPACE, "TEMPLATES", "INSTALLED_APPS"):
+        mark_changed()
+
+
+setting_changed.connect(reload_settings)
+
 
 class BaseMixin:
+    # _parents - element/card where it was added (and estimated size, see sizes)
+    __slots__ = ("language_code", "_parents")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.startswith(MUTATOR_PREFIXES) and callable(value) and not hasattr(value, "tracks_changes"):
+                setattr(cls, name, tracks_changes(value))
+
     def __init__(self, *args, **kwargs):
         self.language_code = kwargs.pop("lang_code", card_settings.LANGUAGE_CODE)
+        self._parents = None
         super().__init__()
 
+    def __getstate__(self):
+        # object.__getstate__() is available since python 3.11, copies are not added anywhere yet
+        slots = {}
+        for cls in type(self).__mro__:
+            names = getattr(cls, "__slots__", ())
+            for name in (names,) if isinstance(names, str) else names:
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        slots["_parents"] = None
+        return getattr(self, "__dict__", None), slots
+
     def get_language_code(self):
         return self.language_code
 
+    def mark_changed(self):
+        """
+        Invalidates rendered payloads of card (or cards containing element)
+        """
+        self._mark_changed()
+
+    def _mark_changed(self, changed=None):
+        # element data is shared by reference with its parents, so the change is passed up to cards,
+        # changed - data of elements on the way which digests are dropped (see Card.fingerprint)
+        if getattr(self, "_parents", None) is None:
+            return
+        parent = get_parent(self)
+        if parent is MANY:
+            mark_changed()
+        elif parent is not None:
+            if changed is None:
+                changed = []
+            changed.append(self.as_data())
+            parent._mark_changed(changed)
+
+    @property
+    def estimated_size(self):
+        """
+        Size of json payload (standard json encoding) kept up to date by add_* methods, O(1) after first access
+        """
+        return get_estimated_size(self)
+
+    def _get_item(self, item):
+        # shared fragments and raw json never change, so they don't need to know where they are
+        if not (getattr(item, "is_shared", False) or getattr(item, "is_raw", False)):
+            add_parent(item, self)
+        return item.as_item()
+
     def _get_items_list(self, items):
-        return list([item.as_data() for item in items])
+        return list([self._get_item(item) for item in items])
 
 
 class CardElement(BaseMixin):
-    _data = None
+    __slots__ = ("_data",)
 
     def as_data(self):
         return self._data
 
+    def get_size_data(self):
+        return self._data
+
+    def as_item(self):
+        """
+        Value kept by parent elements
+        """
+        # in lazy mode elements are kept as they are and turned into data on serialization,
+        # shared elements are always kept by reference
+        if card_settings.LAZY_ELEMENTS or self.is_shared:
+            return self
+        return self._data
+
+    @property
+    def is_shared(self):
+        return isinstance(self._data, SharedData)
+
+    def share(self):
+        """
+        Turns element into immutable fragment which is referenced (not copied) by parents and encoded once
+        per process. Element should be shared before it's added to other elements.
+        """
+        if not self.is_shared:
+            self._data = share_data(self._data)
+        return self
+
 
 class Card(BaseMixin):
-    json_encoder = card_settings.JSON_ENCODER
+    json_encoder = None
+    json_backend = None
+    html_template = renderers.EMAIL_TEMPLATE
+    signed_html_template = renderers.SIGNED_EMAIL_TEMPLATE
 
     _payload = None
+    _rendered = None
+    _rendered_revision = None
+    # digests of element data {id(data): (data, digest)} valid for _digests_key (see fingerprint)
+    _digests = None
+    _digests_key = None
     card_type = None
+    # payload keys left out of fingerprint
+    volatile_fields = ()
+    # schema defaults removed from compact payload ({element type: {property: default}}, see serializers.compact)
+    compact_defaults = {}
+    compact_type_key = "type"
+    # user data kept as it is
+    compact_skip_keys = ("data", "initializationContext")
+    # payload list which is split into several cards by split()
+    split_key = None
     script_types = {
         MESSAGE_CARD: "application/ld+json",
         ADAPTIVE_CARD: "application/adaptivecard+json"
@@ -43,11 +216,25 @@ class Card(BaseMixin):
         MESSAGE_CARD: "SignedMessageCard",
         ADAPTIVE_CARD: "SignedAdaptiveCard"
     }
+    signed_payload_claims = {
+        MESSAGE_CARD: "messageCardSerialized",
+        ADAPTIVE_CARD: "adaptiveCardSerialized"
+    }
+    # signed payload key and claims, None - SIGNING_* settings
+    signing_key = None
+    signing_key_password = None
+    signing_sender = None
+    signing_originator = None
+    signing_recipients = None
 
     @property
     def payload(self):
         return self.get_payload()
 
+    @property
+    def frozen_payload(self):
+        return self.get_payload(frozen=True)
+
     @property
     def json_payload(self):
         return self.get_payload(fmt="json")
@@ -60,40 +247,433 @@ class Card(BaseMixin):
     def signed_html_payload(self):
         return self.get_payload(fmt="signed_html")
 
-    def get_payload(self, fmt=None):
-        payload = copy.deepcopy(self._payload)
-        if fmt == "json":
-            payload = self._get_json_payload(payload)
-        elif fmt == "html":
-            payload = self._get_html_payload(payload)
+    def get_payload(self, fmt=None, frozen=False, canonical=None, compact=None):
+        """
+        canonical - json/html with canonical json (sorted keys, compact), CANONICAL_JSON setting by default
+        compact - without properties equal to schema defaults and empty lists, COMPACT_PAYLOAD setting by default
+        """
+        compact = self.is_compact(compact)
+        # serialized formats never mutate the payload so they are rendered straight from it
+        if fmt in ("json", "html"):
+            return self._get_rendered_payload(fmt, canonical=self.is_canonical(canonical), compact=compact)
+        elif fmt == "signed_html":
+            return self._get_signed_html_payload()
+        payload = self.compact_payload(self._payload) if compact else self._payload
+        if frozen:
+            return FrozenDict(payload)
+        return materialize(payload)
+
+    def is_canonical(self, canonical=None):
+        if canonical is None:
+            return card_settings.CANONICAL_JSON
+        return canonical
+
+    async def aget_payload(self, fmt=None, frozen=False, canonical=None, compact=None, executor=None):
+        """
+        get_payload() which renders large cards in executor (ASYNC_EXECUTOR setting by default).
+        Already rendered cards and cards known to be small (ASYNC_INLINE_SIZE) are returned inline.
+        """
+        get_payload = functools.partial(self.get_payload, fmt, frozen, canonical, compact)
+        if self.is_rendered_inline(fmt, frozen, canonical, compact):
+            return get_payload()
+        return await run_in_executor(get_payload, executor)
+
+    def is_rendered_inline(self, fmt=None, frozen=False, canonical=None, compact=None):
+        if fmt is None and frozen:
+            return True
         elif fmt == "signed_html":
-            payload = self._get_signed_html_payload()
+            return False
+        rendered = self._get_rendered()
+        lang_code, canonical, compact = self.get_language_code(), self.is_canonical(canonical), self.is_compact(compact)
+        if fmt in ("json", "html") and (fmt, lang_code, canonical, compact) in rendered:
+            return True
+        # size is known when it was estimated or measured (nothing is encoded here)
+        size = rendered.get(("size", lang_code, canonical, compact), get_known_size(self))
+        return size is not None and size <= card_settings.ASYNC_INLINE_SIZE
+
+    def is_compact(self, compact=None):
+        if compact is None:
+            return card_settings.COMPACT_PAYLOAD
+        return compact
+
+    def compact_payload(self, payload):
+        return compact(payload, self.compact_defaults, type_key=self.compact_type_key, skip_keys=self.compact_skip_keys)
+
+    def __getstate__(self):
+        state, slots = super().__getstate__()
+        # digests are cached by id of data, which doesn't survive pickling
+        if state.get("_digests") is not None:
+            state = dict(state, _digests=None, _digests_key=None)
+        return state, slots
+
+    def mark_changed(self):
+        # data could be changed anywhere in the card
+        self._digests = None
+        super().mark_changed()
+
+    def _mark_changed(self, changed=None):
+        self._rendered = None
+        if changed and self._digests:
+            for data in changed:
+                self._digests.pop(id(data), None)
+        super()._mark_changed()
+
+    def _get_rendered(self):
+        # rendered payloads (and fingerprints) are valid until card (or any of its elements) is changed
+        revision, rendered = get_revision(), self._rendered
+        if rendered is None or self._rendered_revision != revision:
+            rendered = self._rendered = {}
+            self._rendered_revision = revision
+        return rendered
+
+    def _get_rendered_payload(self, fmt, encoder=None, canonical=False, compact=False):
+        rendered = self._get_rendered()
+        key = (fmt, self.get_language_code(), canonical, compact)
+        try:
+            return rendered[key]
+        except KeyError:
+            pass
+        if fmt == "json":
+            payload = self.compact_payload(self._payload) if compact else self._payload
+            payload = self._get_json_payload(payload, encoder, canonical)
+        else:
+            payload = self._render_html(self._get_rendered_payload("json", encoder, canonical, compact))
+        rendered[key] = payload
         return payload
 
+    def fingerprint(self):
+        """
+        Stable sha256 of canonical payload (without volatile fields), cached until card is changed.
+        Digests of elements are cached too, so only changed elements (and their parents) are hashed again.
+        """
+        rendered = self._get_rendered()
+        lang_code = self.get_language_code()
+        key = ("fingerprint", lang_code)
+        try:
+            return rendered[key]
+        except KeyError:
+            pass
+        encoder = self.get_encoder(canonical=True)
+        digests_key = ("digest", encoder.__class__, lang_code)
+        if self._digests is None or self._digests_key != (digests_key, get_revision()):
+            self._digests, self._digests_key = {}, (digests_key, get_revision())
+        digests = self._digests
+
+        def reduce(value):
+            # dicts containing dicts/lists are replaced by their digests, others are hashed with their parents
+            if isinstance(value, dict):
+                for item in value.values():
+                    if isinstance(item, (dict, list, CardElement)):
+                        return get_digest(value)
+                return value
+            elif isinstance(value, list):
+                return [reduce(item) for item in value]
+            elif isinstance(value, CardElement):
+                return reduce(value.as_data())
+            return value
+
+        def get_digest(data):
+            # shared elements never change, their digests are kept with their encoded json
+            cache, cache_key = (data.encoded, digests_key) if isinstance(data, SharedData) else (digests, id(data))
+            cached = cache.get(cache_key)
+            if cached is not None and cached[0] is data:
+                return cached[1]
+            digest = hash_data(data)
+            cache[cache_key] = (data, digest)
+            return digest
+
+        def hash_data(data):
+            reduced = {name: reduce(value) for name, value in data.items()}
+            return hashlib.sha256(encoder.encode(normalize(reduced)).encode()).hexdigest()
+
+        payload = self._payload
+        if self.volatile_fields:
+            payload = {key: value for key, value in payload.items() if key not in self.volatile_fields}
+        with encoder.language():
+            fingerprint = hash_data(payload)
+        rendered[key] = fingerprint
+        return fingerprint
+
+    def get_size_data(self):
+        return self._payload
+
+    def get_size(self, canonical=None, compact=None):
+        """
+        Size (bytes) of utf-8 encoded json payload, cached until card is changed
+        """
+        canonical, compact = self.is_canonical(canonical), self.is_compact(compact)
+        rendered = self._get_rendered()
+        key = ("size", self.get_language_code(), canonical, compact)
+        try:
+            return rendered[key]
+        except KeyError:
+            pass
+        size = rendered[key] = len(self._get_rendered_payload("json", canonical=canonical, compact=compact).encode())
+        return size
+
+    def split(self, max_size, header=None, footer=None, canonical=None, compact=None):
+        """
+        Cards with json payload not larger than max_size bytes, split_key items (in order) are spread among them
+        and header/footer items are added to each card. Every item is encoded once, sizes are exact
+        unless get_json_dump_kwargs() adds indentation.
+        """
+        if self.split_key is None:
+            raise CardException("Card can't be split")
+        canonical, compact = self.is_canonical(canonical), self.is_compact(compact)
+        encoder = self.get_encoder(canonical)
+        sizer = Sizer(self.get_json_dumps(encoder, canonical), self.compact_payload if compact else None)
+        with encoder.language():
+            chunks = pack(
+                sizer, sizer.measure_container(self._payload, self.split_key), self._payload.get(self.split_key, []),
+                max_size, self._get_split_items(header), self._get_split_items(footer),
+                functools.partial(self.split_item, sizer)
+            )
+        return [self._copy_with(**{self.split_key: chunk}) for chunk in chunks]
+
+    def split_item(self, sizer, item, max_size):
+        """
+        Smaller items made of item which doesn't fit into a single card (None if item can't be split)
+        """
+        return None
+
+    def _get_split_items(self, items):
+        if items is None:
+            return []
+        elif isinstance(items, (list, set, tuple)):
+            return self._get_items_list(items)
+        return [self._get_item(items)]
+
+    def _copy_with(self, **payload):
+        card = copy.copy(self)
+        # lists/dicts of card are copied so add_* methods of one card don't change the other, items are shared
+        card._payload = {
+            key: value.copy() if value.__class__ in (list, dict) else value
+            for key, value in dict(self._payload, **payload).items()
+        }
+        card._parents = None
+        card._rendered = card._rendered_revision = card._digests = None
+        # changed elements can't be traced to all cards containing them anymore
+        set_parent(self, MANY)
+        return card
+
     def get_signed_payload(self):
-        raise NotImplementedError
+        """
+        RS256 JWS (compact) of get_signing_claims(), see signing.sign_many for bulk signing
+        """
+        key, password = self.get_signing_key()
+        return sign(self.get_signing_claims(), key, password)
+
+    def get_signing_key(self):
+        key = self.signing_key if self.signing_key is not None else card_settings.SIGNING_KEY
+        if key is None:
+            raise ImproperlyConfigured("Signing key is not set (SIGNING_KEY setting or card signing_key)")
+        password = self.signing_key_password
+        if password is None:
+            password = card_settings.SIGNING_KEY_PASSWORD
+        return key, password
+
+    def get_signing_originator(self):
+        return self.signing_originator or card_settings.SIGNING_ORIGINATOR
+
+    def get_fallback_text(self):
+        """
+        Plain text version of card (e.g. email body for clients which don't support actionable messages)
+        """
+        return ""
+
+    def get_signing_claims(self, recipients=None):
+        """
+        recipients - emails the card is sent to (signing_recipients by default)
+        """
+        if recipients is None:
+            recipients = self.signing_recipients
+        sender = self.signing_sender or card_settings.SIGNING_SENDER
+        originator = self.get_signing_originator()
+        if not sender or not originator:
+            raise CardException("Signed payload requires sender and originator")
+        return {
+            "originator": originator,
+            "sender": sender,
+            "recipientsSerialized": json.dumps(list(recipients or [])),
+            self.signed_payload_claims[self.card_type]: self.get_payload(fmt="json"),
+            "iat": int(time.time())
+        }
 
     def get_json_dump_kwargs(self):
         return {}
 
-    def _get_json_payload(self, payload):
-        kwargs = {
-            "cls": self.json_encoder,
-            "lang_code": self.get_language_code()
-        }
-        kwargs.update(**self.get_json_dump_kwargs())
-        return json.dumps(payload, **kwargs)
+    def get_json_encoder(self):
+        if self.json_encoder is not None:
+            return import_setting(self.json_encoder, "JSON_ENCODER")
+        return card_settings.JSON_ENCODER
+
+    def get_json_backend(self):
+        if self.json_backend is not None:
+            return get_backend(self.json_backend)
+        return get_backend(card_settings.JSON_BACKEND)
+
+    def get_encoder(self, canonical=False):
+        if canonical:
+            return self.get_json_encoder()(lang_code=self.get_language_code(), **CANONICAL_DUMP_KWARGS)
+        return self.get_json_encoder()(lang_code=self.get_language_code())
+
+    def get_json_dumps(self, encoder=None, canonical=False):
+        """
+        Returns dumps(obj) callable, encoder language must be handled by caller (encoder.language()).
+        Canonical json needs encoder from get_encoder(canonical=True).
+        """
+        if canonical:
+            if encoder is None:
+                encoder = self.get_encoder(canonical=True)
+            return get_shared_dumps(
+                lambda obj: encoder.encode(normalize(obj)), encoder, ("canonical", encoder.__class__, encoder.lang_code)
+            )
+        dump_kwargs = self.get_json_dump_kwargs()
+        if dump_kwargs:
+            kwargs = {
+                "cls": self.get_json_encoder(),
+                "lang_code": self.get_language_code()
+            }
+            kwargs.update(**dump_kwargs)
+            return functools.partial(json.dumps, **kwargs)
+        if encoder is None:
+            encoder = self.get_encoder()
+        backend = self.get_json_backend()
+        if backend is None:
+            dumps = encoder.encode
+        else:
+            dumps = functools.partial(backend, default=encoder.default)
+        return get_shared_dumps(dumps, encoder, (encoder.__class__, backend, encoder.lang_code))
+
+    def _get_json_payload(self, payload, encoder=None, canonical=False):
+        if encoder is None:
+            encoder = self.get_encoder(canonical)
+        with encoder.language():
+            return self.get_json_dumps(encoder, canonical)(payload)
 
-    def _get_html_payload(self, payload):
+    def iter_json(self, chunk_size=8192):
+        """
+        Yields json payload in chunks of (at least) chunk_size characters, always uses standard json encoder
+        """
+        dump_kwargs = dict(self.get_json_dump_kwargs())
+        encoder_class = dump_kwargs.pop("cls", self.get_json_encoder())
+        encoder = encoder_class(lang_code=self.get_language_code(), **dump_kwargs)
+        buffer, size = [], 0
+        for chunk in encoder.iterencode(self._payload):
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                # don't keep card language active while the chunk is consumed
+                encoder.deactivate_language()
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
+
+    def write_json(self, fp, chunk_size=8192):
+        for chunk in self.iter_json(chunk_size=chunk_size):
+            fp.write(chunk)
+
+    def _get_html_payload(self, payload, encoder=None):
+        return self._render_html(self._get_json_payload(payload, encoder))
+
+    def _render_html(self, json_payload):
         context = {
             "type": self.script_types[self.card_type],
-            "payload": self._get_json_payload(payload)
+            "payload": json_payload
         }
-        return render_to_string("django_actionable_messages/email.html", context=context)
+        return renderers.render(self.html_template, context)
 
     def _get_signed_html_payload(self):
+        return self._render_signed_html(self.get_signed_payload())
+
+    def _render_signed_html(self, signed_payload):
         context = {
             "type": self.signed_card_types[self.card_type],
-            "payload": self.get_signed_payload()
+            "payload": signed_payload
         }
-        return render_to_string("django_actionable_messages/signed_email.html", context=context)
+        return renderers.render(self.signed_html_template, context)
+
+
+def get_executor(executor=None):
+    if executor is None:
+        return card_settings.ASYNC_EXECUTOR
+    return executor
+
+
+async def run_in_executor(func, executor=None):
+    """
+    Runs func in executor (None - event loop default one) with copy of current context and language of the caller
+    (asgiref doesn't pass it to other threads), changes made by func don't leak back
+    """
+    language = translation.get_language()
+
+    def run():
+        with translation.override(language):
+            return func()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(executor), contextvars.copy_context().run, run)
+
+
+def render_many(cards, fmt=None, chunk_size=100, canonical=None, compact=None):
+    """
+    Renders cards (any iterable) lazily, chunk by chunk. Cards in chunk are grouped by language and encoder
+    so each group shares encoder instance and language is activated once per group. Results keep input order.
+    """
+    encoders = {}
+    cards = iter(cards)
+    while True:
+        chunk = list(itertools.islice(cards, chunk_size))
+        if not chunk:
+            return
+        if fmt in ("json", "html"):
+            groups = {}
+            for index, card in enumerate(chunk):
+                key = (card.get_language_code(), card.get_json_encoder(), card.is_canonical(canonical))
+                groups.setdefault(key, []).append(index)
+            results = [None] * len(chunk)
+            for key, indexes in groups.items():
+                lang_code, encoder_class, is_canonical = key
+                try:
+                    encoder = encoders[key]
+                except KeyError:
+                    kwargs = CANONICAL_DUMP_KWARGS if is_canonical else {}
+                    encoder = encoders[key] = encoder_class(lang_code=lang_code, **kwargs)
+                with encoder.language():
+                    for index in indexes:
+                        card = chunk[index]
+                        is_compact = card.is_compact(compact)
+                        results[index] = card._get_rendered_payload(fmt, encoder, is_canonical, is_compact)
+        else:
+            results = [card.get_payload(fmt, canonical=canonical, compact=compact) for card in chunk]
+        yield from results
+
+
+async def arender_many(cards, fmt=None, chunk_size=100, canonical=None, compact=None, executor=None):
+    """
+    Async render_many(), cards (iterable or async iterable) are rendered chunk by chunk in executor.
+    Chunk made only of cards which can be returned inline is rendered in event loop.
+    """
+    if hasattr(cards, "__aiter__"):
+        chunk = []
+        async for card in cards:
+            chunk.append(card)
+            if len(chunk) >= chunk_size:
+                for result in await _arender_chunk(chunk, fmt, canonical, compact, executor):
+                    yield result
+                chunk = []
+        chunks = [chunk] if chunk else []
+    else:
+        cards = iter(cards)
+        chunks = iter(lambda: list(itertools.islice(cards, chunk_size)), [])
+    for chunk in chunks:
+        for result in await _arender_chunk(chunk, fmt, canonical, compact, executor):
+            yield result
+
+
+async def _arender_chunk(chunk, fmt, canonical, compact, executor):
+    def render():
+        return list(render_many(chunk, fmt, len(chunk), canonical, compact))
+    if all(card.is_rendered_inline(fmt, False, canonical, compact) for card in chunk):
+        return render()
+    return await run_in_executor(render, executor)
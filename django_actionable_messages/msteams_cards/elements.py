@@ -2,6 +2,8 @@ from django_actionable_messages.mixins import CardElement
 
 
 class OpenUrl(CardElement):
+    __slots__ = ()
+
     def __init__(self, title: str, url: str, **kwargs) -> None:
         self._data = {
             "type": "openUrl",
@@ -12,6 +14,8 @@ class OpenUrl(CardElement):
 
 
 class Image(CardElement):
+    __slots__ = ()
+
     def __init__(self, url: str, alt: str = None, **kwargs) -> None:
         self._data = {
             "url": url
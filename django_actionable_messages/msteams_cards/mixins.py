@@ -39,7 +39,7 @@ class CardMixin(Card):
         if isinstance(images, (list, set, tuple)):
             self._payload["content"]["images"].extend(self._get_items_list(images))
         else:
-            self._payload["content"]["images"].append(images.as_data())
+            self._payload["content"]["images"].append(self._get_item(images))
 
     def add_buttons(self, buttons) -> None:
         self._payload.setdefault("content", {})
@@ -47,4 +47,4 @@ class CardMixin(Card):
         if isinstance(buttons, (list, set, tuple)):
             self._payload["content"]["buttons"].extend(self._get_items_list(buttons))
         else:
-            self._payload["content"]["buttons"].append(buttons.as_data())
+            self._payload["content"]["buttons"].append(self._get_item(buttons))
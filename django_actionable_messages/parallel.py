@@ -0,0 +1,86 @@
+import collections
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import django
+from django.apps import apps
+from django.utils import translation
+
+from django_actionable_messages.mixins import render_many
+
+
+def init_worker(language: str = None) -> None:
+    """
+    Sets up Django in (spawned) worker process and activates language of the parent process
+    """
+    if not apps.ready:
+        django.setup()
+    if language:
+        translation.activate(language)
+
+
+def render_chunk(task):
+    factory, items, fmt, canonical, compact = task
+    cards = items if factory is None else map(factory, items)
+    return list(render_many(cards, fmt, len(items), canonical, compact))
+
+
+def render_parallel(cards, fmt=None, processes: int = None, chunk_size: int = 100, ordered: bool = True,
+                    factory=None, canonical=None, compact=None, mp_context=None):
+    """
+    Renders cards (any iterable) in a pool of processes, chunk by chunk, with render_many().
+    Chunks are pickled as a single task and at most 2 chunks per process are submitted at once,
+    so large inputs are consumed lazily.
+    factory - importable callable which builds card from each item (cheap spec) in worker, so only specs are pickled
+    ordered - yields payloads in input order, otherwise (index, payload) pairs as chunks are finished
+    Worker processes set up Django (DJANGO_SETTINGS_MODULE) when spawned and use the active language.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    items = iter(cards)
+    tasks = (
+        (factory, chunk, fmt, canonical, compact)
+        for chunk in iter(lambda: list(itertools.islice(items, chunk_size)), [])
+    )
+    if processes <= 1:
+        results = map(render_chunk, tasks)
+        yield from _get_results(results, chunk_size, ordered)
+        return
+    with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context, initializer=init_worker,
+                             initargs=(translation.get_language(),)) as executor:
+        if ordered:
+            yield from _get_ordered_results(executor, tasks, processes * 2)
+        else:
+            yield from _get_unordered_results(executor, tasks, processes * 2, chunk_size)
+
+
+def _get_results(results, chunk_size, ordered):
+    for index, payloads in enumerate(results):
+        if ordered:
+            yield from payloads
+        else:
+            yield from enumerate(payloads, index * chunk_size)
+
+
+def _get_ordered_results(executor, tasks, max_pending):
+    pending = collections.deque()
+    for task in tasks:
+        pending.append(executor.submit(render_chunk, task))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _get_unordered_results(executor, tasks, max_pending, chunk_size):
+    pending = {}
+    tasks = enumerate(tasks)
+    while True:
+        for index, task in itertools.islice(tasks, max_pending - len(pending)):
+            pending[executor.submit(render_chunk, task)] = index * chunk_size
+        if not pending:
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from enumerate(future.result(), pending.pop(future))
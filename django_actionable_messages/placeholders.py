@@ -0,0 +1,105 @@
+import re
+import uuid
+
+from django.utils.functional import Promise
+
+from django_actionable_messages.exceptions import CardException
+
+TOKEN = uuid.uuid4().hex
+NAME_PATTERN = r"[A-Za-z_][A-Za-z0-9_]*"
+# whole json value ("<placeholder>") or placeholder embedded in a longer string
+PLACEHOLDER_RE = re.compile(
+    r'(?<!\\)"\{\{%(token)s:(?P<value>%(name)s)\}\}"|\{\{%(token)s:(?P<text>%(name)s)\}\}' % {
+        "token": TOKEN,
+        "name": NAME_PATTERN
+    }
+)
+
+
+class Placeholder(str):
+    """
+    Value bound later by CardTemplate, can be used as element argument or as part of a string
+    (f"Hello {Placeholder('name')}")
+    """
+
+    def __new__(cls, name: str):
+        if not re.fullmatch(NAME_PATTERN, name):
+            raise CardException(f"Invalid placeholder name: '{name}'")
+        placeholder = super().__new__(cls, "{{%s:%s}}" % (TOKEN, name))
+        placeholder.name = name
+        return placeholder
+
+    def __getnewargs__(self):
+        return (self.name,)
+
+    def __repr__(self):
+        return f"Placeholder({self.name!r})"
+
+
+class CardTemplate:
+    """
+    Card serialized once (with placeholders), rendered many times with different values
+    """
+
+    def __init__(self, card, fmt: str = "json", canonical: bool = None, compact: bool = None) -> None:
+        if fmt not in ("json", "html"):
+            raise CardException("Invalid format. Supported formats are: ('json', 'html')")
+        self.card = card
+        self.fmt = fmt
+        self.canonical = card.is_canonical(canonical)
+        skeleton = card.get_payload(fmt=fmt, canonical=self.canonical, compact=compact)
+        self._segments, self._slots = self._compile(skeleton)
+
+    @property
+    def names(self):
+        return {name for _index, name, _kind in self._slots}
+
+    def _compile(self, skeleton):
+        segments, slots, position = [], [], 0
+        for match in PLACEHOLDER_RE.finditer(skeleton):
+            segments.append(skeleton[position:match.start()])
+            if match.group("value") is None:
+                slots.append((len(segments), match.group("text"), "text"))
+            elif skeleton[match.end():].lstrip().startswith(":"):
+                # dict key is always a json string
+                slots.append((len(segments), match.group("value"), "key"))
+            else:
+                slots.append((len(segments), match.group("value"), "value"))
+            segments.append(None)
+            position = match.end()
+        segments.append(skeleton[position:])
+        return segments, slots
+
+    def _encode(self, name, value, dumps, encoder, kind):
+        if kind == "value":
+            return dumps(value)
+        if value is None or isinstance(value, (dict, list, tuple, set)):
+            raise CardException(f"Placeholder '{name}' is a part of string, its value can't be {type(value).__name__}")
+        if isinstance(value, Promise):
+            # translated to language of the card, like by encoder
+            encoder.activate_language()
+        encoded = dumps(str(value))
+        # inside of json string only string content is needed (like f"{value}")
+        return encoded if kind == "key" else encoded[1:-1]
+
+    def render(self, values: dict = None, **kwargs) -> str:
+        values = dict(values or {}, **kwargs)
+        encoder = self.card.get_encoder(self.canonical)
+        dumps = self.card.get_json_dumps(encoder, self.canonical)
+        parts = list(self._segments)
+        encoded = {}
+        with encoder.language():
+            for index, name, kind in self._slots:
+                key = (name, kind)
+                if key not in encoded:
+                    try:
+                        value = values[name]
+                    except KeyError:
+                        raise CardException(f"Missing value for placeholder '{name}'")
+                    encoded[key] = self._encode(name, value, dumps, encoder, kind)
+                parts[index] = encoded[key]
+        return "".join(parts)
+
+    def render_many(self, values_list):
+        for values in values_list:
+            yield self.render(values)
@@ -0,0 +1,47 @@
+import json
+from typing import Union
+
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.mixins import CardElement
+from django_actionable_messages.shared import get_reference
+
+
+class RawJSON(CardElement):
+    """
+    Already encoded json (element, list of facts...) which is written verbatim into json payloads.
+    It's parsed only when its data is needed (dict payloads, canonical/compact json) or validated.
+    """
+    __slots__ = ("raw", "reference")
+    is_raw = True
+
+    def __init__(self, raw: Union[str, bytes], validate: bool = False, **kwargs) -> None:
+        if isinstance(raw, (bytes, bytearray)):
+            raw = raw.decode()
+        self.raw = raw
+        self.reference = get_reference()
+        self._data = None
+        super().__init__(**kwargs)
+        if validate:
+            self.as_data()
+
+    def as_data(self):
+        if self._data is None:
+            try:
+                self._data = json.loads(self.raw)
+            except ValueError as e:
+                raise CardException(f"Invalid raw json: {e}")
+        return self._data
+
+    def get_size_data(self):
+        # written into payloads as it is
+        return self
+
+    def as_item(self):
+        # kept by reference so serializer can write it as it is
+        return self
+
+    def __reduce__(self):
+        # reference is unique per process (see shared.TOKEN), unpickled json gets a new one
+        state, slots = self.__getstate__()
+        del slots["reference"]
+        return self.__class__, (self.raw,), (state, slots)
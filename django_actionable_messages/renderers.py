@@ -0,0 +1,74 @@
+import os
+
+from django.core.signals import setting_changed
+from django.template.loader import get_template
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+
+EMAIL_TEMPLATE = "django_actionable_messages/email.html"
+SIGNED_EMAIL_TEMPLATE = "django_actionable_messages/signed_email.html"
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+
+def render_email(context):
+    return mark_safe(
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8">'
+        f'<script type="{conditional_escape(context["type"])}">{context["payload"]}</script></head></html>'
+    )
+
+
+def render_signed_email(context):
+    card_type = conditional_escape(context["type"])
+    return mark_safe(
+        f'<section itemscope itemtype="http://schema.org/{card_type}">\n'
+        f'    <meta itemprop="@context" content="http://schema.org/extensions" />\n'
+        f'    <meta itemprop="@type" content="{card_type}" />\n'
+        f'    <div itemprop="{card_type}" style="mso-hide:all;display:none;max-height:0px;overflow:hidden;">'
+        f'{conditional_escape(context["payload"])}</div>\n'
+        f'</section>'
+    )
+
+
+# string builders producing the same output as bundled templates
+BUILTIN_RENDERERS = {
+    EMAIL_TEMPLATE: render_email,
+    SIGNED_EMAIL_TEMPLATE: render_signed_email
+}
+
+_renderers = {}
+
+
+def get_renderer(template_name):
+    """
+    Template is looked up once per process, bundled templates are replaced by string builders
+    (unless project overrides them)
+    """
+    try:
+        return _renderers[template_name]
+    except KeyError:
+        pass
+    template = get_template(template_name)
+    origin = getattr(template, "origin", None)
+    if template_name in BUILTIN_RENDERERS and origin is not None and \
+            os.path.normpath(origin.name) == os.path.normpath(os.path.join(TEMPLATES_DIR, template_name)):
+        renderer = BUILTIN_RENDERERS[template_name]
+    else:
+        renderer = template.render
+    _renderers[template_name] = renderer
+    return renderer
+
+
+def render(template_name, context):
+    return get_renderer(template_name)(context)
+
+
+def clear_renderers():
+    _renderers.clear()
+
+
+def reload_renderers(*args, **kwargs):
+    if kwargs["setting"] in ("TEMPLATES", "INSTALLED_APPS"):
+        clear_renderers()
+
+
+setting_changed.connect(reload_renderers)
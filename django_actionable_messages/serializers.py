@@ -0,0 +1,144 @@
+import functools
+import json
+from enum import Enum
+
+from django.core.exceptions import ImproperlyConfigured
+
+STDLIB_BACKEND = "json"
+# canonical json: sorted keys, compact separators, utf-8 (RFC 8785 like, always encoded by standard json)
+CANONICAL_DUMP_KWARGS = {
+    "sort_keys": True,
+    "separators": (",", ":"),
+    "ensure_ascii": False
+}
+# larger floats are kept as they are (their integer representation would be too long)
+MAX_SAFE_INTEGER = 2 ** 53
+
+
+def orjson_backend():
+    import orjson
+
+    # datetimes are passed to the encoder so they are formatted the same way as by DjangoJSONEncoder
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj, default):
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except TypeError:
+            # integers larger than 64 bits can't be encoded by orjson (other errors are raised again)
+            return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+    return dumps
+
+
+# ujson and msgspec encode Decimal/datetime natively in other way than DjangoJSONEncoder (without any hook)
+BACKENDS = {
+    "orjson": orjson_backend
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_backend(name):
+    """
+    Returns dumps(obj, default) callable or None when the standard library json module should be used
+    """
+    if name is None or name == STDLIB_BACKEND:
+        return None
+    elif callable(name):
+        return name
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ImproperlyConfigured(f"Invalid JSON backend: '{name}'. Available backends are: "
+                                   f"{(STDLIB_BACKEND, *BACKENDS)}")
+    try:
+        return backend()
+    except ImportError:
+        return None
+
+
+def normalize(value):
+    """
+    Payload data for canonical json, integral floats are replaced by ints and enums by their values
+    (str/int enums are already encoded as values). Dicts/lists are copied only when something inside of them
+    is replaced. Shared elements are kept (they are normalized once when encoded).
+    """
+    value_type = type(value)
+    if value_type is str or value_type is int or value_type is bool or value is None:
+        return value
+    elif isinstance(value, dict):
+        result = None
+        for key, item in value.items():
+            normalized = normalize(item)
+            if normalized is not item:
+                if result is None:
+                    result = dict(value)
+                result[key] = normalized
+        return value if result is None else result
+    elif isinstance(value, list):
+        result = None
+        for index, item in enumerate(value):
+            normalized = normalize(item)
+            if normalized is not item:
+                if result is None:
+                    result = list(value)
+                result[index] = normalized
+        return value if result is None else result
+    elif isinstance(value, float):
+        if value.is_integer() and -MAX_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER:
+            return int(value)
+        return value
+    elif isinstance(value, Enum):
+        return value if isinstance(value, (str, int)) else value.value
+    elif hasattr(value, "as_data") and not getattr(value, "is_shared", False):
+        return normalize(value.as_data())
+    return value
+
+
+def is_default(value, default):
+    if isinstance(default, bool):
+        return value is default
+    return value == default and not isinstance(value, bool)
+
+
+def compact(value, defaults, type_key="type", skip_keys=("data", "initializationContext")):
+    """
+    Payload data without properties equal to defaults ({element type (None - any element): {property: default}}).
+    With type_key None defaults[None] apply to every object. Values of skip_keys (user data) are kept as they are.
+    Dicts/lists are copied only when something inside of them is removed.
+    """
+    if isinstance(value, dict):
+        if type_key is None:
+            element_defaults = defaults.get(None, {})
+        elif type_key in value:
+            element_defaults = dict(defaults.get(None, {}), **defaults.get(value[type_key], {}))
+        else:
+            element_defaults = {}
+        result = None
+        for key, item in value.items():
+            if key in element_defaults and is_default(item, element_defaults[key]):
+                if result is None:
+                    result = dict(value)
+                del result[key]
+                continue
+            elif key in skip_keys:
+                continue
+            compacted = compact(item, defaults, type_key, skip_keys)
+            if compacted is not item:
+                if result is None:
+                    result = dict(value)
+                result[key] = compacted
+        return value if result is None else result
+    elif isinstance(value, list):
+        result = None
+        for index, item in enumerate(value):
+            compacted = compact(item, defaults, type_key, skip_keys)
+            if compacted is not item:
+                if result is None:
+                    result = list(value)
+                result[index] = compacted
+        return value if result is None else result
+    elif hasattr(value, "as_data"):
+        data = value.as_data()
+        compacted = compact(data, defaults, type_key, skip_keys)
+        return value if compacted is data else compacted
+    return value
@@ -1,3 +1,5 @@
+import functools
+
 from django.conf import settings
 from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
@@ -7,10 +9,21 @@ from django_actionable_messages.encoders import BaseEncoder
 SETTINGS_NAMESPACE = "ACTIONABLE_MESSAGES"
 DEFAULTS = {
     "JSON_ENCODER": BaseEncoder,
-    "LANGUAGE_CODE": settings.LANGUAGE_CODE
+    "JSON_BACKEND": "json",
+    "LANGUAGE_CODE": settings.LANGUAGE_CODE,
+    "LAZY_ELEMENTS": False,
+    "CANONICAL_JSON": False,
+    "COMPACT_PAYLOAD": False,
+    "SIGNING_KEY": None,
+    "SIGNING_KEY_PASSWORD": None,
+    "SIGNING_SENDER": None,
+    "SIGNING_ORIGINATOR": None,
+    "ASYNC_EXECUTOR": None,
+    "ASYNC_INLINE_SIZE": 16384
 }
 
 
+@functools.lru_cache(maxsize=None)
 def import_from_string(value, name):
     try:
         return import_string(value)
@@ -21,12 +34,15 @@ def import_from_string(value, name):
 def import_setting(value, name):
     if value is None:
         return None
-    elif name == "JSON_ENCODER" and isinstance(value, str):
+    elif name in ("JSON_ENCODER", "ASYNC_EXECUTOR") and isinstance(value, str):
         return import_from_string(value, name)
     return value
 
 
 class CardSettings:
+    def __init__(self):
+        self._cached_attrs = set()
+
     def __getattr__(self, attr):
         if attr not in DEFAULTS:
             raise AttributeError(f"Invalid setting: '{attr}'")
@@ -34,7 +50,11 @@ class CardSettings:
             value = self.user_settings[attr]
         except KeyError:
             value = DEFAULTS[attr]
-        return import_setting(value, attr)
+        value = import_setting(value, attr)
+        # cache the result, next lookups won't reach __getattr__
+        self._cached_attrs.add(attr)
+        setattr(self, attr, value)
+        return value
 
     @property
     def user_settings(self):
@@ -43,6 +63,9 @@ class CardSettings:
         return self._user_settings
 
     def reload_user_settings(self):
+        for attr in self._cached_attrs:
+            delattr(self, attr)
+        self._cached_attrs.clear()
         if hasattr(self, "_user_settings"):
             delattr(self, "_user_settings")
 
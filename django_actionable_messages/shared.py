@@ -0,0 +1,104 @@
+import copy
+import itertools
+import re
+import uuid
+
+from django_actionable_messages.exceptions import CardException
+
+TOKEN = uuid.uuid4().hex
+REFERENCE_RE = re.compile(r'"(%s:\d+)"' % TOKEN)
+
+_ids = itertools.count(1)
+
+
+def get_reference() -> str:
+    """
+    Unique string written by encoder in place of fragment (shared element or raw json)
+    """
+    return f"{TOKEN}:{next(_ids)}"
+
+
+def _immutable(self, *args, **kwargs):
+    raise CardException("Shared element can't be modified")
+
+
+class SharedData(dict):
+    """
+    Read-only data of shared element, encoded json is cached here (per encoder/backend/language)
+    """
+    __slots__ = ("reference", "encoded")
+
+    def __init__(self, data) -> None:
+        super().__init__(data)
+        self.reference = get_reference()
+        self.encoded = {}
+
+    __setitem__ = __delitem__ = setdefault = update = pop = popitem = clear = __ior__ = _immutable
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class SharedList(list):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+
+def share_data(value):
+    """
+    Read-only copy of element data, nested shared elements and raw json are kept by reference
+    """
+    if getattr(value, "is_shared", False) or getattr(value, "is_raw", False):
+        return value
+    elif hasattr(value, "as_data"):
+        value = value.as_data()
+    if isinstance(value, dict):
+        return SharedData({key: share_data(item) for key, item in value.items()})
+    elif isinstance(value, list):
+        return SharedList(share_data(item) for item in value)
+    return value
+
+
+def get_shared_dumps(dumps, encoder, key):
+    """
+    Wraps dumps(obj) so shared elements (encoded by encoder as references) are encoded once per key and spliced in,
+    raw json fragments (strings) are spliced as they are
+    """
+    def shared_dumps(obj):
+        previous = encoder.fragments
+        fragments = encoder.fragments = {}
+        try:
+            result = dumps(obj)
+        finally:
+            encoder.fragments = previous
+        if not fragments:
+            return result
+        return REFERENCE_RE.sub(lambda match: encode_fragment(fragments[match.group(1)]), result)
+
+    def encode_fragment(data):
+        if isinstance(data, str):
+            return data
+        try:
+            return data.encoded[key]
+        except KeyError:
+            pass
+        encoded = data.encoded[key] = shared_dumps(data)
+        return encoded
+    return shared_dumps
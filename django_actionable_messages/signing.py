@@ -0,0 +1,115 @@
+import base64
+import contextlib
+import functools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.exceptions import ImproperlyConfigured
+
+JWS_HEADER = {"alg": "RS256", "typ": "JWT"}
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def dumps(value) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def load_private_key(key, password=None):
+    """
+    Parsed RSA private key, key is PEM (str/bytes), path to PEM file or already loaded key.
+    Keys are loaded once per process.
+    """
+    if hasattr(key, "sign"):
+        return key
+    try:
+        from cryptography.hazmat.primitives import serialization
+    except ImportError:
+        raise ImproperlyConfigured("Signing cards requires 'cryptography' library")
+    if isinstance(key, str):
+        if key.lstrip().startswith("-----BEGIN"):
+            key = key.encode()
+        else:
+            with open(key, "rb") as f:
+                key = f.read()
+    if isinstance(password, str):
+        password = password.encode()
+    return serialization.load_pem_private_key(key, password=password)
+
+
+def sign(claims: dict, key, password=None) -> str:
+    """
+    Compact RS256 JWS of claims
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    private_key = load_private_key(key, password)
+    signing_input = f"{b64url(dumps(JWS_HEADER))}.{b64url(dumps(claims))}"
+    signature = private_key.sign(signing_input.encode(), padding.PKCS1v15(), hashes.SHA256())
+    return f"{signing_input}.{b64url(signature)}"
+
+
+def _sign_task(task):
+    return sign(*task)
+
+
+def get_picklable_key(key, password=None) -> tuple:
+    """
+    Key and password which can be sent to worker processes, already loaded keys are serialized to PEM
+    """
+    if not hasattr(key, "private_bytes"):
+        return key, password
+    from cryptography.hazmat.primitives import serialization
+
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ), None
+
+
+def sign_many(cards, html: bool = False, processes: int = None, chunk_size: int = 16, recipients=None,
+              executor=None):
+    """
+    Signs cards (any iterable) in a pool of processes, yields signed payloads (signed html if html is True)
+    in input order. Claims (card json) are built in the current process, workers only sign them
+    and load each key once.
+    recipients - recipients of each card (card signing_recipients are used for None)
+    executor - process pool used instead of a new one (so workers with loaded keys are reused by many calls)
+    """
+    cards = list(cards)
+    if recipients is None:
+        recipients = [None] * len(cards)
+    else:
+        recipients = list(recipients)
+        if len(recipients) != len(cards):
+            raise ValueError(f"Number of recipients ({len(recipients)}) doesn't match number of cards ({len(cards)})")
+    tasks = [
+        (card.get_signing_claims(card_recipients), *card.get_signing_key())
+        for card, card_recipients in zip(cards, recipients)
+    ]
+    if executor is None:
+        if processes is None:
+            processes = os.cpu_count() or 1
+        processes = min(processes, len(tasks))
+        if processes <= 1:
+            results = map(_sign_task, tasks)
+            yield from _get_results(cards, results, html)
+            return
+    keys = {}
+    for index, (claims, key, password) in enumerate(tasks):
+        if (id(key), password) not in keys:
+            keys[id(key), password] = get_picklable_key(key, password)
+        tasks[index] = (claims, *keys[id(key), password])
+    pool = ProcessPoolExecutor(max_workers=processes) if executor is None else contextlib.nullcontext(executor)
+    with pool as executor:
+        results = executor.map(_sign_task, tasks, chunksize=chunk_size)
+        yield from _get_results(cards, results, html)
+
+
+def _get_results(cards, results, html):
+    for card, signed_payload in zip(cards, results):
+        yield card._render_signed_html(signed_payload) if html else signed_payload
@@ -0,0 +1,213 @@
+import functools
+
+from django_actionable_messages.settings import card_settings
+
+# set once any size is estimated, until then add_*/set_* methods skip size accounting
+_active = False
+# ids of elements/cards inside of add_* methods (nested add_* calls are accounted by the outermost one)
+_updating = set()
+# estimated sizes of older epochs are unknown (changed when a change can't be traced to its cards, see MANY)
+_epoch = 0
+
+
+class Many:
+    def __repr__(self):
+        return "MANY"
+
+
+# parent of element added more than once (or card which items are shared with cards split from it)
+MANY = Many()
+
+
+class Tracked:
+    """
+    Parent and estimated size, kept in _parents of elements/cards which size was estimated
+    """
+    __slots__ = ("parent", "size", "epoch")
+
+    def __init__(self, parent, size: int) -> None:
+        self.parent = parent
+        self.size = size
+        self.epoch = _epoch
+
+
+def get_parent(obj):
+    # elements can be changed before BaseMixin.__init__()
+    parent = getattr(obj, "_parents", None)
+    if parent.__class__ is Tracked:
+        return parent.parent
+    return parent
+
+
+def set_parent(obj, parent) -> None:
+    if obj._parents.__class__ is Tracked:
+        obj._parents.parent = parent
+    else:
+        obj._parents = parent
+
+
+def add_parent(item, parent) -> None:
+    # the only parent is kept (by reference), elements added more than once get MANY
+    if item._parents is None:
+        item._parents = parent
+        return
+    current = get_parent(item)
+    if current is None:
+        set_parent(item, parent)
+    elif current is not MANY:
+        set_parent(item, MANY)
+    if item._parents.__class__ is Tracked:
+        # size was estimated in language of element (or its previous card)
+        item._parents.size = None
+
+
+def get_ancestors(obj):
+    """
+    obj and elements/cards containing it, MANY is the last one when cards containing obj can't be found
+    """
+    while obj is not None:
+        yield obj
+        if obj is MANY:
+            return
+        obj = get_parent(obj)
+
+
+def get_encoder(obj):
+    """
+    Encoder of card containing obj (elements are encoded with encoder and language of their card)
+    """
+    *_, root = get_ancestors(obj)
+    if root is MANY:
+        root = obj
+    encoder_class = root.get_json_encoder() if hasattr(root, "get_json_encoder") else card_settings.JSON_ENCODER
+    return encoder_class(lang_code=root.get_language_code())
+
+
+def measure(encoder, value) -> int:
+    previous = encoder.fragments
+    fragments = encoder.fragments = {}
+    try:
+        with encoder.language():
+            size = len(encoder.encode(value))
+    finally:
+        encoder.fragments = previous
+    # raw json and shared elements are written as "<reference>" and spliced in (see shared.get_shared_dumps)
+    for reference, data in fragments.items():
+        size += (len(data) if isinstance(data, str) else measure(encoder, data)) - len(reference) - 2
+    return size
+
+
+def get_known_size(obj):
+    """
+    Estimated size of obj if it's known (None otherwise)
+    """
+    tracked = getattr(obj, "_parents", None)
+    if tracked.__class__ is Tracked and tracked.epoch == _epoch:
+        return tracked.size
+    return None
+
+
+def set_size(obj, size) -> None:
+    tracked = obj._parents
+    if tracked.__class__ is Tracked:
+        tracked.size, tracked.epoch = size, _epoch
+    elif size is not None:
+        obj._parents = Tracked(tracked, size)
+
+
+def get_estimated_size(obj) -> int:
+    global _active
+    size = get_known_size(obj)
+    if size is None:
+        _active = True
+        size = measure(get_encoder(obj), obj.get_size_data())
+        set_size(obj, size)
+    return size
+
+
+def is_estimated(obj) -> bool:
+    """
+    Is size of obj or any element/card containing it estimated
+    """
+    return any(parent is MANY or get_known_size(parent) is not None for parent in get_ancestors(obj))
+
+
+def update_size(obj, delta) -> None:
+    """
+    Adds delta (None - unknown change) to estimated sizes of obj and elements/cards containing it
+    """
+    global _epoch
+    for parent in get_ancestors(obj):
+        if parent is MANY:
+            _epoch += 1
+            return
+        size = get_known_size(parent)
+        if size is not None:
+            set_size(parent, None if delta is None else size + delta)
+
+
+def snapshot(data: dict) -> dict:
+    return {key: (value, len(value) if isinstance(value, list) else None) for key, value in data.items()}
+
+
+def get_size_delta(encoder, before: dict, data: dict):
+    """
+    Size change of data since before snapshot (None if it can't be computed from added values)
+    """
+    if any(key not in data for key in before):
+        return None
+    delta, count = 0, len(before)
+    separator = len(encoder.item_separator)
+    for key, value in data.items():
+        try:
+            previous, length = before[key]
+        except KeyError:
+            # '"key": value' and separator from previous property
+            delta += measure(encoder, {key: value}) - 2 + (separator if count else 0)
+            count += 1
+            continue
+        if previous is not value:
+            return None
+        elif length is not None and len(value) != length:
+            if len(value) < length:
+                return None
+            delta += measure(encoder, value[length:]) - 2 + (separator if length else 0)
+    return delta
+
+
+def is_active() -> bool:
+    return _active
+
+
+def invalidates_size(method):
+    """
+    Wraps set_* method so estimated sizes are invalidated
+    """
+    @functools.wraps(method)
+    def wrapper(obj, *args, **kwargs):
+        result = method(obj, *args, **kwargs)
+        update_size(obj, None)
+        return result
+    return wrapper
+
+
+def tracks_size(method):
+    """
+    Wraps add_* method so estimated sizes are updated with size of added values (used once any size is estimated)
+    """
+    @functools.wraps(method)
+    def wrapper(obj, *args, **kwargs):
+        if id(obj) in _updating or not is_estimated(obj):
+            return method(obj, *args, **kwargs)
+        before = snapshot(obj.get_size_data())
+        _updating.add(id(obj))
+        try:
+            result = method(obj, *args, **kwargs)
+        except BaseException:
+            update_size(obj, None)
+            raise
+        finally:
+            _updating.discard(id(obj))
+        update_size(obj, get_size_delta(get_encoder(obj), before, obj.get_size_data()))
+        return result
+    return wrapper
@@ -0,0 +1,56 @@
+from django_actionable_messages.exceptions import CardException
+
+
+class Sizer:
+    """
+    Measures utf-8 encoded json size of payload parts, every part is encoded once
+    """
+
+    def __init__(self, dumps, transform=None) -> None:
+        self.dumps = dumps
+        self.transform = transform
+        self.separator = self.measure([0, 0]) - self.measure([]) - 2 * self.measure(0)
+
+    def measure(self, value) -> int:
+        if self.transform is not None:
+            value = self.transform(value)
+        return len(self.dumps(value).encode())
+
+    def measure_container(self, data: dict, key: str) -> int:
+        """
+        Size of data with empty list under key
+        """
+        # list with a single item isn't dropped by compaction
+        return self.measure(dict(data, **{key: [0]})) - self.measure(0)
+
+    def get_size(self, base_size: int, sizes: list) -> int:
+        return base_size + sum(sizes) + self.separator * max(len(sizes) - 1, 0)
+
+
+def pack(sizer, base_size, items, max_size, header=(), footer=(), split_item=None):
+    """
+    Groups items (in order) into chunks so base_size container with header + chunk + footer items fits into max_size.
+    Items too large for a single chunk are passed to split_item(item, max_item_size) which returns smaller items.
+    """
+    fixed = [sizer.measure(item) for item in (*header, *footer)]
+    # size left for chunk items, separator between chunk and header/footer included in each item
+    budget = max_size - sizer.get_size(base_size, fixed) - (sizer.separator if fixed else 0)
+    chunks, chunk, used = [], [], 0
+    for item in items:
+        size = sizer.measure(item)
+        if size > budget:
+            parts = split_item(item, budget) if split_item is not None else None
+            if not parts:
+                raise CardException(f"Item of {size} bytes doesn't fit into {max_size} bytes")
+            sized_parts = [(part, sizer.measure(part)) for part in parts]
+        else:
+            sized_parts = [(item, size)]
+        for part, size in sized_parts:
+            if chunk and used + sizer.separator + size > budget:
+                chunks.append(chunk)
+                chunk, used = [], 0
+            used += size + (sizer.separator if chunk else 0)
+            chunk.append(part)
+    if chunk or not chunks:
+        chunks.append(chunk)
+    return [[*header, *chunk, *footer] for chunk in chunks]
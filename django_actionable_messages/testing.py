@@ -0,0 +1,94 @@
+import asyncio
+import json
+
+from django_actionable_messages.delivery import read_headers
+
+
+class FakeWebhookServer:
+    """
+    Local HTTP/1.1 webhook (like Teams incoming webhook) for tests and benchmarks.
+    Records posted payloads, keeps connections alive (unless keep_alive is False) and answers
+    pipelined requests in order.
+    """
+
+    def __init__(self, status: int = 200, body: bytes = b"1", delay: float = 0, keep_alive: bool = True,
+                 chunked: bool = False, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.status = status
+        self.body = body
+        self.delay = delay
+        self.keep_alive = keep_alive
+        self.chunked = chunked
+        self.host = host
+        self.port = port
+        self.requests = []
+        self.connections = 0
+        self.open_connections = 0
+        self.max_open_connections = 0
+        self._server = None
+        self._handlers = {}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/webhook"
+
+    @property
+    def payloads(self):
+        return [json.loads(body) for _, _, body in self.requests]
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            for writer in self._handlers.values():
+                writer.close()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader, writer):
+        self._handlers[asyncio.current_task()] = writer
+        self.connections += 1
+        self.open_connections += 1
+        self.max_open_connections = max(self.max_open_connections, self.open_connections)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = await read_headers(reader)
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((request_line.decode().split()[1], headers, body))
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                writer.write(self.get_response())
+                await writer.drain()
+                if not self.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._handlers[asyncio.current_task()]
+            self.open_connections -= 1
+            writer.close()
+
+    def get_response(self) -> bytes:
+        headers = [f"HTTP/1.1 {self.status} Status", "Content-Type: text/plain"]
+        if not self.keep_alive:
+            headers.append("Connection: close")
+        if self.chunked:
+            headers.append("Transfer-Encoding: chunked")
+            body = b"%x\r\n%s\r\n0\r\n\r\n" % (len(self.body), self.body) if self.body else b"0\r\n\r\n"
+        else:
+            headers.append(f"Content-Length: {len(self.body)}")
+            body = self.body
+        return "\r\n".join(headers).encode() + b"\r\n\r\n" + body
@@ -5,7 +5,7 @@ with open("README.md", "r") as f:
 
 setup(
     name="django_actionable_messages",
-    packages=find_packages(exclude=["examples", "examples.*", "tests", "tests.*"]),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "examples", "examples.*", "tests", "tests.*"]),
     include_package_data=True,
     version="0.2.7",
     license="MIT",
@@ -15,11 +15,14 @@ setup(
     author="utsurius",
     author_email="przemek@upsecure.pl",
     url="https://github.com/utsurius/django-actionable-messages",
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     keywords=["msteams", "AdaptiveCard", "MessageCard", "HeroCard", "ThumbnailCard", "actionable messages"],
     install_requires=[
         "django>=3.2.0",
     ],
+    extras_require={
+        "signing": ["cryptography>=3.1"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Environment :: Web Environment",
@@ -32,7 +35,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -0,0 +1,102 @@
+import json
+import threading
+
+from django.test import TestCase
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.actions import OpenUrl
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Fact, FactSet
+from django_actionable_messages.adaptive_card.elements import RichTextBlock, TextRun
+from django_actionable_messages.adaptive_card.inputs import ChoiceSetInput, InputChoice
+from django_actionable_messages.adaptive_card.mixins import get_intern_key, interning, _interning_pool
+from django_actionable_messages.adaptive_card.utils import FontWeight, SpacingStyle
+from django_actionable_messages.exceptions import CardException
+
+
+def get_card():
+    card = AdaptiveCard()
+    card.add_elements([
+        FactSet([Fact("Status", "Open"), Fact("Status", "Open"), Fact("Status", "Done")]),
+        RichTextBlock([TextRun("Open", weight=FontWeight.BOLDER), TextRun("Open", weight=FontWeight.BOLDER)]),
+        ChoiceSetInput([InputChoice("Open", "1"), InputChoice("Done", "2")])
+    ])
+    return card
+
+
+class InterningTestCase(TestCase):
+    def test_interning(self):
+        with interning() as pool:
+            fact_set = FactSet([Fact("Status", "Open"), Fact("Status", "Open"), Fact("Status", "Done")])
+            facts = fact_set.as_data()["facts"]
+            self.assertIs(facts[0], facts[1])
+            self.assertIsNot(facts[0], facts[2])
+            other = FactSet([Fact("Status", "Open")])
+            self.assertIs(other.as_data()["facts"][0], facts[0])
+            self.assertEqual(len(pool), 2)
+        self.assertIsNot(FactSet([Fact("Status", "Open")]).as_data()["facts"][0], facts[0])
+
+    def test_not_active(self):
+        fact = Fact("Status", "Open")
+        self.assertIs(FactSet([fact]).as_data()["facts"][0], fact.as_item())
+
+    def test_nested(self):
+        with interning() as pool:
+            with interning() as inner_pool:
+                self.assertIs(inner_pool, pool)
+            self.assertIs(_interning_pool.get(), pool)
+        self.assertIsNone(_interning_pool.get())
+
+    def test_threads(self):
+        pools = []
+        with interning():
+            thread = threading.Thread(target=lambda: pools.append(_interning_pool.get()))
+            thread.start()
+            thread.join()
+        self.assertEqual(pools, [None])
+
+    def test_payload(self):
+        card = get_card()
+        with interning():
+            interned_card = get_card()
+        self.assertEqual(interned_card.payload, card.payload)
+        self.assertEqual(json.loads(interned_card.json_payload), json.loads(card.json_payload))
+        self.assertEqual(interned_card.frozen_payload, card.frozen_payload)
+
+    def test_read_only(self):
+        fact = Fact("Status", "Open")
+        with interning():
+            fact_set = FactSet([fact])
+        with self.assertRaises(CardException):
+            fact_set.as_data()["facts"][0]["value"] = "Done"
+        self.assertEqual(fact.as_data(), {"title": "Status", "value": "Open"})
+
+    def test_changed_after_added(self):
+        text_run = TextRun("Open")
+        with interning():
+            block = RichTextBlock([text_run])
+        self.assertTrue(text_run.is_shared)
+        with self.assertRaisesMessage(CardException, "Shared element can't be modified"):
+            text_run.set_italic(True)
+        self.assertEqual(block.as_data()["inlines"][0], {"type": "TextRun", "text": "Open"})
+        self.assertEqual(text_run.as_data(), {"type": "TextRun", "text": "Open"})
+
+    def test_key(self):
+        self.assertEqual(get_intern_key({"a": [1, "b"]}), get_intern_key({"a": [1, "b"]}))
+        self.assertNotEqual(get_intern_key({"a": 1, "b": 2}), get_intern_key({"b": 2, "a": 1}))
+        self.assertNotEqual(get_intern_key({"a": 1}), get_intern_key({"a": True}))
+        self.assertNotEqual(get_intern_key({"a": 1}), get_intern_key({"a": 1.0}))
+        self.assertNotEqual(get_intern_key({"a": "none"}), get_intern_key({"a": SpacingStyle.NONE}))
+        text, other_text = _("text"), _("text")
+        self.assertEqual(get_intern_key({"a": text}), get_intern_key({"a": text}))
+        self.assertNotEqual(get_intern_key({"a": text}), get_intern_key({"a": other_text}))
+
+    def test_nested_elements(self):
+        with interning():
+            block = RichTextBlock([
+                TextRun("link", select_action=OpenUrl("https://www.example.com/")),
+                TextRun("link", select_action=OpenUrl("https://www.example.com/"))
+            ])
+        inlines = block.as_data()["inlines"]
+        self.assertIs(inlines[0], inlines[1])
+        self.assertEqual(inlines[0]["selectAction"], {"type": "Action.OpenUrl", "url": "https://www.example.com/"})
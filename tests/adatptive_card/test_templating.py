@@ -0,0 +1,217 @@
+import json
+
+from django.test import TestCase
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Container, Fact, FactSet
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.adaptive_card.templating import (
+    UNDEFINED, Scope, bind, clear_templates, compile_expression, compile_template, expand, split_bindings
+)
+from django_actionable_messages.exceptions import CardException
+
+
+def evaluate(source, data=None, root=None, index=None):
+    return compile_expression(source)(Scope(data, root, index=index))
+
+
+class ExpressionsTestCase(TestCase):
+    def test_literals(self):
+        self.assertEqual(evaluate("1"), 1)
+        self.assertEqual(evaluate("1.5"), 1.5)
+        self.assertEqual(evaluate("'text'"), "text")
+        self.assertEqual(evaluate('"it\\"s"'), 'it"s')
+        self.assertIs(evaluate("true"), True)
+        self.assertIs(evaluate("false"), False)
+        self.assertIsNone(evaluate("null"))
+
+    def test_operators(self):
+        self.assertEqual(evaluate("1 + 2 * 3"), 7)
+        self.assertEqual(evaluate("(1 + 2) * 3"), 9)
+        self.assertEqual(evaluate("7 / 2"), 3)
+        self.assertEqual(evaluate("7.0 / 2"), 3.5)
+        self.assertEqual(evaluate("7 % 4 - -1"), 4)
+        self.assertEqual(evaluate("'a' + 1"), "a1")
+        self.assertEqual(evaluate("'a' & true"), "atrue")
+        self.assertIs(evaluate("1 < 2 && 2 <= 2 && 3 > 2 && 3 >= 4"), False)
+        self.assertIs(evaluate("1 == 2 || 1 != 2"), True)
+        self.assertIs(evaluate("!(1 == 1)"), False)
+
+    def test_properties(self):
+        data = {"user": {"name": "Jane", "tags": ["a", "b"]}, "first name": "J"}
+        self.assertEqual(evaluate("user.name", data), "Jane")
+        self.assertEqual(evaluate("user.tags[1]", data), "b")
+        self.assertEqual(evaluate("$data['first name']", data), "J")
+        self.assertEqual(evaluate("$root.value", data, {"value": 1}), 1)
+        self.assertEqual(evaluate("$index", index=2), 2)
+        self.assertIs(evaluate("user.missing.name", data), UNDEFINED)
+        self.assertIs(evaluate("user.tags[5]", data), UNDEFINED)
+        self.assertIs(evaluate("user.name.upper", data), UNDEFINED)
+
+    def test_functions(self):
+        data = {"items": [1, 5, 3], "name": "Jane", "price": 1234.5, "flag": False}
+        self.assertEqual(evaluate("if(flag, 'yes', 'no')", data), "no")
+        self.assertEqual(evaluate("count(items)", data), 3)
+        self.assertEqual(evaluate("max(items)", data), 5)
+        self.assertEqual(evaluate("min(2, 1)", data), 1)
+        self.assertEqual(evaluate("toUpper(name)", data), "JANE")
+        self.assertEqual(evaluate("concat(name, ' ', length(name))", data), "Jane 4")
+        self.assertEqual(evaluate("formatNumber(price, 2)", data), "1,234.50")
+        self.assertEqual(evaluate("join(items, ', ')", data), "1, 5, 3")
+        self.assertEqual(evaluate("coalesce(missing, null, name)", data), "Jane")
+        self.assertIs(evaluate("and(true, not(flag))", data), True)
+        self.assertIs(evaluate("or(flag, empty(items))", data), False)
+        self.assertIs(evaluate("empty(missing)", data), True)
+        self.assertIs(evaluate("contains(items, 5)", data), True)
+
+    def test_evaluation_error(self):
+        self.assertIs(evaluate("name * 'a'", {"name": "Jane"}), UNDEFINED)
+        self.assertIs(evaluate("1 / 0"), UNDEFINED)
+
+    def test_invalid_expression(self):
+        for source in ("1 +", "(1", "a.", "unknown(1)", "if(1, 2)", "1 2", "#"):
+            with self.assertRaises(CardException):
+                compile_expression(source)
+
+    def test_split_bindings(self):
+        self.assertEqual(split_bindings("text"), ["text"])
+        self.assertEqual(split_bindings("${a}"), ["", ("a", "${a}"), ""])
+        self.assertEqual(
+            split_bindings("a ${if(b, '}', 'c')} d"), ["a ", ("if(b, '}', 'c')", "${if(b, '}', 'c')}"), " d"]
+        )
+        self.assertEqual(split_bindings("\\${a} ${b"), ["${a} ${b"])
+
+
+class TemplatingTestCase(TestCase):
+    def setUp(self):
+        clear_templates()
+
+    def test_bindings(self):
+        template = {
+            "type": "TextBlock",
+            "text": "Hello ${name}, you have ${count} messages",
+            "maxLines": "${count}",
+            "wrap": "${missing}",
+            "id": "\\${name}"
+        }
+        self.assertDictEqual(expand(template, {"name": "Jane", "count": 2}), {
+            "type": "TextBlock",
+            "text": "Hello Jane, you have 2 messages",
+            "maxLines": 2,
+            "wrap": "${missing}",
+            "id": "${name}"
+        })
+        self.assertEqual(expand({"text": "${a} ${b}"}, {"a": "x"}), {"text": "x ${b}"})
+
+    def test_data_repeat(self):
+        template = {
+            "type": "AdaptiveCard",
+            "body": [
+                {"type": "TextBlock", "text": "${title}"},
+                {"$data": "${items}", "type": "TextBlock", "text": "${$index}: ${name} (${$root.title})"},
+                {"type": "TextBlock", "text": "end"}
+            ]
+        }
+        self.assertDictEqual(expand(template, {"title": "T", "items": [{"name": "a"}, {"name": "b"}]}), {
+            "type": "AdaptiveCard",
+            "body": [
+                {"type": "TextBlock", "text": "T"},
+                {"type": "TextBlock", "text": "0: a (T)"},
+                {"type": "TextBlock", "text": "1: b (T)"},
+                {"type": "TextBlock", "text": "end"}
+            ]
+        })
+        self.assertEqual(expand(template, {"title": "T", "items": []})["body"], [
+            {"type": "TextBlock", "text": "T"},
+            {"type": "TextBlock", "text": "end"}
+        ])
+        self.assertEqual(len(expand(template, {"title": "T"})["body"]), 2)
+
+    def test_data_object(self):
+        template = {
+            "type": "Container",
+            "$data": "${user}",
+            "items": [{"type": "TextBlock", "text": "${name}"}],
+            "selectAction": {"$data": {"id": "${id}"}, "type": "Action.Submit", "data": "${$data}"}
+        }
+        self.assertDictEqual(expand(template, {"user": {"name": "Jane", "id": 1}}), {
+            "type": "Container",
+            "items": [{"type": "TextBlock", "text": "Jane"}],
+            "selectAction": {"type": "Action.Submit", "data": {"id": 1}}
+        })
+
+    def test_when(self):
+        template = {
+            "body": [
+                {"$data": "${items}", "$when": "${price > 10}", "text": "${name}"},
+                {"$when": "${empty(items)}", "text": "empty"},
+                {"$when": False, "text": "never"}
+            ],
+            "selectAction": {"$when": "${missing}", "type": "Action.OpenUrl"}
+        }
+        items = [{"name": "a", "price": 5}, {"name": "b", "price": 50}]
+        self.assertDictEqual(expand(template, {"items": items}), {"body": [{"text": "b"}]})
+        self.assertDictEqual(expand(template, {"items": []}), {"body": [{"text": "empty"}]})
+
+    def test_card(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([
+            TextBlock(_("Title")),
+            bind(Container([TextBlock("${name}")]), data="${users}", when="${active}"),
+            FactSet([bind(Fact("${key}", "${value}"), data="${facts}")])
+        ])
+        data = {
+            "users": [{"name": "a", "active": True}, {"name": "b", "active": False}],
+            "facts": [{"key": "k", "value": "v"}]
+        }
+        self.assertDictEqual(expand(card, data), {
+            "type": "AdaptiveCard",
+            "version": "1.5",
+            "body": [
+                {"type": "TextBlock", "text": "Title"},
+                {"type": "Container", "items": [{"type": "TextBlock", "text": "a"}]},
+                {"type": "FactSet", "facts": [{"title": "k", "value": "v"}]}
+            ]
+        })
+        self.assertEqual(expand(card.json_payload, data), expand(card, data))
+
+    def test_bind(self):
+        element = TextBlock("${name}")
+        self.assertIs(bind(element, data="${users}", when="${active}"), element)
+        self.assertEqual(element.as_data()["$data"], "${users}")
+        self.assertEqual(element.as_data()["$when"], "${active}")
+
+    def test_bind_estimated_size(self):
+        card = AdaptiveCard(version="1.5")
+        element = TextBlock("${name}")
+        card.add_elements(Container(items=[element]))
+        card.estimated_size
+        bind(element, data="${users}")
+        self.assertEqual(card.estimated_size, len(card.json_payload))
+
+    def test_output_is_not_shared(self):
+        template = {"body": [{"$data": "${items}", "facts": [{"title": "t"}]}]}
+        result = expand(template, {"items": [1, 2]})
+        result["body"][0]["facts"][0]["title"] = "changed"
+        self.assertEqual(result["body"][1]["facts"][0]["title"], "t")
+        self.assertEqual(expand(template, {"items": [1]})["body"][0]["facts"][0]["title"], "t")
+
+    def test_compile_template_cache(self):
+        template = {"type": "TextBlock", "text": "${name}"}
+        compiled = compile_template(template)
+        self.assertIs(compile_template(dict(template)), compiled)
+        self.assertIs(compile_template(json.dumps(template, ensure_ascii=False)), compiled)
+        self.assertIsNot(compile_template({"type": "TextBlock", "text": "${title}"}), compiled)
+        clear_templates()
+        self.assertIsNot(compile_template(template), compiled)
+
+    def test_compile_expression_cache(self):
+        expression = compile_expression("a + 1")
+        self.assertIs(compile_expression("a + 1"), expression)
+        clear_templates()
+        self.assertIsNot(compile_expression("a + 1"), expression)
+
+    def test_invalid_template(self):
+        with self.assertRaises(CardException):
+            expand({"text": "${1 +}"})
@@ -0,0 +1,15 @@
+import importlib
+import pkgutil
+
+import examples
+from django_actionable_messages.mixins import Card
+
+
+def get_example_cards():
+    cards = []
+    for module_info in pkgutil.walk_packages(examples.__path__, prefix="examples."):
+        module = importlib.import_module(module_info.name)
+        for name, value in sorted(vars(module).items()):
+            if isinstance(value, Card):
+                cards.append((f"{module_info.name}.{name}", value))
+    return cards
@@ -0,0 +1,98 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import TestCase, override_settings
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Fact, FactSet
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.adaptive_card.mixins import _interning_pool, interning
+from django_actionable_messages.mixins import arender_many, render_many, run_in_executor
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.count = 0
+
+    def submit(self, *args, **kwargs):
+        self.count += 1
+        return super().submit(*args, **kwargs)
+
+
+executor = CountingExecutor()
+
+
+def get_card(rows=1, lang_code="en"):
+    card = AdaptiveCard(version="1.5", lang_code=lang_code)
+    card.add_elements([TextBlock(_("text")), FactSet([Fact(f"Fact {i}", "value" * 10) for i in range(rows)])])
+    return card
+
+
+class AsyncTestCase(TestCase):
+    def setUp(self):
+        executor.count = 0
+
+    async def test_aget_payload(self):
+        card = get_card(rows=500)
+        self.assertEqual(await card.aget_payload(fmt="json", executor=executor), card.json_payload)
+        self.assertEqual(executor.count, 1)
+        card = get_card(rows=500)
+        self.assertEqual(await card.aget_payload(executor=executor), card.payload)
+        self.assertEqual(await card.aget_payload(fmt="html", executor=executor), card.html_payload)
+        self.assertEqual(executor.count, 3)
+
+    async def test_inline(self):
+        card = get_card(rows=500)
+        card.json_payload
+        await card.aget_payload(fmt="json", executor=executor)
+        await card.aget_payload(frozen=True, executor=executor)
+        small_card = get_card()
+        small_card.estimated_size
+        self.assertEqual(await small_card.aget_payload(fmt="json", executor=executor), small_card.json_payload)
+        self.assertEqual(executor.count, 0)
+        with override_settings(ACTIONABLE_MESSAGES={"ASYNC_INLINE_SIZE": 10}):
+            await get_card().aget_payload(fmt="json", executor=executor)
+            await small_card.aget_payload(fmt="html", executor=executor)
+        self.assertEqual(executor.count, 2)
+
+    async def test_language(self):
+        with translation.override("de"):
+            self.assertEqual(await run_in_executor(translation.get_language, executor), "de")
+            await run_in_executor(lambda: translation.activate("fr"), executor)
+            self.assertEqual(translation.get_language(), "de")
+            card = get_card(rows=500, lang_code="pl")
+            json_payload = await card.aget_payload(fmt="json", executor=executor)
+            self.assertEqual(translation.get_language(), "de")
+        self.assertEqual(json_payload, get_card(rows=500, lang_code="pl").json_payload)
+
+    async def test_context(self):
+        with interning() as pool:
+            self.assertIs(await run_in_executor(_interning_pool.get, executor), pool)
+
+    async def test_arender_many(self):
+        cards = [get_card(rows=i * 10, lang_code=lang_code) for i, lang_code in enumerate(["en", "pl"] * 5)]
+        expected = list(render_many(cards, fmt="json"))
+        cards = [get_card(rows=i * 10, lang_code=lang_code) for i, lang_code in enumerate(["en", "pl"] * 5)]
+        results = [result async for result in arender_many(cards, fmt="json", chunk_size=4, executor=executor)]
+        self.assertEqual(results, expected)
+        self.assertEqual(executor.count, 3)
+        self.assertEqual([result async for result in arender_many(cards, fmt="json", executor=executor)], expected)
+        self.assertEqual(executor.count, 3)
+
+    async def test_arender_many_async_iterable(self):
+        async def iter_cards():
+            for i in range(5):
+                yield get_card(rows=i)
+
+        results = [result async for result in arender_many(iter_cards(), chunk_size=2, executor=executor)]
+        self.assertEqual(results, [get_card(rows=i).payload for i in range(5)])
+        self.assertEqual(executor.count, 3)
+
+    @override_settings(ACTIONABLE_MESSAGES={"ASYNC_EXECUTOR": "tests.test_async.executor"})
+    async def test_executor_setting(self):
+        card = get_card(rows=500)
+        self.assertEqual(json.loads(await card.aget_payload(fmt="json")), card.payload)
+        self.assertEqual(executor.count, 1)
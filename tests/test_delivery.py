@@ -0,0 +1,128 @@
+import asyncio
+
+from django.test import TestCase
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.delivery import WebhookClient, read_response
+from django_actionable_messages.exceptions import DeliveryException
+from django_actionable_messages.testing import FakeWebhookServer
+
+
+def get_card(text="text"):
+    card = AdaptiveCard(version="1.5")
+    card.add_elements(TextBlock(text))
+    return card
+
+
+class DeliveryTestCase(TestCase):
+    async def test_send(self):
+        card = get_card()
+        async with FakeWebhookServer() as server, WebhookClient() as client:
+            response = await client.send(server.url, card)
+            await client.send(server.url, {"text": "dict"})
+            await client.post(server.url, '{"text": "json"}', headers={"X-Custom": "1"})
+        self.assertTrue(response.ok)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.text, "1")
+        self.assertEqual(server.payloads, [card.payload, {"text": "dict"}, {"text": "json"}])
+        path, headers, body = server.requests[2]
+        self.assertEqual(path, "/webhook")
+        self.assertEqual(headers["content-type"], "application/json; charset=utf-8")
+        self.assertEqual(headers["x-custom"], "1")
+        self.assertEqual(server.connections, 1)
+
+    async def test_send_many(self):
+        cards = [get_card(f"text {i}") for i in range(20)]
+        async with FakeWebhookServer(delay=0.01) as server, WebhookClient(max_connections=3) as client:
+            responses = await client.send_many((server.url, card) for card in cards)
+        self.assertEqual(len(responses), 20)
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(sorted(payload["body"][0]["text"] for payload in server.payloads),
+                         sorted(f"text {i}" for i in range(20)))
+        self.assertEqual(server.connections, 3)
+        self.assertEqual(server.max_open_connections, 3)
+
+    async def test_pipelining(self):
+        cards = [get_card(f"text {i}") for i in range(10)]
+        async with FakeWebhookServer(delay=0.01) as server, \
+                WebhookClient(max_connections=1, pipeline=5) as client:
+            responses = await client.send_many((server.url, card) for card in cards)
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(sorted(payload["body"][0]["text"] for payload in server.payloads),
+                         sorted(f"text {i}" for i in range(10)))
+        self.assertEqual(server.connections, 1)
+
+    async def test_connection_closed_by_server(self):
+        async with FakeWebhookServer(keep_alive=False) as server, WebhookClient(max_connections=2) as client:
+            responses = await client.send_many([(server.url, get_card())] * 5)
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertEqual(server.connections, 5)
+
+    async def test_chunked_response(self):
+        async with FakeWebhookServer(chunked=True, body=b"chunked") as server, WebhookClient() as client:
+            response = await client.send(server.url, get_card())
+            await client.send(server.url, get_card())
+        self.assertEqual(response.body, b"chunked")
+        self.assertEqual(server.connections, 1)
+
+    async def test_send_many_errors(self):
+        def deliveries():
+            yield server.url, get_card()
+            raise RuntimeError("No more cards")
+
+        async with FakeWebhookServer() as server, WebhookClient() as client:
+            results = await client.send_many([(server.url, object()), ("ftp://example.com/", get_card()),
+                                              (server.url, get_card())])
+            with self.assertRaisesMessage(RuntimeError, "No more cards"):
+                await client.send_many(deliveries())
+        self.assertIsInstance(results[0], TypeError)
+        self.assertIsInstance(results[1], DeliveryException)
+        self.assertTrue(results[2].ok)
+
+    async def test_max_body_size(self):
+        for chunked in (False, True):
+            async with FakeWebhookServer(body=b"x" * 100, chunked=chunked) as server, \
+                    WebhookClient(max_body_size=10) as client:
+                with self.assertRaisesMessage(DeliveryException, "Response body is larger than 10 bytes"):
+                    await client.send(server.url, get_card())
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"HTTP/1.0 200 OK\r\n\r\n" + b"x" * 100)
+        reader.feed_eof()
+        with self.assertRaisesMessage(ValueError, "Response body is larger than 10 bytes"):
+            await read_response(reader, max_body_size=10)
+
+    async def test_error_status(self):
+        async with FakeWebhookServer(status=400, body=b"Bad payload") as server, WebhookClient() as client:
+            response = await client.send(server.url, get_card())
+        self.assertFalse(response.ok)
+        self.assertEqual(response.status, 400)
+
+    async def test_timeout(self):
+        async with FakeWebhookServer(delay=0.2) as server, WebhookClient(timeout=0.05) as client:
+            with self.assertRaises(DeliveryException):
+                await client.send(server.url, get_card())
+            results = await client.send_many([(server.url, get_card())])
+        self.assertIsInstance(results[0], DeliveryException)
+
+    async def test_connection_error(self):
+        server = FakeWebhookServer()
+        await server.start()
+        url = server.url
+        await server.stop()
+        async with WebhookClient() as client:
+            with self.assertRaises(DeliveryException):
+                await client.send(url, get_card())
+            with self.assertRaises(DeliveryException):
+                await client.send("ftp://example.com/webhook", get_card())
+
+    async def test_stale_connection(self):
+        async with FakeWebhookServer() as server, WebhookClient() as client:
+            await client.send(server.url, get_card())
+            server.keep_alive = False
+            await client.send(server.url, get_card())
+            await asyncio.sleep(0.01)
+            server.keep_alive = True
+            response = await client.send(server.url, get_card())
+        self.assertTrue(response.ok)
+        self.assertEqual(server.connections, 2)
@@ -1,6 +1,10 @@
+import copy
+import pickle
+
 from django.test import TestCase
 
 from django_actionable_messages.elements import Header
+from django_actionable_messages.mixins import materialize
 
 
 class ElementsTestCase(TestCase):
@@ -10,3 +14,40 @@ class ElementsTestCase(TestCase):
             "name": "Accept-Encoding",
             "value": "gzip,deflate"
         })
+
+
+class CopyTestCase(TestCase):
+    def get_objects(self):
+        from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+        from django_actionable_messages.adaptive_card.containers import Container, Fact, FactSet
+        from django_actionable_messages.adaptive_card.elements import TextBlock
+        from django_actionable_messages.message_card.cards import MessageCard
+        from django_actionable_messages.message_card.sections import Section
+
+        block = TextBlock("text", lang_code="de")
+        container = Container([block, FactSet([Fact("name", "value")])])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(container)
+        message_card = MessageCard(title="title")
+        message_card.add_sections(Section(title="section"))
+        return [Header("name", "value"), block, container, card, message_card]
+
+    def assertCopied(self, obj, other):
+        self.assertIsNot(other, obj)
+        self.assertIs(other.__class__, obj.__class__)
+        self.assertEqual(other.get_language_code(), obj.get_language_code())
+        if hasattr(obj, "as_data"):
+            self.assertEqual(materialize(other.as_data()), materialize(obj.as_data()))
+        else:
+            self.assertEqual(other.payload, obj.payload)
+            self.assertEqual(other.json_payload, obj.json_payload)
+
+    def test_copy(self):
+        for obj in self.get_objects():
+            self.assertCopied(obj, copy.copy(obj))
+            self.assertCopied(obj, copy.deepcopy(obj))
+
+    def test_pickle(self):
+        for obj in self.get_objects():
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                self.assertCopied(obj, pickle.loads(pickle.dumps(obj, protocol)))
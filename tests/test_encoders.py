@@ -1,7 +1,9 @@
 import json
 import uuid
+from unittest import mock
 
 from django.test import TestCase
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
 from django_actionable_messages.encoders import BaseEncoder
@@ -16,3 +18,34 @@ class BaseEncoderTestCase(TestCase):
         value = uuid.uuid4()
         data = json.loads(json.dumps({"uuid": value}, cls=BaseEncoder))
         self.assertEqual(data["uuid"], str(value))
+
+    def test_base_encoder_activates_language_once(self):
+        data = {"items": [{"text": _("test string")} for _i in range(10)]}
+        with mock.patch("django_actionable_messages.encoders.translation.activate",
+                        wraps=translation.activate) as activate:
+            json.dumps(data, cls=BaseEncoder, lang_code="pl")
+        self.assertEqual(activate.call_args_list[0], mock.call("pl"))
+        self.assertEqual(activate.call_count, 2)  # activate + restore previous language
+
+    def test_base_encoder_without_promises(self):
+        data = {"items": [{"uuid": uuid.uuid4()} for _i in range(10)]}
+        with mock.patch("django_actionable_messages.encoders.translation") as trans:
+            json.dumps(data, cls=BaseEncoder, lang_code="pl")
+        trans.activate.assert_not_called()
+        trans.get_language.assert_not_called()
+
+    def test_base_encoder_restores_language(self):
+        with translation.override("de"):
+            json.dumps({"text": _("test string")}, cls=BaseEncoder, lang_code="pl")
+            self.assertEqual(translation.get_language(), "de")
+        with translation.override(None):
+            json.dumps({"text": _("test string")}, cls=BaseEncoder, lang_code="pl")
+            self.assertIsNone(translation.get_language())
+
+    def test_base_encoder_language(self):
+        with translation.override("de"):
+            encoder = BaseEncoder(lang_code="pl")
+            with encoder.language():
+                self.assertEqual(encoder.default(_("test string")), "test string")
+                self.assertEqual(translation.get_language(), "pl")
+            self.assertEqual(translation.get_language(), "de")
@@ -0,0 +1,45 @@
+from django.test import TestCase
+
+from django_actionable_messages.frozen import FrozenDict, FrozenList, freeze
+
+
+class FrozenTestCase(TestCase):
+    def setUp(self):
+        self.data = {
+            "type": "AdaptiveCard",
+            "body": [{
+                "type": "TextBlock",
+                "text": "text"
+            }]
+        }
+
+    def test_freeze(self):
+        self.assertIsInstance(freeze(self.data), FrozenDict)
+        self.assertIsInstance(freeze(self.data["body"]), FrozenList)
+        self.assertEqual(freeze("text"), "text")
+
+    def test_frozen_dict(self):
+        frozen = FrozenDict(self.data)
+        self.assertEqual(frozen, self.data)
+        self.assertEqual(len(frozen), 2)
+        self.assertIn("body", frozen)
+        self.assertListEqual(list(frozen), ["type", "body"])
+        self.assertIsInstance(frozen["body"], FrozenList)
+        self.assertIsInstance(frozen["body"][0], FrozenDict)
+        self.assertEqual(frozen["body"][0]["text"], "text")
+        with self.assertRaises(TypeError):
+            frozen["type"] = "MessageCard"
+        with self.assertRaises(AttributeError):
+            frozen["body"].append({})
+
+    def test_frozen_view_is_live(self):
+        frozen = FrozenDict(self.data)
+        self.data["body"].append({"type": "Image"})
+        self.assertEqual(len(frozen["body"]), 2)
+        self.assertEqual(frozen["body"][1:], [{"type": "Image"}])
+
+    def test_thaw(self):
+        thawed = FrozenDict(self.data).thaw()
+        self.assertDictEqual(thawed, self.data)
+        thawed["body"].clear()
+        self.assertEqual(len(self.data["body"]), 1)
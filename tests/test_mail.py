@@ -0,0 +1,159 @@
+import base64
+import json
+import re
+from smtplib import SMTPException
+from unittest import mock, skipUnless
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.mail import build_message, build_messages, send_mass_card_mail, send_messages
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.signing import sign_many
+from tests.test_serializers import is_installed
+
+
+class CountingBackend(EmailBackend):
+    opened = closed = 0
+
+    def open(self):
+        CountingBackend.opened += 1
+        return True
+
+    def close(self):
+        CountingBackend.closed += 1
+
+
+class FailingBackend(CountingBackend):
+    def send_messages(self, messages):
+        if any(message.subject == "fail" for message in messages):
+            raise SMTPException("Batch rejected")
+        return super().send_messages(messages)
+
+
+class ConnectFailingBackend(CountingBackend):
+    def open(self):
+        if not CountingBackend.opened:
+            CountingBackend.opened += 1
+            raise SMTPException("Connection refused")
+        return super().open()
+
+
+def get_card(text="text", **kwargs):
+    card = AdaptiveCard(version="1.0", **kwargs)
+    card.add_elements(TextBlock(text))
+    return card
+
+
+class MailTestCase(TestCase):
+    def setUp(self):
+        CountingBackend.opened = CountingBackend.closed = 0
+
+    def test_build_message(self):
+        card = get_card(fallback_text="Fallback")
+        message = build_message(card, "user@example.com", subject="Subject", from_email="bot@example.com")
+        self.assertEqual(message.to, ["user@example.com"])
+        self.assertEqual(message.subject, "Subject")
+        self.assertEqual(message.body, "Fallback")
+        self.assertEqual(message.from_email, "bot@example.com")
+        self.assertEqual(message.alternatives[0][:2], (card.html_payload, "text/html"))
+        message = build_message(MessageCard(summary="Summary"), ["a@example.com", "b@example.com"], body="Body",
+                                cc=["c@example.com"])
+        self.assertEqual(message.body, "Body")
+        self.assertEqual(message.cc, ["c@example.com"])
+        self.assertEqual(build_message(MessageCard(summary="Summary"), "a@example.com").body, "Summary")
+        self.assertEqual(build_message(get_card(), "a@example.com").body, "")
+
+    def test_build_message_language(self):
+        message = build_message(get_card(fallback_text=_("Yes"), lang_code="de"), "a@example.com", subject=_("No"))
+        self.assertEqual((message.subject, message.body), ("Nein", "Ja"))
+
+    def test_build_messages(self):
+        cards = [get_card(f"text {i}") for i in range(5)]
+        items = [(card, f"user{i}@example.com") for i, card in enumerate(cards)]
+        items.append((cards[0], "other@example.com", {"subject": "Other", "body": "Other body"}))
+        messages = list(build_messages(items, subject="Subject", body="Body", chunk_size=2))
+        self.assertEqual(len(messages), 6)
+        self.assertEqual([message.to for message in messages[:5]], [[f"user{i}@example.com"] for i in range(5)])
+        self.assertEqual([message.alternatives[0][0] for message in messages], [
+            card.html_payload for card in (*cards, cards[0])
+        ])
+        self.assertEqual((messages[0].subject, messages[0].body), ("Subject", "Body"))
+        self.assertEqual((messages[5].subject, messages[5].body), ("Other", "Other body"))
+
+    @override_settings(EMAIL_BACKEND="tests.test_mail.CountingBackend")
+    def test_send_messages(self):
+        messages = build_messages((get_card(), f"user{i}@example.com") for i in range(25))
+        results = send_messages(messages, batch_size=10)
+        self.assertEqual([(result.size, result.sent, result.ok) for result in results],
+                         [(10, 10, True), (10, 10, True), (5, 5, True)])
+        self.assertEqual(len(mail.outbox), 25)
+        self.assertEqual((CountingBackend.opened, CountingBackend.closed), (1, 1))
+
+    @override_settings(EMAIL_BACKEND="tests.test_mail.FailingBackend")
+    def test_send_messages_errors(self):
+        items = [(get_card(), "user@example.com", {"subject": "fail" if i == 12 else "ok"}) for i in range(25)]
+        results = send_mass_card_mail(items, batch_size=10)
+        self.assertEqual([(result.sent, result.ok) for result in results], [(10, True), (0, False), (5, True)])
+        self.assertIsInstance(results[1].error, SMTPException)
+        self.assertEqual(len(results[1].messages), 10)
+        self.assertIsNone(results[0].messages)
+        self.assertEqual(len(mail.outbox), 15)
+        # reopened once after failed batch
+        self.assertEqual((CountingBackend.opened, CountingBackend.closed), (2, 2))
+
+    @override_settings(EMAIL_BACKEND="tests.test_mail.ConnectFailingBackend")
+    def test_send_messages_connect_error(self):
+        results = send_messages(build_messages((get_card(), f"user{i}@example.com") for i in range(15)), batch_size=10)
+        self.assertEqual([(result.sent, result.ok) for result in results], [(0, False), (5, True)])
+        self.assertIsInstance(results[0].error, SMTPException)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual((CountingBackend.opened, CountingBackend.closed), (2, 2))
+
+    def test_send_messages_connection(self):
+        connection = mail.get_connection()
+        results = send_mass_card_mail([(get_card(), "user@example.com")] * 3, connection=connection, batch_size=2)
+        self.assertEqual([result.sent for result in results], [2, 1])
+        self.assertEqual(len(mail.outbox), 3)
+
+    @skipUnless(is_installed("cryptography"), "cryptography is not installed")
+    def test_signed(self):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        pem = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        card = get_card()
+        card.signing_key, card.signing_sender, card.signing_originator = pem, "bot@example.com", "originator"
+        other = get_card()
+        other.signing_key, other.signing_sender, other.signing_originator = pem, "bot@example.com", "originator"
+        other.signing_recipients = ["other@example.com"]
+        messages = list(build_messages([
+            (card, "user@example.com"),
+            (card, ["a@example.com", "b@example.com"], {"cc": ["c@example.com"]}),
+            (other, "user@example.com")
+        ], signed=True, processes=1))
+        self.assertIn('itemtype="http://schema.org/SignedAdaptiveCard"', messages[0].alternatives[0][0])
+        recipients = []
+        for message in messages:
+            token = re.search(r">([\w-]+\.[\w-]+\.[\w-]+)</div>", message.alternatives[0][0]).group(1)
+            claims = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))
+            recipients.append(json.loads(claims["recipientsSerialized"]))
+        self.assertEqual(recipients, [
+            ["user@example.com"], ["a@example.com", "b@example.com", "c@example.com"], ["other@example.com"]
+        ])
+        # one pool of processes for all chunks
+        items = [(card, f"user{i}@example.com") for i in range(5)]
+        with mock.patch("django_actionable_messages.mail.sign_many", wraps=sign_many) as sign_many_mock:
+            messages = list(build_messages(items, signed=True, processes=2, chunk_size=2))
+        self.assertEqual(len(messages), 5)
+        executors = {call.kwargs["executor"] for call in sign_many_mock.call_args_list}
+        self.assertEqual(len(sign_many_mock.call_args_list), 3)
+        self.assertEqual(len(executors), 1)
+        self.assertIsNotNone(executors.pop())
@@ -0,0 +1,62 @@
+import multiprocessing
+
+from django.test import TestCase
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Container
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.parallel import render_parallel
+from django_actionable_messages.raw import RawJSON
+
+
+def make_card(spec):
+    text, lang_code = spec
+    card = AdaptiveCard(version="1.0", lang_code=lang_code)
+    card.add_elements([TextBlock(text), TextBlock(_("Yes"))])
+    return card
+
+
+class ParallelTestCase(TestCase):
+    def setUp(self):
+        self.specs = [(f"text {i}", "de" if i % 3 else None) for i in range(25)]
+        self.cards = [make_card(spec) for spec in self.specs]
+
+    def test_in_process(self):
+        self.assertEqual(list(render_parallel(self.cards, fmt="json", processes=1, chunk_size=4)),
+                         [card.json_payload for card in self.cards])
+        self.assertEqual(sorted(render_parallel(self.cards, fmt="html", processes=1, chunk_size=4, ordered=False)),
+                         list(enumerate(card.html_payload for card in self.cards)))
+
+    def test_ordered(self):
+        self.assertEqual(list(render_parallel(self.cards, fmt="json", processes=2, chunk_size=4)),
+                         [card.json_payload for card in self.cards])
+        self.assertEqual(list(render_parallel(self.cards, processes=2, chunk_size=4)),
+                         [card.payload for card in self.cards])
+
+    def test_unordered(self):
+        results = list(render_parallel(self.cards, fmt="json", processes=2, chunk_size=3, ordered=False))
+        self.assertEqual(sorted(results), list(enumerate(card.json_payload for card in self.cards)))
+
+    def test_factory(self):
+        self.assertEqual(list(render_parallel(self.specs, fmt="json", processes=2, chunk_size=4, factory=make_card)),
+                         [card.json_payload for card in self.cards])
+        self.assertEqual(list(render_parallel([], fmt="json", processes=2)), [])
+
+    def test_spawned_workers(self):
+        # workers set up Django from DJANGO_SETTINGS_MODULE and use the active language
+        mp_context = multiprocessing.get_context("spawn")
+        with translation.override("de"):
+            results = list(render_parallel(self.specs, fmt="json", processes=2, chunk_size=13, factory=make_card,
+                                           mp_context=mp_context))
+            expected = [card.json_payload for card in self.cards]
+        self.assertEqual(results, expected)
+        self.assertIn('"Ja"', results[1])
+        # references of raw json and shared elements are unique per process, pickled cards get new ones
+        footer = Container([TextBlock("footer")]).share()
+        for card in self.cards:
+            card.add_elements([RawJSON('{"type": "TextBlock", "text": "raw"}'), footer])
+        results = list(render_parallel(self.cards, fmt="json", processes=2, chunk_size=13, mp_context=mp_context))
+        self.assertEqual(results, [card.json_payload for card in self.cards])
+        self.assertIn('{"type": "TextBlock", "text": "raw"}', results[0])
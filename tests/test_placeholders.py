@@ -0,0 +1,128 @@
+import copy
+import json
+import pickle
+
+from django.test import TestCase, override_settings
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.actions import Submit
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Fact, FactSet
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.message_card.sections import Section
+from django_actionable_messages.msteams_cards.cards import HeroCard
+from django_actionable_messages.placeholders import CardTemplate, Placeholder
+
+VALUES = {
+    "name": 'Tom "Jerry" </b>\n',
+    "amount": 12.5,
+    "data": {"id": 1, "items": [1, 2]}
+}
+
+
+def build_adaptive_card(name, amount, data):
+    card = AdaptiveCard(version="1.5")
+    card.add_elements([
+        TextBlock(f"Hello {name}!"),
+        FactSet([Fact("Amount", amount), Fact("Name", name)])
+    ])
+    card.add_actions(Submit(title="Send", data=data))
+    return card
+
+
+class PlaceholdersTestCase(TestCase):
+    def test_placeholder(self):
+        placeholder = Placeholder("name")
+        self.assertEqual(placeholder.name, "name")
+        self.assertIsInstance(placeholder, str)
+        self.assertEqual(repr(placeholder), "Placeholder('name')")
+        self.assertEqual(pickle.loads(pickle.dumps(placeholder)).name, "name")
+        self.assertEqual(copy.deepcopy(placeholder), placeholder)
+        with self.assertRaisesMessage(CardException, "Invalid placeholder name: 'invalid name'"):
+            Placeholder("invalid name")
+
+    def test_adaptive_card_template(self):
+        template = CardTemplate(build_adaptive_card(Placeholder("name"), Placeholder("amount"), Placeholder("data")))
+        self.assertSetEqual(template.names, {"name", "amount", "data"})
+        expected = build_adaptive_card(**VALUES).json_payload
+        self.assertEqual(template.render(VALUES), expected)
+        self.assertEqual(template.render(**VALUES), expected)
+        self.assertDictEqual(json.loads(template.render(VALUES)), json.loads(expected))
+
+    def test_render_many(self):
+        template = CardTemplate(build_adaptive_card(Placeholder("name"), Placeholder("amount"), Placeholder("data")))
+        values_list = [dict(VALUES, name=f"user {i}") for i in range(3)]
+        self.assertListEqual(list(template.render_many(values_list)),
+                             [build_adaptive_card(**values).json_payload for values in values_list])
+
+    def test_html_template(self):
+        template = CardTemplate(build_adaptive_card(Placeholder("name"), Placeholder("amount"), Placeholder("data")),
+                                fmt="html")
+        self.assertEqual(template.render(VALUES), build_adaptive_card(**VALUES).html_payload)
+        with self.assertRaisesMessage(CardException, "Invalid format"):
+            CardTemplate(AdaptiveCard(), fmt="signed_html")
+
+    def test_message_card_template(self):
+        def build(title, text, correlation_id):
+            return MessageCard(title=title, correlation_id=correlation_id, sections=[Section(text=text)])
+
+        template = CardTemplate(build(Placeholder("title"), f"{Placeholder('a')} and {Placeholder('b')}",
+                                      Placeholder("correlation_id")))
+        self.assertEqual(template.render(title="T", a=1, b="\\", correlation_id="c1"),
+                         build("T", "1 and \\", "c1").json_payload)
+
+    def test_hero_card_template(self):
+        template = CardTemplate(HeroCard(title=Placeholder("title"), text=Placeholder("title")))
+        self.assertEqual(template.render(title="<title>"), HeroCard(title="<title>", text="<title>").json_payload)
+
+    def test_missing_value(self):
+        template = CardTemplate(HeroCard(title=Placeholder("title")))
+        with self.assertRaisesMessage(CardException, "Missing value for placeholder 'title'"):
+            template.render()
+
+    def test_embedded_value(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(TextBlock(f"Value: {Placeholder('value')}"))
+        template = CardTemplate(card)
+        for value, expected in ((12.5, "Value: 12.5"), (True, "Value: True"), ('"a"\n', 'Value: "a"\n')):
+            self.assertEqual(json.loads(template.render(value=value))["body"][0]["text"], expected)
+        for value, type_name in (({"id": 1}, "dict"), ([1, 2], "list"), (None, "NoneType")):
+            message = f"Placeholder 'value' is a part of string, its value can't be {type_name}"
+            with self.assertRaisesMessage(CardException, message):
+                template.render(value=value)
+
+    def test_lazy_value(self):
+        template = CardTemplate(HeroCard(title=Placeholder("title"), text=f"- {Placeholder('title')}", lang_code="en"))
+        self.assertEqual(template.render(title=_("test string")),
+                         HeroCard(title="test string", text="- test string").json_payload)
+
+    def test_lazy_value_language(self):
+        template = CardTemplate(HeroCard(title=Placeholder("title"), text=f"- {Placeholder('title')}", lang_code="pl"))
+        with translation.override("de"):
+            payload = json.loads(template.render(title=_("Yes")))
+            self.assertEqual(translation.get_language(), "de")
+        self.assertEqual((payload["content"]["title"], payload["content"]["text"]), ("Tak", "- Tak"))
+
+    def test_key(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_actions(Submit(title="Send", data={Placeholder("key"): Placeholder("key")}))
+        template = CardTemplate(card)
+        self.assertEqual(json.loads(template.render(key=5))["actions"][0]["data"], {"5": 5})
+        self.assertEqual(json.loads(template.render(key=_("Yes")))["actions"][0]["data"], {"Yes": "Yes"})
+        with self.assertRaisesMessage(CardException, "Placeholder 'key' is a part of string, its value can't be list"):
+            template.render(key=[1])
+
+    @override_settings(ACTIONABLE_MESSAGES={"JSON_BACKEND": "orjson"})
+    def test_json_backend(self):
+        template = CardTemplate(build_adaptive_card(Placeholder("name"), Placeholder("amount"), Placeholder("data")))
+        self.assertEqual(template.render(VALUES), build_adaptive_card(**VALUES).json_payload)
+
+    def test_canonical(self):
+        template = CardTemplate(build_adaptive_card(Placeholder("name"), Placeholder("amount"), Placeholder("data")),
+                                canonical=True)
+        values = dict(VALUES, amount=12.0, data={"z": 1, "a": [2.0]})
+        self.assertEqual(template.render(values), build_adaptive_card(**values).get_payload(fmt="json", canonical=True))
+        self.assertIn('"data":{"a":[2],"z":1}', template.render(values))
@@ -0,0 +1,111 @@
+import json
+import pickle
+
+from django.test import TestCase, override_settings
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Column, ColumnSet, Container, FactSet
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.message_card.sections import Section
+from django_actionable_messages.raw import RawJSON
+from django_actionable_messages.serializers import BACKENDS, STDLIB_BACKEND
+
+RAW_TEXT_BLOCK = '{"type":"TextBlock","text":"zażółć","wrap":true}'
+
+
+def get_card():
+    card = AdaptiveCard(version="1.5")
+    card.add_elements([
+        RawJSON(RAW_TEXT_BLOCK),
+        Container([TextBlock("text"), RawJSON(RAW_TEXT_BLOCK.encode())]),
+        ColumnSet([Column([RawJSON(RAW_TEXT_BLOCK)])]),
+        FactSet([RawJSON('{"title":"Status","value":"Open"}')])
+    ])
+    return card
+
+
+class RawJSONTestCase(TestCase):
+    def test_spliced(self):
+        for backend in (STDLIB_BACKEND, *BACKENDS):
+            card = get_card()
+            card.json_backend = backend
+            json_payload = card.json_payload
+            self.assertEqual(json_payload.count(RAW_TEXT_BLOCK), 3)
+            self.assertIn('{"title":"Status","value":"Open"}', json_payload)
+            self.assertEqual(json.loads(json_payload), card.payload)
+
+    def test_payload(self):
+        payload = get_card().payload
+        self.assertEqual(payload["body"][0], {"type": "TextBlock", "text": "zażółć", "wrap": True})
+        self.assertEqual(payload["body"][3]["facts"], [{"title": "Status", "value": "Open"}])
+        self.assertEqual(get_card().frozen_payload, payload)
+        self.assertIn(RAW_TEXT_BLOCK, get_card().html_payload)
+
+    def test_canonical_and_compact(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(RawJSON('{"type": "TextBlock", "text": "text", "wrap": false}'))
+        self.assertEqual(
+            card.get_payload(fmt="json", canonical=True),
+            '{"body":[{"text":"text","type":"TextBlock","wrap":false}],"type":"AdaptiveCard","version":"1.5"}'
+        )
+        self.assertEqual(
+            json.loads(card.get_payload(fmt="json", compact=True))["body"], [{"type": "TextBlock", "text": "text"}]
+        )
+        other = AdaptiveCard(version="1.5")
+        other.add_elements(TextBlock("text", wrap=False))
+        self.assertEqual(card.fingerprint(), other.fingerprint())
+
+    def test_dump_kwargs(self):
+        class Card(AdaptiveCard):
+            def get_json_dump_kwargs(self):
+                return {"indent": 2}
+
+        card = Card(version="1.5")
+        card.add_elements(RawJSON(RAW_TEXT_BLOCK))
+        self.assertEqual(json.loads(card.json_payload), card.payload)
+        self.assertNotIn(RAW_TEXT_BLOCK, card.json_payload)
+
+    def test_shared(self):
+        footer = Container([RawJSON(RAW_TEXT_BLOCK)]).share()
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([footer, footer])
+        self.assertEqual(card.json_payload.count(RAW_TEXT_BLOCK), 2)
+        self.assertEqual(json.loads(card.json_payload), card.payload)
+
+    def test_estimated_size(self):
+        card = get_card()
+        self.assertEqual(card.estimated_size, len(card.json_payload))
+        raw = RawJSON('{"type":"TextBlock",  "text":"x"}')
+        self.assertEqual(raw.estimated_size, len(raw.raw))
+        card.add_elements([raw, Container([RawJSON(RAW_TEXT_BLOCK)]).share()])
+        self.assertEqual(card.estimated_size, len(card.json_payload))
+
+    def test_pickle(self):
+        raw = RawJSON(RAW_TEXT_BLOCK, lang_code="pl")
+        unpickled = pickle.loads(pickle.dumps(raw))
+        self.assertEqual(unpickled.raw, RAW_TEXT_BLOCK)
+        self.assertEqual(unpickled.get_language_code(), "pl")
+        self.assertNotEqual(unpickled.reference, raw.reference)
+        card = pickle.loads(pickle.dumps(get_card()))
+        self.assertEqual(card.json_payload, get_card().json_payload)
+
+    def test_validate(self):
+        with self.assertRaises(CardException):
+            RawJSON('{"type": "TextBlock"', validate=True)
+        element = RawJSON('{"type": "TextBlock"')
+        card = AdaptiveCard()
+        card.add_elements(element)
+        with self.assertRaises(CardException):
+            card.payload
+
+    def test_message_card(self):
+        card = MessageCard(title="title", auto_correlation_id=False)
+        card.add_sections([Section(title="section"), RawJSON('{"activityTitle":"raw"}')])
+        self.assertIn('{"activityTitle":"raw"}', card.json_payload)
+        self.assertEqual(card.payload["sections"][1], {"activityTitle": "raw"})
+
+    @override_settings(ACTIONABLE_MESSAGES={"LAZY_ELEMENTS": True})
+    def test_lazy(self):
+        self.assertEqual(get_card().json_payload.count(RAW_TEXT_BLOCK), 3)
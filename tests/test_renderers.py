@@ -0,0 +1,83 @@
+import os
+
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+
+from django_actionable_messages import renderers
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.message_card.cards import MessageCard
+
+TEMPLATES = [{
+    "BACKEND": "django.template.backends.django.DjangoTemplates",
+    "DIRS": [os.path.join(os.path.dirname(__file__), "templates")],
+    "APP_DIRS": True
+}]
+PAYLOAD = '{"text": "<b>Tom & \'Jerry\'</b> \\"quoted\\""}'
+
+
+class CustomTemplateAdaptiveCard(AdaptiveCard):
+    html_template = "tests/email.html"
+
+
+class TestMessageCard(MessageCard):
+    def get_signed_payload(self):
+        return PAYLOAD
+
+
+class RenderersTestCase(TestCase):
+    def setUp(self):
+        renderers.clear_renderers()
+
+    def tearDown(self):
+        renderers.clear_renderers()
+
+    def test_render_email(self):
+        context = {
+            "type": "application/adaptivecard+json",
+            "payload": PAYLOAD
+        }
+        self.assertIs(renderers.get_renderer(renderers.EMAIL_TEMPLATE), renderers.render_email)
+        self.assertEqual(renderers.render(renderers.EMAIL_TEMPLATE, context),
+                         render_to_string(renderers.EMAIL_TEMPLATE, context))
+
+    def test_render_signed_email(self):
+        context = {
+            "type": "SignedAdaptiveCard",
+            "payload": PAYLOAD
+        }
+        self.assertIs(renderers.get_renderer(renderers.SIGNED_EMAIL_TEMPLATE), renderers.render_signed_email)
+        self.assertEqual(renderers.render(renderers.SIGNED_EMAIL_TEMPLATE, context),
+                         render_to_string(renderers.SIGNED_EMAIL_TEMPLATE, context))
+
+    def test_card_html_payload(self):
+        card = AdaptiveCard(fallback_text="<b>Tom & 'Jerry'</b>")
+        self.assertEqual(card.html_payload, render_to_string(renderers.EMAIL_TEMPLATE, {
+            "type": "application/adaptivecard+json",
+            "payload": card.json_payload
+        }))
+        card = TestMessageCard()
+        self.assertEqual(card.signed_html_payload, render_to_string(renderers.SIGNED_EMAIL_TEMPLATE, {
+            "type": "SignedMessageCard",
+            "payload": PAYLOAD
+        }))
+
+    def test_overridden_template(self):
+        card = AdaptiveCard()
+        with override_settings(TEMPLATES=TEMPLATES):
+            self.assertNotIn(renderers.get_renderer(renderers.EMAIL_TEMPLATE), renderers.BUILTIN_RENDERERS.values())
+            self.assertEqual(card.html_payload, '<html><script type="application/adaptivecard+json">'
+                                                '{"type": "AdaptiveCard"}</script></html>\n')
+        self.assertIs(renderers.get_renderer(renderers.EMAIL_TEMPLATE), renderers.render_email)
+        self.assertTrue(card.html_payload.startswith("<html><head>"))
+
+    @override_settings(TEMPLATES=TEMPLATES)
+    def test_custom_template(self):
+        html = CustomTemplateAdaptiveCard().html_payload
+        self.assertEqual(html, '<html>application/adaptivecard+json|{"type": "AdaptiveCard"}</html>\n')
+
+    def test_renderer_cache(self):
+        renderer = renderers.get_renderer(renderers.EMAIL_TEMPLATE)
+        self.assertIs(renderers.get_renderer(renderers.EMAIL_TEMPLATE), renderer)
+        self.assertIn(renderers.EMAIL_TEMPLATE, renderers._renderers)
+        renderers.clear_renderers()
+        self.assertNotIn(renderers.EMAIL_TEMPLATE, renderers._renderers)
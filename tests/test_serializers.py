@@ -0,0 +1,268 @@
+import datetime
+import decimal
+import importlib
+import json
+import uuid
+from enum import Enum
+from unittest import skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.actions import Submit
+from django_actionable_messages.adaptive_card.containers import Container
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.adaptive_card.utils import COMPACT_DEFAULTS, Color, FontSize, SpacingStyle
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.message_card.sections import Section
+from django_actionable_messages.mixins import render_many
+from django_actionable_messages.serializers import BACKENDS, compact, get_backend, normalize
+from tests.examples import get_example_cards
+
+
+def is_installed(name):
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+class TestAdaptiveCard(AdaptiveCard):
+    def get_json_dump_kwargs(self):
+        return {
+            "indent": 2
+        }
+
+
+class SerializersTestCase(TestCase):
+    def test_stdlib_backend(self):
+        self.assertIsNone(get_backend(None))
+        self.assertIsNone(get_backend("json"))
+
+    def test_invalid_backend(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "Invalid JSON backend: 'invalid'"):
+            get_backend("invalid")
+
+    def test_callable_backend(self):
+        def dumps(obj, default):
+            return "dumped"
+
+        self.assertIs(get_backend(dumps), dumps)
+        card = AdaptiveCard()
+        card.json_backend = dumps
+        self.assertEqual(card.json_payload, "dumped")
+
+    def test_json_dump_kwargs_use_stdlib(self):
+        with override_settings(ACTIONABLE_MESSAGES={"JSON_BACKEND": "orjson"}):
+            self.assertIn('\n  "type": "AdaptiveCard"', TestAdaptiveCard().json_payload)
+
+    def test_backends_output(self):
+        value = {
+            "text": _("test string"),
+            "uuid": uuid.UUID("12345678123456781234567812345678"),
+            "decimal": decimal.Decimal("1.50"),
+            "date": datetime.date(2023, 1, 2),
+            "time": datetime.time(12, 30, 15, 123456),
+            "datetime": datetime.datetime(2023, 1, 2, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            "color": Color.ACCENT,
+            "unicode": "zażółć",
+            "url": "https://www.example.com/",
+            "int": 2 ** 63 - 1,
+            "big_int": 2 ** 70,
+            "negative_big_int": -2 ** 64
+        }
+        card = AdaptiveCard()
+        card.add_elements(TextBlock(value["text"]))
+        expected = json.loads(json.dumps(value, cls=card.get_json_encoder(), lang_code="en"))
+        for name in BACKENDS:
+            with self.subTest(backend=name):
+                if not is_installed(name):
+                    self.skipTest(f"{name} is not installed")
+                dumps = get_backend(name)
+                encoder = card.get_json_encoder()(lang_code="en")
+                self.assertDictEqual(json.loads(dumps(value, encoder.default)), expected)
+                with self.assertRaises(TypeError):
+                    dumps({"value": object()}, encoder.default)
+
+    def test_backends_examples(self):
+        cards = get_example_cards()
+        self.assertGreater(len(cards), 0)
+        for name in BACKENDS:
+            if not is_installed(name):
+                continue
+            for card_name, card in cards:
+                with self.subTest(backend=name, card=card_name):
+                    expected = json.loads(card.json_payload)
+                    card.json_backend = name
+                    card.mark_changed()
+                    try:
+                        self.assertEqual(json.loads(card.json_payload), expected)
+                    finally:
+                        card.json_backend = None
+                        card.mark_changed()
+
+    @skipUnless(is_installed("orjson"), "orjson is not installed")
+    def test_settings_backend(self):
+        card = AdaptiveCard(version="1.5")
+        with override_settings(ACTIONABLE_MESSAGES={"JSON_BACKEND": "orjson"}):
+            self.assertEqual(card.json_payload, '{"type":"AdaptiveCard","version":"1.5"}')
+
+
+class CanonicalTestCase(TestCase):
+    def test_normalize(self):
+        class Size(Enum):
+            SMALL = 1.0
+
+        text_block = TextBlock("text", color=Color.ACCENT)
+        data = normalize({"items": [text_block], "width": 2.0, "height": 2.5, "large": 1e300, "size": Size.SMALL})
+        self.assertEqual(data, {
+            "items": [{"type": "TextBlock", "text": "text", "color": "accent"}],
+            "width": 2,
+            "height": 2.5,
+            "large": 1e300,
+            "size": 1.0
+        })
+        self.assertIs(type(data["width"]), int)
+        self.assertIs(data["items"][0]["color"], Color.ACCENT)
+
+    def test_normalize_without_changes(self):
+        data = {"items": [{"type": "TextBlock", "text": "text", "color": Color.ACCENT}], "width": 2.5}
+        self.assertIs(normalize(data), data)
+        changed = {"items": [{"width": 1.0}], "other": [{"text": "text"}]}
+        normalized = normalize(changed)
+        self.assertEqual(normalized, {"items": [{"width": 1}], "other": [{"text": "text"}]})
+        self.assertIsNot(normalized["items"], changed["items"])
+        self.assertIs(normalized["other"], changed["other"])
+        self.assertEqual(changed["items"][0]["width"], 1.0)
+
+    def test_canonical_json(self):
+        card = AdaptiveCard(version="1.5", fallback_text="zażółć")
+        card.add_elements(TextBlock("text", color=Color.ACCENT, max_lines=2.0))
+        self.assertEqual(
+            card.get_payload(fmt="json", canonical=True),
+            '{"body":[{"color":"accent","maxLines":2,"text":"text","type":"TextBlock"}],'
+            '"fallbackText":"zażółć","type":"AdaptiveCard","version":"1.5"}'
+        )
+        self.assertNotEqual(card.json_payload, card.get_payload(fmt="json", canonical=True))
+        self.assertIn(card.get_payload(fmt="json", canonical=True), card.get_payload(fmt="html", canonical=True))
+
+    def test_canonical_key_order(self):
+        card = AdaptiveCard(version="1.5", fallback_text="text")
+        other = AdaptiveCard(fallback_text="text")
+        other.set_version("1.5")
+        self.assertNotEqual(card.json_payload, other.json_payload)
+        self.assertEqual(card.get_payload(fmt="json", canonical=True), other.get_payload(fmt="json", canonical=True))
+
+    def test_canonical_ignores_backend_and_dump_kwargs(self):
+        card = TestAdaptiveCard(version="1.5")
+        card.json_backend = "orjson"
+        self.assertEqual(card.get_payload(fmt="json", canonical=True), '{"type":"AdaptiveCard","version":"1.5"}')
+
+    def test_canonical_setting(self):
+        card = AdaptiveCard(version="1.5")
+        with override_settings(ACTIONABLE_MESSAGES={"CANONICAL_JSON": True}):
+            self.assertEqual(card.json_payload, '{"type":"AdaptiveCard","version":"1.5"}')
+            self.assertEqual(list(render_many([card], fmt="json")), ['{"type":"AdaptiveCard","version":"1.5"}'])
+            self.assertEqual(
+                card.get_payload(fmt="json", canonical=False), '{"type": "AdaptiveCard", "version": "1.5"}'
+            )
+        self.assertEqual(card.json_payload, '{"type": "AdaptiveCard", "version": "1.5"}')
+
+    def test_canonical_render_many(self):
+        cards = [AdaptiveCard(version="1.5", lang_code=lang_code) for lang_code in ("en", "pl")]
+        self.assertEqual(
+            list(render_many(cards, fmt="json", canonical=True)),
+            [card.get_payload(fmt="json", canonical=True) for card in cards]
+        )
+
+    def test_canonical_shared(self):
+        footer = TextBlock("footer", max_lines=1.0, wrap=True).share()
+        card = AdaptiveCard()
+        card.add_elements([footer, footer])
+        self.assertEqual(
+            card.get_payload(fmt="json", canonical=True),
+            '{"body":[{"maxLines":1,"text":"footer","type":"TextBlock","wrap":true},'
+            '{"maxLines":1,"text":"footer","type":"TextBlock","wrap":true}],"type":"AdaptiveCard"}'
+        )
+
+
+class CompactTestCase(TestCase):
+    def test_compact(self):
+        data = {
+            "type": "AdaptiveCard",
+            "body": [
+                {"type": "TextBlock", "text": "text", "size": FontSize.DEFAULT, "wrap": False, "spacing": "default"},
+                {"type": "TextBlock", "text": "text", "size": FontSize.LARGE, "wrap": 0, "isVisible": 1}
+            ],
+            "actions": [],
+            "data": {"wrap": False}
+        }
+        self.assertEqual(compact(data, COMPACT_DEFAULTS), {
+            "type": "AdaptiveCard",
+            "body": [
+                {"type": "TextBlock", "text": "text"},
+                {"type": "TextBlock", "text": "text", "size": FontSize.LARGE, "wrap": 0, "isVisible": 1}
+            ],
+            "data": {"wrap": False}
+        })
+
+    def test_compact_without_changes(self):
+        data = {"type": "AdaptiveCard", "body": [{"type": "TextBlock", "text": "text"}], "other": [{"wrap": False}]}
+        self.assertIs(compact(data, COMPACT_DEFAULTS), data)
+        changed = {"body": [{"type": "TextBlock", "wrap": False}], "other": [{"text": "text"}]}
+        compacted = compact(changed, COMPACT_DEFAULTS)
+        self.assertEqual(compacted, {"body": [{"type": "TextBlock"}], "other": [{"text": "text"}]})
+        self.assertIs(compacted["other"], changed["other"])
+        self.assertEqual(changed["body"][0], {"type": "TextBlock", "wrap": False})
+
+    def test_adaptive_card(self):
+        card = AdaptiveCard(version="1.5", hide_original_body=False)
+        card.add_elements(Container([TextBlock("text", wrap=False, spacing=SpacingStyle.DEFAULT)], separator=False))
+        card.add_actions(Submit(title="Submit", data={"separator": False}))
+        self.assertEqual(card.get_payload(compact=True), {
+            "type": "AdaptiveCard",
+            "version": "1.5",
+            "body": [{"type": "Container", "items": [{"type": "TextBlock", "text": "text"}]}],
+            "actions": [{"type": "Action.Submit", "title": "Submit", "data": {"separator": False}}]
+        })
+        self.assertEqual(json.loads(card.get_payload(fmt="json", compact=True)), card.get_payload(compact=True))
+        self.assertEqual(card.get_payload(frozen=True, compact=True), card.get_payload(compact=True))
+        self.assertIn(card.get_payload(fmt="json", compact=True), card.get_payload(fmt="html", compact=True))
+        self.assertEqual(card.payload["hideOriginalBody"], False)
+
+    def test_adaptive_card_empty_lists(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([])
+        card.add_actions([])
+        self.assertEqual(card.get_payload(fmt="json", compact=True), '{"type": "AdaptiveCard", "version": "1.5"}')
+
+    def test_message_card(self):
+        card = MessageCard(title="title", auto_correlation_id=False, hide_original_body=False)
+        card.add_sections(Section(start_group=False, title="section", facts=[]))
+        card.add_actions([])
+        self.assertEqual(card.get_payload(compact=True), {
+            "@type": "MessageCard",
+            "@context": "https://schema.org/extensions",
+            "title": "title",
+            "sections": [{"title": "section"}]
+        })
+
+    def test_compact_setting(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_actions([])
+        with override_settings(ACTIONABLE_MESSAGES={"COMPACT_PAYLOAD": True}):
+            self.assertEqual(card.payload, {"type": "AdaptiveCard", "version": "1.5"})
+            self.assertEqual(list(render_many([card], fmt="json")), ['{"type": "AdaptiveCard", "version": "1.5"}'])
+            self.assertEqual(card.get_payload(compact=False), {"type": "AdaptiveCard", "version": "1.5", "actions": []})
+        self.assertEqual(card.payload, {"type": "AdaptiveCard", "version": "1.5", "actions": []})
+
+    def test_compact_canonical(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(TextBlock("text", wrap=False))
+        self.assertEqual(
+            card.get_payload(fmt="json", canonical=True, compact=True),
+            '{"body":[{"text":"text","type":"TextBlock"}],"type":"AdaptiveCard","version":"1.5"}'
+        )
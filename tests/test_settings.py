@@ -1,8 +1,10 @@
 from json import JSONEncoder
+from unittest import mock
 
 from django.conf import settings
 from django.test import TestCase, override_settings
 
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
 from django_actionable_messages.encoders import BaseEncoder
 from django_actionable_messages.settings import CardSettings, card_settings
 
@@ -11,6 +13,15 @@ class CustomJSONEncoder(JSONEncoder):
     pass
 
 
+class CustomBaseEncoder(BaseEncoder):
+    def encode(self, o):
+        return "custom"
+
+
+class CustomEncoderAdaptiveCard(AdaptiveCard):
+    json_encoder = "tests.test_settings.CustomBaseEncoder"
+
+
 class SettingsTestCase(TestCase):
     def test_reload_settings(self):
         self.assertEqual(card_settings.JSON_ENCODER, BaseEncoder)
@@ -35,3 +46,26 @@ class SettingsTestCase(TestCase):
     @override_settings(ACTIONABLE_MESSAGES={"JSON_ENCODER": None})
     def test_null_setting(self):
         self.assertIsNone(card_settings.JSON_ENCODER)
+
+    def test_cached_settings(self):
+        card_test_settings = CardSettings()
+        with mock.patch("django_actionable_messages.settings.import_setting",
+                        return_value=CustomJSONEncoder) as import_setting:
+            self.assertEqual(card_test_settings.JSON_ENCODER, CustomJSONEncoder)
+            self.assertEqual(card_test_settings.JSON_ENCODER, CustomJSONEncoder)
+        import_setting.assert_called_once()
+        self.assertIn("JSON_ENCODER", vars(card_test_settings))
+        card_test_settings.reload_user_settings()
+        self.assertNotIn("JSON_ENCODER", vars(card_test_settings))
+        self.assertEqual(card_test_settings.JSON_ENCODER, BaseEncoder)
+
+    def test_card_json_encoder(self):
+        card = AdaptiveCard()
+        self.assertEqual(card.get_json_encoder(), BaseEncoder)
+        self.assertEqual(CustomEncoderAdaptiveCard().get_json_encoder(), CustomBaseEncoder)
+        self.assertEqual(CustomEncoderAdaptiveCard().json_payload, "custom")
+        self.assertEqual(card.json_payload, '{"type": "AdaptiveCard"}')
+        with override_settings(ACTIONABLE_MESSAGES={"JSON_ENCODER": "tests.test_settings.CustomBaseEncoder"}):
+            self.assertEqual(card.get_json_encoder(), CustomBaseEncoder)
+            self.assertEqual(card.json_payload, "custom")
+        self.assertEqual(card.json_payload, '{"type": "AdaptiveCard"}')
@@ -0,0 +1,98 @@
+import copy
+import json
+import pickle
+
+from django.test import TestCase
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages.adaptive_card.actions import OpenUrl
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import ActionSet, Column, ColumnSet
+from django_actionable_messages.adaptive_card.elements import Image, TextBlock
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.serializers import BACKENDS, STDLIB_BACKEND
+from django_actionable_messages.shared import SharedData, SharedList
+
+URL = "https://www.example.com/"
+
+
+def get_footer():
+    return Column([Image(URL), TextBlock(_("Footer"))])
+
+
+class SharedTestCase(TestCase):
+    def test_share(self):
+        footer = get_footer()
+        self.assertFalse(footer.is_shared)
+        self.assertIs(footer.share(), footer)
+        self.assertTrue(footer.is_shared)
+        data = footer.as_data()
+        self.assertIsInstance(data, SharedData)
+        self.assertIsInstance(data["items"], SharedList)
+        self.assertDictEqual(data, {
+            "type": "Column",
+            "items": [
+                {"type": "Image", "url": URL},
+                {"type": "TextBlock", "text": _("Footer")}
+            ]
+        })
+        self.assertIs(footer.share().as_data(), data)
+
+    def test_immutable(self):
+        footer = get_footer().share()
+        with self.assertRaises(CardException):
+            footer.add_items(TextBlock("text"))
+        with self.assertRaises(CardException):
+            footer.set_width(1)
+        with self.assertRaises(CardException):
+            footer.as_data()["items"][0]["url"] = "url"
+        with self.assertRaises(CardException):
+            footer.as_data()["items"].append({})
+
+    def test_referenced(self):
+        footer = get_footer().share()
+        column_set = ColumnSet([footer, footer])
+        self.assertIs(column_set.as_data()["columns"][0], footer)
+        self.assertIs(column_set.as_data()["columns"][1], footer)
+
+    def test_payload(self):
+        footer = get_footer().share()
+        card = AdaptiveCard()
+        card.add_elements([ColumnSet([footer]), ActionSet([OpenUrl(URL)]), ColumnSet([footer])])
+        payload = card.payload
+        self.assertEqual(payload["body"][0]["columns"][0], payload["body"][2]["columns"][0])
+        self.assertIsNot(payload["body"][0]["columns"][0], payload["body"][2]["columns"][0])
+        self.assertNotIsInstance(payload["body"][0]["columns"][0], SharedData)
+        self.assertEqual(card.frozen_payload, payload)
+        self.assertEqual(copy.deepcopy(card.payload), payload)
+        self.assertEqual(pickle.loads(pickle.dumps(card)).payload, payload)
+
+    def test_json_payload(self):
+        footer = get_footer().share()
+        for backend in (STDLIB_BACKEND, *BACKENDS):
+            card = AdaptiveCard()
+            card.json_backend = backend
+            card.add_elements([ColumnSet([footer, Column([ColumnSet([footer])])]), ColumnSet([footer])])
+            self.assertEqual(json.loads(card.json_payload), card.payload)
+
+    def test_encoded_once(self):
+        footer = get_footer().share()
+        cards = [AdaptiveCard(), AdaptiveCard(), AdaptiveCard(lang_code="de")]
+        for card in cards:
+            card.add_elements(ColumnSet([footer]))
+            card.json_payload
+        encoded = footer.as_data().encoded
+        self.assertEqual(len(encoded), 2)
+        self.assertIn('"text": "Footer"', list(encoded.values())[0])
+
+    def test_dump_kwargs(self):
+        class Card(AdaptiveCard):
+            def get_json_dump_kwargs(self):
+                return {"indent": 2}
+
+        footer = get_footer().share()
+        card = Card()
+        card.add_elements(ColumnSet([footer]))
+        self.assertEqual(json.loads(card.json_payload), card.payload)
+        self.assertEqual(footer.as_data().encoded, {})
+        self.assertEqual(json.loads("".join(card.iter_json())), card.payload)
@@ -0,0 +1,129 @@
+import base64
+import json
+import os
+import tempfile
+from unittest import skipUnless
+
+from django.test import TestCase, override_settings
+
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.signing import load_private_key, sign, sign_many
+from tests.test_serializers import is_installed
+
+SENDER = "service@example.com"
+ORIGINATOR = "c9b0f2b8-7b43-4c0a-9a8f-3a5f7e8b2f11"
+
+
+def b64decode(value):
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+@skipUnless(is_installed("cryptography"), "cryptography is not installed")
+class SigningTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        cls.public_key = private_key.public_key()
+        cls.pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        cls.encrypted_pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+            serialization.BestAvailableEncryption(b"secret")
+        )
+
+    def get_card(self, text="text"):
+        card = AdaptiveCard(version="1.0")
+        card.add_elements(TextBlock(text))
+        card.signing_recipients = ["john@example.com"]
+        return card
+
+    def verify(self, token):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        header, claims, signature = token.split(".")
+        self.public_key.verify(
+            b64decode(signature), f"{header}.{claims}".encode(), padding.PKCS1v15(), hashes.SHA256()
+        )
+        self.assertEqual(json.loads(b64decode(header)), {"alg": "RS256", "typ": "JWT"})
+        return json.loads(b64decode(claims))
+
+    def test_signed_payload(self):
+        card = self.get_card()
+        with override_settings(ACTIONABLE_MESSAGES={
+            "SIGNING_KEY": self.pem, "SIGNING_SENDER": SENDER, "SIGNING_ORIGINATOR": ORIGINATOR
+        }):
+            claims = self.verify(card.get_signed_payload())
+            signed_html = card.signed_html_payload
+        self.assertEqual(claims["sender"], SENDER)
+        self.assertEqual(claims["originator"], ORIGINATOR)
+        self.assertEqual(json.loads(claims["recipientsSerialized"]), ["john@example.com"])
+        self.assertEqual(claims["adaptiveCardSerialized"], card.json_payload)
+        self.assertIsInstance(claims["iat"], int)
+        self.assertIn("http://schema.org/SignedAdaptiveCard", signed_html)
+
+    def test_message_card(self):
+        card = MessageCard(title="title", originator=ORIGINATOR)
+        card.signing_key = self.pem
+        card.signing_sender = SENDER
+        claims = self.verify(card.get_signed_payload())
+        self.assertEqual(claims["originator"], ORIGINATOR)
+        self.assertEqual(claims["messageCardSerialized"], card.json_payload)
+        self.assertEqual(claims["recipientsSerialized"], "[]")
+
+    def test_missing_claims(self):
+        card = self.get_card()
+        card.signing_key = self.pem
+        with self.assertRaises(CardException):
+            card.get_signed_payload()
+
+    def test_key_loaded_once(self):
+        load_private_key.cache_clear()
+        for _ in range(3):
+            self.verify(sign({"sub": "test"}, self.pem))
+        self.assertEqual(load_private_key.cache_info().misses, 1)
+
+    def test_key_file(self):
+        with tempfile.NamedTemporaryFile(suffix=".pem", delete=False) as f:
+            f.write(self.encrypted_pem)
+        try:
+            self.assertEqual(self.verify(sign({"sub": "test"}, f.name, "secret")), {"sub": "test"})
+        finally:
+            os.unlink(f.name)
+
+    def test_sign_many(self):
+        cards = [self.get_card(f"text {i}") for i in range(10)]
+        for card in cards:
+            card.signing_key, card.signing_sender, card.signing_originator = self.pem, SENDER, ORIGINATOR
+        for processes in (1, 2):
+            tokens = list(sign_many(cards, processes=processes, chunk_size=3))
+            self.assertEqual(len(tokens), 10)
+            for card, token in zip(cards, tokens):
+                self.assertEqual(self.verify(token)["adaptiveCardSerialized"], card.json_payload)
+        signed_html = list(sign_many(cards[:2], html=True, processes=1))
+        self.assertIn("http://schema.org/SignedAdaptiveCard", signed_html[0])
+        self.assertEqual(list(sign_many([])), [])
+        cards[1].signing_recipients = ["b@example.com"]
+        tokens = list(sign_many(cards[:2], processes=1, recipients=[["a@example.com"], None]))
+        self.assertEqual([json.loads(self.verify(token)["recipientsSerialized"]) for token in tokens],
+                         [["a@example.com"], ["b@example.com"]])
+        with self.assertRaisesMessage(ValueError, "Number of recipients (1) doesn't match number of cards (2)"):
+            list(sign_many(cards[:2], processes=1, recipients=[None]))
+
+    def test_sign_many_loaded_key(self):
+        cards = [self.get_card(f"text {i}") for i in range(3)]
+        for card in cards:
+            card.signing_key, card.signing_sender, card.signing_originator = (
+                load_private_key(self.encrypted_pem, "secret"), SENDER, ORIGINATOR
+            )
+        tokens = list(sign_many(cards, processes=2))
+        for card, token in zip(cards, tokens):
+            self.assertEqual(self.verify(token)["adaptiveCardSerialized"], card.json_payload)
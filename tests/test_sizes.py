@@ -0,0 +1,142 @@
+import copy
+import pickle
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from django_actionable_messages import sizes
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Container, Fact, FactSet, Table, TableCell, TableRow
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.encoders import BaseEncoder
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.message_card.elements import Fact as MessageFact
+from django_actionable_messages.message_card.sections import Section
+
+
+def get_row(i):
+    return TableRow([TableCell([TextBlock(f"Row {i}")]), TableCell([TextBlock(_("Description"))])])
+
+
+class EstimatedSizeTestCase(TestCase):
+    def assertEstimated(self, card):
+        self.assertEqual(card.estimated_size, len(card.json_payload))
+
+    def test_estimated_size(self):
+        card = AdaptiveCard(version="1.5")
+        self.assertEstimated(card)
+        card.add_elements(TextBlock("text"))
+        self.assertEstimated(card)
+        card.add_elements([TextBlock("zażółć"), FactSet([Fact("title", "value")])])
+        card.add_actions([])
+        self.assertEstimated(card)
+
+    def test_language(self):
+        with translation.override("de"):
+            card = AdaptiveCard(version="1.5", lang_code="pl")
+            container = Container([TextBlock(_("Yes"))], lang_code="en")
+            container.estimated_size
+            card.add_elements(container)
+            self.assertEstimated(card)
+            container.add_items(TextBlock(_("No")))
+            self.assertEstimated(card)
+            self.assertEqual(container.estimated_size, len(BaseEncoder(lang_code="pl").encode(container.as_data())))
+
+    def test_nested(self):
+        table = Table(columns=[{"width": 1}, {"width": 2}])
+        container = Container([table])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([TextBlock("Report"), container])
+        self.assertEstimated(card)
+        for i in range(10):
+            table.add_rows(get_row(i))
+            self.assertEstimated(card)
+            self.assertEqual(table.estimated_size, len(BaseEncoder().encode(card.payload["body"][1]["items"][0])))
+        container.add_items(TextBlock("Footer"))
+        self.assertEstimated(card)
+
+    def test_incremental(self):
+        table = Table(rows=[get_row(0)])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(table)
+        card.estimated_size
+        with mock.patch.object(sizes, "measure", wraps=sizes.measure) as measure:
+            table.add_rows(get_row(1))
+            card.estimated_size
+        # only the added row is encoded
+        self.assertEqual(measure.call_count, 1)
+        self.assertEqual(len(measure.call_args.args[1]), 1)
+        self.assertEstimated(card)
+
+    def test_set_invalidates(self):
+        block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(block)
+        card.estimated_size
+        block.set_wrap(True)
+        self.assertIsNone(sizes.get_known_size(card))
+        self.assertEstimated(card)
+        card.set_version("1.6")
+        self.assertEstimated(card)
+
+    def test_added_twice(self):
+        fact_set = FactSet([Fact("name", "value")])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([fact_set, fact_set])
+        card.estimated_size
+        fact_set.add_facts(Fact("title", "value"))
+        self.assertEstimated(card)
+
+    def test_message_card(self):
+        section = Section(title="section")
+        card = MessageCard(title="title")
+        card.add_sections(section)
+        self.assertEstimated(card)
+        section.add_facts([MessageFact("name", "value"), MessageFact("other", "value")])
+        self.assertEstimated(card)
+        card.add_actions([])
+        self.assertEstimated(card)
+
+    def test_fill(self):
+        table = Table(rows=[get_row(0)])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(table)
+        i = 1
+        while card.estimated_size + table.estimated_size // i < 2000:
+            table.add_rows(get_row(i))
+            i += 1
+        self.assertLess(len(card.json_payload), 2000)
+        self.assertEstimated(card)
+
+    def test_copy(self):
+        block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(block)
+        card.estimated_size
+        for other in (copy.copy(block), copy.deepcopy(block), pickle.loads(pickle.dumps(block))):
+            self.assertIsNone(sizes.get_parent(other))
+            self.assertEqual(other.estimated_size, len('{"type": "TextBlock", "text": "text"}'))
+        other_card = pickle.loads(pickle.dumps(card))
+        self.assertEqual(other_card.estimated_size, card.estimated_size)
+        for part in card.split(1000):
+            self.assertEstimated(part)
+
+    def test_several_cards(self):
+        block = TextBlock("text")
+        cards = [AdaptiveCard(version="1.5"), AdaptiveCard(version="1.6")]
+        for card in cards:
+            card.add_elements([block, FactSet([Fact("name", "value")])])
+            card.estimated_size
+        self.assertIs(sizes.get_parent(block), sizes.MANY)
+        block.set_wrap(True)
+        for card in cards:
+            self.assertEstimated(card)
+
+    def test_shared(self):
+        block = TextBlock("text").share()
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(block)
+        self.assertIsNone(sizes.get_parent(block))
+        self.assertEstimated(card)
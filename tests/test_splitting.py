@@ -0,0 +1,126 @@
+import json
+
+from django.test import TestCase
+
+from django_actionable_messages.adaptive_card.actions import Submit
+from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Fact, FactSet, Table, TableCell, TableRow
+from django_actionable_messages.adaptive_card.elements import TextBlock
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.message_card.cards import MessageCard
+from django_actionable_messages.message_card.sections import Section
+
+
+def get_card(count=20):
+    card = AdaptiveCard(version="1.5")
+    card.add_elements([FactSet([Fact(f"Title {i}", "Value " * 10)]) for i in range(count)])
+    return card
+
+
+class SplittingTestCase(TestCase):
+    def test_size(self):
+        card = get_card()
+        self.assertEqual(card.get_size(), len(card.json_payload))
+        self.assertEqual(card.get_size(canonical=True), len(card.get_payload(fmt="json", canonical=True)))
+        text_card = AdaptiveCard(fallback_text="zażółć")
+        text_card.json_backend = "orjson"
+        self.assertEqual(text_card.get_size(), len(text_card.json_payload.encode()))
+
+    def test_split(self):
+        card = get_card()
+        header, footer = TextBlock("Report"), [TextBlock("Footer"), TextBlock("Page")]
+        cards = card.split(1000, header=header, footer=footer)
+        self.assertGreater(len(cards), 1)
+        body = []
+        for part in cards:
+            self.assertLessEqual(part.get_size(), 1000)
+            self.assertEqual(part.payload["version"], "1.5")
+            self.assertEqual(part.payload["body"][0], header.as_data())
+            self.assertEqual(part.payload["body"][-2:], [item.as_data() for item in footer])
+            body.extend(part.payload["body"][1:-2])
+        self.assertEqual(body, card.payload["body"])
+        self.assertEqual(len(card.payload["body"]), 20)
+
+    def test_split_tight(self):
+        card = get_card(5)
+        size = card.get_size()
+        self.assertEqual(len(card.split(size)), 1)
+        self.assertEqual(len(card.split(size - 1)), 2)
+        for canonical in (False, True):
+            for compact in (False, True):
+                for max_size in (300, 500, 700):
+                    for part in card.split(max_size, canonical=canonical, compact=compact):
+                        self.assertLessEqual(part.get_size(canonical=canonical, compact=compact), max_size)
+
+    def test_split_empty(self):
+        card = AdaptiveCard(version="1.5")
+        cards = card.split(1000, header=TextBlock("Report"))
+        self.assertEqual(len(cards), 1)
+        self.assertEqual(cards[0].payload["body"], [{"type": "TextBlock", "text": "Report"}])
+
+    def test_split_table(self):
+        table = Table(rows=[TableRow([TableCell([TextBlock("Name")])])])
+        table.add_rows([TableRow([TableCell([TextBlock(f"Row {i} " * 5)])]) for i in range(30)])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([TextBlock("Before"), table])
+        cards = card.split(1500)
+        table_rows = card.payload["body"][-1]["rows"]
+        rows = []
+        for part in cards:
+            self.assertLessEqual(part.get_size(), 1500)
+            part_table = part.payload["body"][-1]
+            self.assertEqual(part_table["type"], "Table")
+            self.assertEqual(part_table["rows"][0], table_rows[0])
+            rows.extend(part_table["rows"][1:])
+        self.assertEqual(rows, table_rows[1:])
+
+    def test_too_large(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(TextBlock("text " * 100))
+        with self.assertRaises(CardException):
+            card.split(200)
+
+    def test_message_card(self):
+        card = MessageCard(title="Report", auto_correlation_id=False)
+        card.add_sections([Section(title=f"Section {i}", text="text " * 20) for i in range(10)])
+        cards = card.split(600, footer=Section(text="Footer"))
+        self.assertGreater(len(cards), 1)
+        sections = []
+        for part in cards:
+            self.assertLessEqual(part.get_size(), 600)
+            self.assertEqual(json.loads(part.json_payload)["title"], "Report")
+            self.assertEqual(part.payload["sections"][-1], {"text": "Footer"})
+            sections.extend(part.payload["sections"][:-1])
+        self.assertEqual(sections, card.payload["sections"])
+
+    def test_split_parts_independent(self):
+        text_block = TextBlock("text")
+        card = get_card()
+        card.add_elements(text_block)
+        card.add_actions(Submit(title="Send"))
+        cards = card.split(1000)
+        self.assertGreater(len(cards), 1)
+        payloads = [part.json_payload for part in cards]
+        payload = card.json_payload
+        cards[0].add_actions(Submit(title="Cancel"))
+        cards[0].add_elements(TextBlock("added"))
+        self.assertEqual(card.json_payload, payload)
+        self.assertEqual([part.json_payload for part in cards[1:]], payloads[1:])
+        self.assertEqual(len(cards[0].payload["actions"]), 2)
+        text_block.set_wrap()
+        self.assertIn('"wrap": true', card.json_payload)
+        self.assertIn('"wrap": true', cards[-1].json_payload)
+
+    def test_message_card_correlation_id(self):
+        card = MessageCard(title="Report")
+        card.add_sections([Section(title=f"Section {i}", text="text " * 20) for i in range(10)])
+        cards = card.split(600)
+        correlation_ids = {part.payload["correlationId"] for part in cards}
+        self.assertEqual(len(correlation_ids), len(cards))
+        self.assertNotIn(card.payload["correlationId"], correlation_ids)
+
+    def test_size_cached(self):
+        card = get_card(1)
+        size = card.get_size()
+        card.add_elements(TextBlock("text"))
+        self.assertGreater(card.get_size(), size)
@@ -1,9 +1,24 @@
+import hashlib
+import io
+from unittest import mock
+
 from django.conf import settings
-from django.test import TestCase
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
 
 from django_actionable_messages.adaptive_card.cards import AdaptiveCard
+from django_actionable_messages.adaptive_card.containers import Column, ColumnSet, Container
+from django_actionable_messages.adaptive_card.elements import Image, TextBlock
+from django_actionable_messages.adaptive_card.utils import FontWeight
+from django_actionable_messages.exceptions import CardException
+from django_actionable_messages.frozen import FrozenDict
 from django_actionable_messages.message_card.cards import MessageCard
-from django_actionable_messages.mixins import BaseMixin
+from django_actionable_messages.mixins import BaseMixin, materialize, render_many
+from django_actionable_messages.message_card.actions import OpenUri
+from django_actionable_messages.message_card.elements import ActionTarget
+from django_actionable_messages.message_card.utils import OSType
 
 
 class TestTrans(BaseMixin):
@@ -31,9 +46,10 @@ class UtilsTestCase(TestCase):
         self.assertEqual(TestTrans().get_language_code(), settings.LANGUAGE_CODE)
 
     def test_get_signed_payload(self):
-        with self.assertRaises(NotImplementedError):
+        # signing key is not configured
+        with self.assertRaises(ImproperlyConfigured):
             AdaptiveCard().get_signed_payload()
-        with self.assertRaises(NotImplementedError):
+        with self.assertRaises(ImproperlyConfigured):
             MessageCard().get_signed_payload()
 
     def test_signed_html_payload(self):
@@ -50,3 +66,231 @@ class UtilsTestCase(TestCase):
             'indent': 2,
             'allow_nan': False
         })
+
+    def test_get_payload_copy(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(TextBlock("text"))
+        payload = card.payload
+        payload["body"].clear()
+        self.assertEqual(len(card.payload["body"]), 1)
+
+    def test_frozen_payload(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(TextBlock("text"))
+        self.assertIsInstance(card.frozen_payload, FrozenDict)
+        self.assertEqual(card.frozen_payload, card.payload)
+        self.assertEqual(card.get_payload(frozen=True)["body"][0]["text"], "text")
+        with self.assertRaises(TypeError):
+            card.frozen_payload["version"] = "1.0"
+
+    def test_rendered_payload_cache(self):
+        text_block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(text_block)
+        json_payload = card.json_payload
+        self.assertIs(card.json_payload, json_payload)
+        html_payload = card.html_payload
+        self.assertIs(card.html_payload, html_payload)
+        card.set_lang("en")
+        self.assertIsNot(card.json_payload, json_payload)
+        self.assertIn('"lang": "en"', card.json_payload)
+        json_payload = card.json_payload
+        text_block.set_wrap()
+        self.assertIn('"wrap": true', card.json_payload)
+        self.assertIn('"wrap": true', card.html_payload)
+        json_payload = card.json_payload
+        card.mark_changed()
+        self.assertIsNot(card.json_payload, json_payload)
+        self.assertEqual(card.json_payload, json_payload)
+
+    def test_rendered_payload_cache_per_card(self):
+        text_block = TextBlock("text")
+        container = Container(items=[text_block])
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(container)
+        other = AdaptiveCard(version="1.5")
+        json_payload = card.json_payload
+        other.add_elements(TextBlock("other"))
+        TextBlock("new").set_wrap()
+        self.assertIs(card.json_payload, json_payload)
+        text_block.set_wrap()
+        self.assertIsNot(card.json_payload, json_payload)
+        self.assertIn('"wrap": true', card.json_payload)
+
+    def test_rendered_payload_cache_shared_element(self):
+        text_block = TextBlock("text")
+        card1, card2 = AdaptiveCard(version="1.5"), AdaptiveCard(version="1.5")
+        card1.add_elements(text_block)
+        card2.add_elements(text_block)
+        payloads = card1.json_payload, card2.json_payload
+        text_block.set_wrap()
+        for card, json_payload in zip((card1, card2), payloads):
+            self.assertIsNot(card.json_payload, json_payload)
+            self.assertIn('"wrap": true', card.json_payload)
+
+    def test_rendered_payload_language(self):
+        card = AdaptiveCard(version="1.5")
+        json_payload = card.json_payload
+        card.language_code = "pl"
+        self.assertIsNot(card.json_payload, json_payload)
+
+    def test_render_many(self):
+        cards = [AdaptiveCard(fallback_text=str(i), lang_code=("pl", "en")[i % 2]) for i in range(7)]
+        cards.append(TestMessageCard(auto_correlation_id=False))
+        expected = [card.json_payload for card in cards]
+        for card in cards:
+            card.mark_changed()
+        self.assertListEqual(list(render_many(iter(cards), fmt="json", chunk_size=3)), expected)
+        self.assertListEqual(list(render_many(cards, fmt="html")), [card.html_payload for card in cards])
+        self.assertListEqual(list(render_many(cards)), [card.payload for card in cards])
+        self.assertListEqual(list(render_many([])), [])
+
+    def test_render_many_is_lazy(self):
+        def generate():
+            for i in range(5):
+                yield AdaptiveCard(fallback_text=str(i))
+            raise AssertionError("should not be reached")
+
+        results = render_many(generate(), fmt="json", chunk_size=2)
+        self.assertIn('"fallbackText": "0"', next(results))
+        self.assertIn('"fallbackText": "1"', next(results))
+
+    def test_render_many_language(self):
+        cards = [AdaptiveCard(fallback_text=_("test string"), lang_code=("pl", "en")[i % 2]) for i in range(10)]
+        with translation.override("de"):
+            with mock.patch("django_actionable_messages.encoders.translation.activate",
+                            wraps=translation.activate) as activate:
+                list(render_many(cards, fmt="json"))
+            self.assertEqual(translation.get_language(), "de")
+        # activate + restore for each of two languages
+        self.assertEqual(activate.call_count, 4)
+
+    def test_iter_json(self):
+        card = TestAdaptiveCard(version="1.5", fallback_text=_("test string"))
+        card.add_elements([TextBlock(str(i)) for i in range(100)])
+        chunks = list(card.iter_json(chunk_size=100))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) >= 100 for chunk in chunks[:-1]))
+        self.assertEqual("".join(chunks), card.json_payload)
+        card = AdaptiveCard(version="1.5", fallback_text=_("test string"))
+        card.add_elements([TextBlock(str(i)) for i in range(100)])
+        self.assertEqual("".join(card.iter_json()), card.json_payload)
+
+    def test_iter_json_language(self):
+        card = AdaptiveCard(fallback_text=_("test string"), lang_code="pl")
+        card.add_elements([TextBlock(_("test string")) for i in range(100)])
+        with translation.override("de"):
+            for chunk in card.iter_json(chunk_size=10):
+                self.assertEqual(translation.get_language(), "de")
+
+    def test_write_json(self):
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([TextBlock(str(i)) for i in range(100)])
+        fp = io.StringIO()
+        card.write_json(fp, chunk_size=64)
+        self.assertEqual(fp.getvalue(), card.json_payload)
+
+    def _build_lazy_card(self):
+        text_block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([
+            Container(items=[text_block]),
+            ColumnSet(columns=[Column(items=[Image("https://www.example.com/image.png")])])
+        ])
+        return card, text_block
+
+    def test_lazy_elements(self):
+        card, text_block = self._build_lazy_card()
+        expected_payload, expected_json = card.payload, card.json_payload
+        with override_settings(ACTIONABLE_MESSAGES={"LAZY_ELEMENTS": True}):
+            card, text_block = self._build_lazy_card()
+            self.assertIsInstance(card._payload["body"][0], Container)
+            self.assertIs(card._payload["body"][0].as_data()["items"][0], text_block)
+            self.assertDictEqual(card.payload, expected_payload)
+            self.assertEqual(card.frozen_payload, expected_payload)
+            self.assertEqual(card.json_payload, expected_json)
+            text_block.set_wrap()
+            self.assertTrue(card.payload["body"][0]["items"][0]["wrap"])
+            self.assertIn('"wrap": true', card.json_payload)
+
+    @override_settings(ACTIONABLE_MESSAGES={"LAZY_ELEMENTS": True})
+    def test_lazy_elements_checks(self):
+        action = OpenUri("name", targets=[ActionTarget(OSType.WINDOWS, "https://www.example.com/")])
+        with self.assertRaises(CardException):
+            action.add_target(ActionTarget(OSType.WINDOWS, "https://www.example.com/"))
+
+    def test_materialize(self):
+        text_block = TextBlock("text")
+        data = {"items": [text_block, {"value": [1, 2]}]}
+        materialized = materialize(data)
+        self.assertDictEqual(materialized, {"items": [{"type": "TextBlock", "text": "text"}, {"value": [1, 2]}]})
+        self.assertIsNot(materialized["items"][0], text_block.as_data())
+        self.assertIsNot(materialized["items"][1]["value"], data["items"][1]["value"])
+
+    def test_fingerprint(self):
+        card = AdaptiveCard(version="1.5", fallback_text="text")
+        card.add_elements(TextBlock("text", wrap=True, weight=FontWeight.BOLDER))
+        fingerprint = card.fingerprint()
+        self.assertEqual(len(fingerprint), 64)
+        self.assertIs(card.fingerprint(), fingerprint)
+        # key order doesn't matter
+        other = AdaptiveCard(fallback_text="text")
+        other.add_elements(TextBlock("text", weight=FontWeight.BOLDER, wrap=True))
+        other.set_version("1.5")
+        self.assertEqual(other.fingerprint(), fingerprint)
+        other.set_lang("en")
+        self.assertNotEqual(other.fingerprint(), fingerprint)
+
+    def test_fingerprint_changes(self):
+        text_block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(ColumnSet([Column([text_block])]))
+        fingerprint = card.fingerprint()
+        text_block.set_wrap()
+        self.assertNotEqual(card.fingerprint(), fingerprint)
+
+    def test_fingerprint_incremental(self):
+        text_block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements([TextBlock(f"text {index}") for index in range(10)])
+        card.add_elements(ColumnSet([Column([text_block])]))
+        card.fingerprint()
+        text_block.set_wrap()
+        with mock.patch("django_actionable_messages.mixins.hashlib.sha256", wraps=hashlib.sha256) as sha256:
+            fingerprint = card.fingerprint()
+        # column, column set and card (text block is hashed with column)
+        self.assertEqual(sha256.call_count, 3)
+        other = AdaptiveCard(version="1.5")
+        other.add_elements([TextBlock(f"text {index}") for index in range(10)])
+        other.add_elements(ColumnSet([Column([TextBlock("text", wrap=True)])]))
+        self.assertEqual(other.fingerprint(), fingerprint)
+
+    def test_fingerprint_mark_changed(self):
+        text_block = TextBlock("text")
+        card = AdaptiveCard(version="1.5")
+        card.add_elements(ColumnSet([Column([text_block])]))
+        fingerprint = card.fingerprint()
+        # changed without set_*/add_*
+        text_block.as_data()["text"] = "other"
+        card.mark_changed()
+        self.assertNotEqual(card.fingerprint(), fingerprint)
+
+    def test_fingerprint_volatile_fields(self):
+        self.assertNotEqual(MessageCard(title="title").payload, MessageCard(title="title").payload)
+        self.assertEqual(MessageCard(title="title").fingerprint(), MessageCard(title="title").fingerprint())
+        self.assertNotEqual(MessageCard(title="title").fingerprint(), MessageCard(title="other").fingerprint())
+
+    def test_fingerprint_language(self):
+        card = AdaptiveCard(fallback_text=_("Hello"), lang_code="en")
+        other = AdaptiveCard(fallback_text=_("Hello"), lang_code="en")
+        self.assertEqual(card.fingerprint(), other.fingerprint())
+        with translation.override("pl"):
+            self.assertEqual(card.fingerprint(), other.fingerprint())
+
+    def test_fingerprint_shared(self):
+        footer = Column([Image("https://www.example.com/"), TextBlock("text", wrap=True)]).share()
+        card = AdaptiveCard()
+        card.add_elements(ColumnSet([footer]))
+        other = AdaptiveCard()
+        other.add_elements(ColumnSet([Column([Image("https://www.example.com/"), TextBlock("text", wrap=True)])]))
+        self.assertEqual(card.fingerprint(), other.fingerprint())